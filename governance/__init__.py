@@ -0,0 +1 @@
+"""Analysis engines behind the Governance Mapping Tool pages."""
@@ -0,0 +1,43 @@
+"""Normalised body <-> value-chain activity table"""
+import pandas as pd
+
+from governance.schema import categorical
+
+ACTIVITY_COLUMNS = ['Body_ID', 'Body', 'Activity', 'Level', 'Efficiency', 'Value', 'RAG_Status']
+
+
+def explode_activities(df):
+    """Return one row per (body, activity) from the comma-separated activities column"""
+    activities = (
+        df['Value_Chain_Activities'].astype('object').fillna('')
+        .str.split(',').explode().str.strip()
+    )
+    activities = activities[activities != '']
+    rows = df.loc[activities.index]
+    return pd.DataFrame({
+        'Body_ID': activities.index.to_numpy(),
+        'Body': rows['Name'].array,
+        'Activity': activities.to_numpy(dtype=object),
+        'Level': rows['Level'].array,
+        'Efficiency': rows['Efficiency_Score'].array,
+        'Value': rows['Value_Added'].array,
+        'RAG_Status': rows['RAG_Status'].array,
+    }, columns=ACTIVITY_COLUMNS)
+
+
+def patch_activities(table, body_id, body=None):
+    """Return ``table`` with one body's rows replaced (or removed when ``body`` is None)
+
+    Only the affected body's activities are re-split; every other row is
+    carried over as-is.
+    """
+    kept = table[table['Body_ID'] != body_id]
+    if body is None:
+        return kept
+    new_rows = explode_activities(pd.DataFrame([body], index=[body_id]))
+    patched = pd.concat([kept, new_rows], ignore_index=True)
+    # Keep the categorical columns typed when the new rows arrive as plain strings
+    return patched.assign(
+        Level=categorical(patched['Level'], 'Level'),
+        RAG_Status=categorical(patched['RAG_Status'], 'RAG_Status'),
+    )
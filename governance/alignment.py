@@ -0,0 +1,44 @@
+"""Multi-hot Fairer Westminster principle membership"""
+import pandas as pd
+
+from governance.metrics import dataset_hash, derived_cache
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+
+ALIGNMENT_COLUMN = 'Fairer_Westminster_Alignment'
+
+
+def principle_matrix(df, principles=None):
+    """Return a boolean body x principle membership matrix
+
+    Alignment strings are split on commas and matched as whole principle
+    names, so one principle can never match inside another.
+    """
+    principles = list(principles or FAIRER_WESTMINSTER_PRINCIPLES)
+    tokens = df[ALIGNMENT_COLUMN].astype('object').fillna('').str.split(',').explode().str.strip()
+    tokens = tokens[tokens.isin(principles)]
+    membership = pd.crosstab(tokens.index, tokens).astype(bool)
+    membership = membership.reindex(index=df.index, columns=principles, fill_value=False)
+    return membership.rename_axis(index=None, columns=None)
+
+
+def get_principle_matrix(df, version=None):
+    """Return the membership matrix for ``df``, memoized by its version hash"""
+    return derived_cache.get(('principles', version or dataset_hash(df)), lambda: principle_matrix(df))
+
+
+def principle_counts(matrix):
+    """Number of bodies aligned with each principle"""
+    return matrix.sum().astype(int)
+
+
+def principle_means(matrix, values):
+    """Mean of ``values`` over the bodies aligned with each principle (NaN where none)"""
+    counts = matrix.sum()
+    totals = matrix.T.astype(float).dot(values.astype(float))
+    return totals / counts.where(counts > 0)
+
+
+def co_occurrence(matrix):
+    """Principle x principle counts of bodies aligned with both"""
+    as_int = matrix.astype(int)
+    return as_int.T.dot(as_int)
@@ -0,0 +1,38 @@
+"""Server-side sorting and paging for the governance bodies browser"""
+import math
+
+import numpy as np
+
+from governance.metrics import dataset_hash, derived_cache
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+def sort_order(df, column, ascending=True, version=None):
+    """Row positions of ``df`` sorted by ``column``, memoized per dataset version
+
+    Sorting is stable, categoricals sort in their category order and missing
+    values go last in either direction.
+    """
+    def compute():
+        values = df[column].reset_index(drop=True)
+        return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+    return derived_cache.get(('sort_order', column, ascending, version or dataset_hash(df)), compute)
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def browse(df, mask, sort_by, ascending=True, page=1, page_size=25, version=None):
+    """Return (rows on ``page``, number of matching rows) for the filtered, sorted ``df``
+
+    ``mask`` is a boolean array or Series aligned with ``df`` (``None`` keeps
+    every row). Only the requested page is sliced out of the frame.
+    """
+    order = sort_order(df, sort_by, ascending, version)
+    if mask is not None:
+        order = order[np.asarray(mask, dtype=bool)[order]]
+    start = (page - 1) * page_size
+    return df.iloc[order[start:start + page_size]], len(order)
@@ -0,0 +1,125 @@
+"""Annual governance overhead and savings estimates for every body
+
+The register does not record meeting logistics, so the model derives them
+from fields it does hold: attendees from the primary stakeholder groups,
+meeting cadence and attendee salary band from the body's level, and meeting
+length from its cost impact. Every step is a column operation, so the whole
+register is costed in one pass.
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+
+from governance.metrics import dataset_hash, derived_cache
+from governance.schema import ordinal
+
+DEFAULT_COST_MODEL = {
+    # Average attendee salary by level (£ a year)
+    'salary_bands': {'Strategic': 95000, 'Tactical': 70000, 'Operational': 50000, 'Community': 40000},
+    'on_cost': 0.30,                    # employer pension and National Insurance
+    'working_hours': 1650,              # paid hours a year
+    'meetings_per_year': {'Strategic': 12, 'Tactical': 12, 'Operational': 24, 'Community': 6},
+    'meeting_hours': {'Low': 1.5, 'Medium': 2.0, 'High': 2.5, 'Very High': 3.0},
+    'members_per_stakeholder': 3,       # attendees per listed primary stakeholder group
+    'min_members': 4,
+    'preparation': 1.0,                 # preparation hours per meeting hour
+    'secretariat_hours': 6,             # officer hours per meeting for papers and minutes
+    'secretariat_rate': 35,             # £ an hour
+    # Share of the overhead saved by each recommendation; a merged body's
+    # remaining share is the agenda time that moves to the receiving body
+    'recommendation_savings': {'Keep': 0.0, 'Merge': 0.6, 'Close': 1.0},
+    # Share of a continuing body's overhead saved by documenting its processes
+    'documentation_savings': {'Explicit': 0.0, 'Partially Explicit': 0.05, 'Mixed': 0.10, 'Tacit': 0.15},
+    'reporting_saving': 0.05,           # share saved by dashboard reporting
+}
+
+SAVING_CATEGORIES = {
+    'Merge_Saving': "Governance consolidation (merges)",
+    'Close_Saving': "Closing low-value bodies",
+    'Documentation_Saving': "Process documentation efficiency gains",
+    'Reporting_Saving': "Streamlined reporting",
+}
+
+
+def default_cost_model():
+    """A fresh, editable copy of the default cost model"""
+    return copy.deepcopy(DEFAULT_COST_MODEL)
+
+
+def _lookup(series, scale):
+    """``ordinal`` with unknown categories given the average of the scale"""
+    return ordinal(series, scale).fillna(np.mean(list(scale.values()))).to_numpy(dtype=float)
+
+
+def member_count(groups, model=None):
+    """Attendees for bodies with ``groups`` primary stakeholder groups"""
+    model = model or DEFAULT_COST_MODEL
+    return np.maximum(np.asarray(groups) * model['members_per_stakeholder'], model['min_members'])
+
+
+def governance_costs(df, model=None):
+    """Return per-body meeting logistics, annual overhead and savings (£ a year)
+
+    ``Member_Cost`` is the annual cost of one attendee, so the overhead of a
+    body with a different membership is ``Member_Cost`` x attendees plus the
+    unchanged secretariat cost.
+    """
+    model = model or DEFAULT_COST_MODEL
+    stakeholders = df['Primary_Stakeholders'].astype('object').fillna('')
+    groups = stakeholders.str.count(',').to_numpy() + (stakeholders.str.strip() != '').to_numpy()
+    members = member_count(groups, model)
+
+    meetings = _lookup(df['Level'], model['meetings_per_year'])
+    hours = _lookup(df['Cost_Impact'], model['meeting_hours'])
+    rate = _lookup(df['Level'], model['salary_bands']) * (1 + model['on_cost']) / model['working_hours']
+    member_cost = meetings * hours * (1 + model['preparation']) * rate
+    attendance = members * member_cost
+    secretariat = meetings * model['secretariat_hours'] * model['secretariat_rate']
+    overhead = attendance + secretariat
+
+    recommendation = df['RAG_Recommendation'].astype('object').to_numpy()
+    saved_share = _lookup(df['RAG_Recommendation'], model['recommendation_savings'])
+    continuing = overhead * (1 - saved_share)
+    return pd.DataFrame({
+        'Members': members,
+        'Meetings_Per_Year': meetings,
+        'Meeting_Hours': hours,
+        'Member_Cost': member_cost,
+        'Annual_Cost': overhead,
+        'Merge_Saving': np.where(recommendation == 'Merge', overhead * saved_share, 0.0),
+        'Close_Saving': np.where(recommendation == 'Close', overhead * saved_share, 0.0),
+        'Documentation_Saving': continuing * _lookup(df['Process_Type'], model['documentation_savings']),
+        'Reporting_Saving': continuing * model['reporting_saving'],
+    }, index=df.index).assign(
+        Total_Saving=lambda costs: costs[list(SAVING_CATEGORIES)].sum(axis=1)
+    )
+
+
+def get_costs(df, version=None):
+    """Return ``governance_costs(df)`` under the default model, memoized per dataset version"""
+    return derived_cache.get(('costs', version or dataset_hash(df)), lambda: governance_costs(df))
+
+
+def savings_summary(costs):
+    """Total annual saving per category, labelled, plus the overall total"""
+    totals = {label: float(costs[column].sum()) for column, label in SAVING_CATEGORIES.items()}
+    return totals, sum(totals.values())
+
+
+def pair_savings(costs, pairs, model=None):
+    """Estimated saving from merging each pair: the merge share of the cheaper body's overhead"""
+    model = model or DEFAULT_COST_MODEL
+    if len(pairs) == 0:
+        return pd.Series(dtype=float)
+    cheaper = np.minimum(
+        costs['Annual_Cost'].reindex(pairs['Body_A']).to_numpy(),
+        costs['Annual_Cost'].reindex(pairs['Body_B']).to_numpy(),
+    )
+    return pd.Series(cheaper * model['recommendation_savings']['Merge'], index=pairs.index)
+
+
+def format_pounds(value, short=False):
+    """'£85,000' (rounded to the nearest thousand), or '£85K' with ``short``"""
+    thousands = round(value / 1000)
+    return f"£{thousands:,}K" if short else f"£{thousands * 1000:,}"
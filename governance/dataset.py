@@ -0,0 +1,163 @@
+"""Shared base dataset with per-session copy-on-write edits"""
+import pandas as pd
+
+from governance.activities import explode_activities, patch_activities
+from governance.metrics import dataset_hash, derived_cache
+from governance.schema import apply_schema
+from governance.search import OverlaySearchIndex, SearchIndex
+
+
+class SessionDataset:
+    """A session's view of the governance bodies
+
+    ``base`` is the immutable frame shared by every session at the same store
+    revision and is never modified here. The session's own adds, edits and
+    deletes are kept in a small overlay; an unedited session simply returns
+    the shared base. ``base_hash`` can be passed when the base's version hash
+    is already known, e.g. from a snapshot.
+
+    Pages read whole frames, so a session with edits has a frame of its own.
+    Each change is patched into the previous frame: editing a body replaces
+    only the columns that changed, sharing the others with the base, while
+    adding or deleting a body copies the frame once. The search index stays
+    shared, with only the session's own bodies indexed on top of it.
+    """
+
+    def __init__(self, base, base_hash=None):
+        self.base = base
+        self.upserts = {}
+        self.deleted = set()
+        self.version = 0
+        self._frame = base
+        self._hash = base_hash
+        self._base_hash = base_hash
+        self._activities = None
+        self._search = None
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            self._frame = self._merge()
+        return self._frame
+
+    @property
+    def version_hash(self):
+        """Content hash of the current frame, computed once per version"""
+        if self._hash is None:
+            self._hash = dataset_hash(self.frame)
+        return self._hash
+
+    @property
+    def activities(self):
+        """Long body <-> activity table, patched per body as the session edits"""
+        if self._activities is None:
+            frame = self.frame
+            self._activities = derived_cache.get(
+                ('activities', self.version_hash), lambda: explode_activities(frame)
+            )
+        return self._activities
+
+    @property
+    def search_index(self):
+        """Full-text index of the bodies, with the session's edits layered over the shared one"""
+        if self._search is None:
+            if self._base_hash is None:
+                self._base_hash = dataset_hash(self.base)
+            base, base_hash = self.base, self._base_hash
+            shared = derived_cache.get(('search', base_hash), lambda: SearchIndex.from_frame(base))
+            self._search = OverlaySearchIndex(shared)
+            for body_id in self.deleted:
+                self._search.remove(body_id)
+            for body_id, body in self.upserts.items():
+                self._search.add(body_id, body)
+        return self._search
+
+    def search(self, text, limit=20):
+        """Ranked ``(body_id, score)`` matches for ``text``"""
+        return self.search_index.search(text, limit)
+
+    @property
+    def has_edits(self):
+        return bool(self.upserts or self.deleted)
+
+    def _merge(self):
+        if not self.has_edits:
+            return self.base
+        touched = self.deleted.union(self.upserts)
+        parts = [self.base.drop(index=list(touched), errors='ignore')]
+        if self.upserts:
+            overlay = pd.DataFrame.from_dict(self.upserts, orient='index')
+            parts.append(overlay.reindex(columns=self.base.columns))
+        return apply_schema(pd.concat(parts).sort_index())
+
+    def _patch(self, frame, body_id):
+        """Apply one body's change to ``frame``, or return None if it needs a full merge"""
+        if body_id not in self.upserts:
+            return frame.drop(index=body_id, errors='ignore')
+        row = pd.DataFrame.from_dict({body_id: self.upserts[body_id]}, orient='index').reindex(columns=frame.columns)
+        for column in frame.columns:
+            if isinstance(frame[column].dtype, pd.CategoricalDtype):
+                value = row[column].iloc[0]
+                if pd.notna(value) and value not in frame[column].cat.categories:
+                    return None
+                row[column] = pd.Categorical(row[column], dtype=frame[column].dtype)
+        row = apply_schema(row)
+
+        if body_id not in frame.index:
+            patched = pd.concat([frame, row])
+            if not patched.index.is_monotonic_increasing:
+                patched = patched.sort_index()
+            return patched if (patched.dtypes == frame.dtypes).all() else None
+
+        position = frame.index.get_loc(body_id)
+        patched = frame.copy(deep=False)
+        for column in frame.columns:
+            old, new = frame[column].iloc[position], row[column].iloc[0]
+            if (pd.isna(old) and pd.isna(new)) or (pd.notna(old) and pd.notna(new) and old == new):
+                continue
+            values = frame[column].copy()
+            try:
+                values.iloc[position] = new
+            except (TypeError, ValueError):
+                return None
+            if values.dtype != frame[column].dtype:
+                return None
+            patched[column] = values
+        return patched
+
+    def _changed(self, body_id):
+        self.version += 1
+        previous, self._frame = self._frame, None
+        if previous is not None:
+            self._frame = self._patch(previous, body_id)
+        self._hash = None
+        if self._activities is not None:
+            self._activities = patch_activities(self._activities, body_id, self.upserts.get(body_id))
+        if self._search is not None:
+            if body_id in self.upserts:
+                self._search.add(body_id, self.upserts[body_id])
+            else:
+                self._search.remove(body_id)
+
+    def row(self, body_id):
+        """Return the current values for one body as a dict"""
+        if body_id in self.upserts:
+            return dict(self.upserts[body_id])
+        return self.base.loc[body_id].to_dict()
+
+    def add(self, body_id, body):
+        self.deleted.discard(body_id)
+        self.upserts[body_id] = dict(body)
+        self._changed(body_id)
+
+    def update(self, body_id, changes):
+        row = self.row(body_id)
+        row.update(changes)
+        self.upserts[body_id] = row
+        self._changed(body_id)
+
+    def delete(self, body_id):
+        self.upserts.pop(body_id, None)
+        if body_id in self.base.index:
+            self.deleted.add(body_id)
+        self._changed(body_id)
@@ -0,0 +1,202 @@
+"""Near-duplicate body detection with MinHash signatures and LSH banding
+
+Each body is reduced to a set of features: its value chain activities,
+primary and secondary stakeholders and outcome focus areas. MinHash
+signatures estimate the Jaccard similarity of those sets, and banding the
+signatures (locality-sensitive hashing) only pairs up bodies that agree on
+at least one band, so the register is never compared all-against-all.
+"""
+import zlib
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from governance.metrics import dataset_hash, derived_cache
+
+# Feature prefix -> comma-separated source columns
+FEATURE_COLUMNS = {
+    'activity': ['Value_Chain_Activities'],
+    'stakeholder': ['Primary_Stakeholders', 'Secondary_Stakeholders'],
+    'outcome': ['Outcome_Focus'],
+}
+# 85 bands of 3 rows put the LSH threshold near 0.23: pairs with a similarity of
+# 0.25 are found about 75% of the time and pairs at 0.35 about 98%, while
+# unrelated bodies (similarity 0.05) rarely share a band
+BANDS = 85
+ROWS_PER_BAND = 3
+NUM_PERM = BANDS * ROWS_PER_BAND
+# Feature sets are short, so sharing a quarter of them is already a shared remit
+DEFAULT_THRESHOLD = 0.25
+# Candidates whose MinHash estimate is this far below the threshold are dropped
+# before the exact comparison (about three standard errors at 255 permutations)
+ESTIMATE_MARGIN = 0.08
+# Lower similarity bound of Duplication_Risk 2, 3, 4 and 5
+RISK_BINS = [0.15, 0.25, 0.35, 0.5]
+# Features held by more than this share of a large register (e.g. a borough-wide
+# outcome) say nothing about duplication and would make most bodies candidates
+COMMON_FEATURE_SHARE = 0.05
+COMMON_FEATURE_MIN_BODIES = 20
+# Registers up to this size screen every pair of bodies rather than the LSH
+# candidates, so a pair just above the threshold is never missed by chance
+ALL_PAIRS_MAX_BODIES = 200
+# Bodies hashed, and candidate pairs screened, per step so memory stays bounded
+SIGNATURE_CHUNK_SIZE = 1000
+CANDIDATE_CHUNK_SIZE = 20000
+
+_PRIME = np.uint64(4294967311)        # smallest prime above 2**32
+_EMPTY = np.iinfo(np.uint64).max
+_FOLD = np.uint64(1099511628211)     # FNV-1a 64-bit prime, for band keys
+
+
+def body_features(df):
+    """Return one set of ``prefix:item`` features per body, in row order"""
+    features = [set() for _ in range(len(df))]
+    for prefix, columns in FEATURE_COLUMNS.items():
+        for column in columns:
+            for position, value in enumerate(df[column].astype('object').fillna('')):
+                features[position].update(
+                    f"{prefix}:{item.strip().lower()}" for item in value.split(',') if item.strip()
+                )
+    return features
+
+
+def drop_common_features(feature_sets, share=COMMON_FEATURE_SHARE, min_bodies=COMMON_FEATURE_MIN_BODIES):
+    """Remove features held by more than ``share`` of the bodies (and more than ``min_bodies``)"""
+    counts = Counter(feature for features in feature_sets for feature in features)
+    limit = max(min_bodies, share * len(feature_sets))
+    common = {feature for feature, count in counts.items() if count > limit}
+    if not common:
+        return feature_sets
+    return [features - common for features in feature_sets]
+
+
+def minhash_signatures(feature_sets, num_perm=NUM_PERM, seed=1):
+    """Return a ``len(feature_sets) x num_perm`` MinHash signature matrix
+
+    Features are hashed with CRC-32 and permuted with ``(a * x + b) mod p``
+    for ``num_perm`` random (a, b) pairs, in one vectorised pass over every
+    feature of each chunk of ``SIGNATURE_CHUNK_SIZE`` bodies.
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+    b = rng.randint(1, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(feature_sets), num_perm), _EMPTY, dtype=np.uint64)
+    for offset in range(0, len(feature_sets), SIGNATURE_CHUNK_SIZE):
+        chunk = feature_sets[offset:offset + SIGNATURE_CHUNK_SIZE]
+        sizes = np.fromiter((len(features) for features in chunk), dtype=np.int64, count=len(chunk))
+        if sizes.sum() == 0:
+            continue
+        hashes = np.fromiter(
+            (zlib.crc32(feature.encode('utf-8')) for features in chunk for feature in features),
+            dtype=np.uint64, count=int(sizes.sum()),
+        )
+        # Both factors are below 2**32, so each product fits in 64 bits; reducing
+        # it before adding b keeps the sum from wrapping too
+        permuted = (np.outer(hashes % _PRIME, a) % _PRIME + b) % _PRIME
+        filled = np.flatnonzero(sizes)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))[filled]
+        signatures[offset + filled] = np.minimum.reduceat(permuted, starts, axis=0)
+    return signatures
+
+
+def lsh_candidates(signatures, bands=BANDS):
+    """Return the row pairs whose signatures agree on at least one band, as arrays ``(i, j)`` with i < j
+
+    Each band is folded into one 64-bit bucket key, so finding the bodies that
+    share a bucket is a sort rather than a comparison of every pair. A key
+    collision only adds a candidate, which the similarity check then drops.
+    """
+    rows_per_band = signatures.shape[1] // bands
+    count = len(signatures)
+    filled = np.flatnonzero(signatures[:, 0] != _EMPTY)
+    pair_keys = []
+    for band in range(bands):
+        keys = np.zeros(len(filled), dtype=np.uint64)
+        for column in range(band * rows_per_band, (band + 1) * rows_per_band):
+            keys = (keys * _FOLD) ^ signatures[filled, column]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+        sizes = np.diff(np.append(starts, len(order)))
+        # Buckets of two (nearly all of them) in one step, larger buckets pair by pair
+        pairs = starts[sizes == 2]
+        left, right = filled[order[pairs]], filled[order[pairs + 1]]
+        pair_keys.append(np.minimum(left, right) * count + np.maximum(left, right))
+        for start, size in zip(starts[sizes > 2], sizes[sizes > 2]):
+            group = filled[order[start:start + size]]
+            x, y = np.triu_indices(size, 1)
+            pair_keys.append(np.minimum(group[x], group[y]) * count + np.maximum(group[x], group[y]))
+
+    if not pair_keys:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    # One key per pair (rather than two index arrays) keeps the pre-dedup buffer small
+    pairs = np.unique(np.concatenate(pair_keys))
+    return pairs // count, pairs % count
+
+
+def find_duplicates(df, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+    """Return candidate duplicate pairs whose feature sets overlap by at least ``threshold``
+
+    ``Estimate`` is the MinHash similarity, which screens the LSH candidates
+    (every pair on a register of up to ``ALL_PAIRS_MAX_BODIES``), and
+    ``Similarity`` the exact Jaccard similarity of the two feature sets,
+    computed only for the candidates that pass. Features common to most of a
+    large register are left out of both.
+    """
+    features = drop_common_features(body_features(df))
+    signatures = minhash_signatures(features, num_perm)
+    if len(df) <= ALL_PAIRS_MAX_BODIES:
+        left, right = np.triu_indices(len(df), 1)
+    else:
+        left, right = lsh_candidates(signatures, bands)
+    estimate = np.empty(len(left))
+    for start in range(0, len(left), CANDIDATE_CHUNK_SIZE):
+        stop = start + CANDIDATE_CHUNK_SIZE
+        estimate[start:stop] = (signatures[left[start:stop]] == signatures[right[start:stop]]).mean(axis=1)
+    screened = estimate >= threshold - ESTIMATE_MARGIN
+    left, right, estimate = left[screened], right[screened], estimate[screened]
+
+    sizes = np.fromiter((len(feature_set) for feature_set in features), dtype=np.int64, count=len(features))
+    common = np.fromiter(
+        (len(features[i] & features[j]) for i, j in zip(left.tolist(), right.tolist())), dtype=np.int64, count=len(left)
+    )
+    similarity = common / np.maximum(sizes[left] + sizes[right] - common, 1)
+    keep = np.flatnonzero(similarity >= threshold)
+    shared = {k: features[left[k]] & features[right[k]] for k in keep}
+    names = df['Name'].to_numpy()
+    pairs = pd.DataFrame({
+        'Body_A': df.index[left[keep]],
+        'Body_B': df.index[right[keep]],
+        'Name_A': names[left[keep]],
+        'Name_B': names[right[keep]],
+        'Similarity': similarity[keep],
+        'Estimate': estimate[keep],
+        'Shared': [sorted(feature.split(':', 1)[1] for feature in shared[k]) for k in keep],
+    })
+    return pairs.sort_values('Similarity', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def get_duplicates(df, version=None, threshold=DEFAULT_THRESHOLD):
+    """Return ``find_duplicates(df)``, memoized per dataset version and threshold"""
+    key = ('duplicates', version or dataset_hash(df), threshold)
+    return derived_cache.get(key, lambda: find_duplicates(df, threshold))
+
+
+def similarity_risk(similarity):
+    """Map similarity values (0-1) onto the 1-5 Duplication_Risk scale"""
+    return np.digitize(similarity, RISK_BINS) + 1
+
+
+def suggested_risk(df, pairs):
+    """Per body: the highest similarity to any other body and the matching 1-5 risk"""
+    best = pd.concat([
+        pairs[['Body_A', 'Similarity']].rename(columns={'Body_A': 'Body'}),
+        pairs[['Body_B', 'Similarity']].rename(columns={'Body_B': 'Body'}),
+    ]).groupby('Body')['Similarity'].max()
+    best = best.reindex(df.index, fill_value=0.0)
+    return pd.DataFrame({
+        'Max_Similarity': best,
+        'Suggested_Risk': similarity_risk(best.to_numpy()),
+    }, index=df.index)
@@ -0,0 +1,140 @@
+"""Chunked export of governance data to CSV, JSON, JSON Lines, Parquet and ZIP bundles"""
+import io
+import json
+import tempfile
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+EXPORT_CHUNK_SIZE = 5000
+# Exports are spooled in memory up to this size, then on disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+EXPORT_FORMATS = {
+    'csv': ("CSV", 'text/csv'),
+    'json': ("JSON", 'application/json'),
+    'jsonl': ("JSON Lines", 'application/x-ndjson'),
+    'parquet': ("Parquet", 'application/vnd.apache.parquet'),
+}
+
+
+def chunks(df, chunksize=EXPORT_CHUNK_SIZE):
+    """Yield consecutive row slices of ``df`` (views, not copies)"""
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+def write_csv(df, fh, chunksize=EXPORT_CHUNK_SIZE):
+    """Write ``df`` as CSV to a text stream, one chunk at a time"""
+    if df.empty:
+        df.to_csv(fh, index=False)
+    for number, chunk in enumerate(chunks(df, chunksize)):
+        chunk.to_csv(fh, index=False, header=number == 0)
+
+
+def write_json(df, fh, chunksize=EXPORT_CHUNK_SIZE):
+    """Write ``df`` as an indented JSON array of records, one chunk at a time"""
+    fh.write('[')
+    for number, chunk in enumerate(chunks(df, chunksize)):
+        records = chunk.to_json(orient='records', indent=2).strip()[1:-1].strip('\n')
+        fh.write(',\n' if number else '\n')
+        fh.write(records)
+    fh.write('\n]' if len(df) else ']')
+
+
+def write_jsonl(df, fh, chunksize=EXPORT_CHUNK_SIZE):
+    """Write ``df`` as JSON Lines, one chunk at a time"""
+    for chunk in chunks(df, chunksize):
+        fh.write(chunk.to_json(orient='records', lines=True).rstrip('\n') + '\n')
+
+
+def write_parquet(df, fh, chunksize=EXPORT_CHUNK_SIZE):
+    """Write ``df`` to a binary stream as Parquet, one row group per chunk"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(fh, schema) as writer:
+        for chunk in chunks(df, chunksize):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+_WRITERS = {'csv': write_csv, 'json': write_json, 'jsonl': write_jsonl, 'parquet': write_parquet}
+
+
+def write_table(df, fh, fmt, chunksize=EXPORT_CHUNK_SIZE):
+    """Write ``df`` in ``fmt`` to the binary stream ``fh``"""
+    if fmt == 'parquet':
+        write_parquet(df, fh, chunksize)
+        return
+    text = io.TextIOWrapper(fh, encoding='utf-8', newline='')
+    try:
+        _WRITERS[fmt](df, text, chunksize)
+    finally:
+        text.flush()
+        text.detach()
+
+
+def export_file(df, fmt, chunksize=EXPORT_CHUNK_SIZE):
+    """Return a rewound spooled temporary file holding ``df`` exported as ``fmt``"""
+    fh = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    write_table(df, fh, fmt, chunksize)
+    fh.seek(0)
+    return fh
+
+
+def edge_frames(names, values, chunksize=EXPORT_CHUNK_SIZE):
+    """Yield the stakeholder-overlap edge list as DataFrame chunks"""
+    from governance.overlap import overlap_counts
+
+    names = np.asarray(list(names), dtype=object)
+    counts = overlap_counts(list(values))
+    keep = counts.data > 0
+    rows, cols, weights = counts.row[keep], counts.col[keep], counts.data[keep]
+    order = np.lexsort((cols, rows))
+    if len(order) == 0:
+        yield pd.DataFrame(columns=['Source', 'Target', 'Shared_Stakeholders'])
+    for start in range(0, len(order), chunksize):
+        part = order[start:start + chunksize]
+        yield pd.DataFrame({
+            'Source': names[rows[part]],
+            'Target': names[cols[part]],
+            'Shared_Stakeholders': weights[part],
+        })
+
+
+def write_bundle(fh, bodies, five_forces, activities, pdf=None, chunksize=EXPORT_CHUNK_SIZE):
+    """Write a ZIP of every export to ``fh`` in one pass
+
+    Each member is streamed into the archive as it is produced and released
+    before the next one starts, so only one chunk of one artefact is held at
+    a time. ``pdf`` is optional report bytes, or a callable returning them.
+    """
+    with zipfile.ZipFile(fh, 'w', compression=zipfile.ZIP_DEFLATED) as bundle:
+        def member(name):
+            return bundle.open(name, 'w', force_zip64=True)
+
+        with member('governance_bodies.csv') as entry:
+            write_table(bodies, entry, 'csv', chunksize)
+        with member('five_forces.json') as entry:
+            entry.write(json.dumps(five_forces, indent=2).encode('utf-8'))
+        with member('value_chain_activities.csv') as entry:
+            write_table(activities, entry, 'csv', chunksize)
+        with member('network_edges.csv') as entry:
+            text = io.TextIOWrapper(entry, encoding='utf-8', newline='')
+            for number, frame in enumerate(edge_frames(bodies['Name'], bodies['Primary_Stakeholders'], chunksize)):
+                frame.to_csv(text, index=False, header=number == 0)
+            text.flush()
+            text.detach()
+        if pdf is not None:
+            with member('governance_report.pdf') as entry:
+                entry.write(pdf() if callable(pdf) else pdf)
+
+
+def bundle_file(bodies, five_forces, activities, pdf=None, chunksize=EXPORT_CHUNK_SIZE):
+    """Return a rewound spooled temporary file holding the ZIP bundle"""
+    fh = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    write_bundle(fh, bodies, five_forces, activities, pdf, chunksize)
+    fh.seek(0)
+    return fh
@@ -0,0 +1,45 @@
+"""Bounded cache of built Plotly figures"""
+import json
+import threading
+from collections import OrderedDict
+
+
+class FigureCache:
+    """LRU of figures keyed by (chart id, dataset version, filter state)
+
+    Figures are kept as built ``go.Figure`` specs and handed to
+    ``st.plotly_chart`` as-is, which serialises them without re-validating,
+    so an unchanged chart costs a dictionary lookup instead of a ``px.*``
+    call. Cached figures must be treated as read-only.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(chart_id, version, filters=None):
+        return (chart_id, version, json.dumps(filters, sort_keys=True, default=str))
+
+    def get_or_build(self, chart_id, version, build, filters=None):
+        key = self.make_key(chart_id, version, filters)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        figure = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = figure
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
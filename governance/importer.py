@@ -0,0 +1,120 @@
+"""Bulk import of governance bodies from CSV or Excel files"""
+import os
+import re
+
+import pandas as pd
+
+from governance.schema import SCORE_COLUMNS
+from governance.storage import BODY_COLUMNS
+from governance.validation import PILLAR_SEPARATOR, validate_frame
+
+IMPORT_CHUNK_SIZE = 5000
+IMPORT_EXTENSIONS = ['csv', 'xlsx']
+
+# First data row in the file (after the header), for error messages
+_FIRST_DATA_LINE = 2
+
+
+def _column_key(name):
+    return re.sub(r'[^a-z0-9]', '', str(name).lower())
+
+
+_COLUMN_KEYS = {_column_key(column): column for column in BODY_COLUMNS}
+
+
+class ImportResult:
+    """Outcome of one import: new body ids plus per-row validation errors"""
+
+    def __init__(self):
+        self.rows_read = 0
+        self.body_ids = []
+        self.errors = []                # (file line, message)
+        self.unknown_columns = []
+
+    @property
+    def rows_rejected(self):
+        return len({line for line, _ in self.errors})
+
+    def errors_frame(self):
+        return pd.DataFrame(self.errors, columns=['Line', 'Error'])
+
+
+def read_chunks(source, filename, chunksize=IMPORT_CHUNK_SIZE):
+    """Yield DataFrame chunks of ``chunksize`` rows from a CSV or XLSX file
+
+    Every value is read as text; typing happens after validation.
+    """
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    if extension == 'csv':
+        yield from pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunksize)
+    elif extension == 'xlsx':
+        yield from _read_xlsx_chunks(source, chunksize)
+    else:
+        raise ValueError(f"Unsupported file type '.{extension}' (expected {', '.join(IMPORT_EXTENSIONS)})")
+
+
+def _read_xlsx_chunks(source, chunksize):
+    """Stream the first worksheet of an XLSX workbook in row chunks"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(value) if value is not None else '' for value in next(rows, ())]
+        chunk = []
+        for row in rows:
+            if any(value is not None for value in row):
+                chunk.append(['' if value is None else str(value) for value in row])
+            if len(chunk) == chunksize:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        workbook.close()
+
+
+def normalise_chunk(chunk):
+    """Map file headers onto body columns and tidy the values of one chunk"""
+    chunk = chunk.rename(columns=lambda name: _COLUMN_KEYS.get(_column_key(name), name))
+    chunk = chunk.apply(lambda column: column.str.strip())
+    if 'Fairer_Westminster_Alignment' in chunk.columns:
+        pillars = chunk['Fairer_Westminster_Alignment'].str.split(',')
+        chunk['Fairer_Westminster_Alignment'] = pillars.map(
+            lambda parts: PILLAR_SEPARATOR.join(part.strip() for part in parts if part.strip())
+        )
+    for column in SCORE_COLUMNS:
+        if column in chunk.columns:
+            chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+    return chunk
+
+
+def import_bodies(store, source, filename, chunksize=IMPORT_CHUNK_SIZE):
+    """Validate a CSV/XLSX file chunk by chunk and insert its valid rows in one batch
+
+    Rows failing any of the add form's rules are skipped and reported with
+    their file line. Only plain value tuples of the valid rows are kept
+    between chunks; they are written in a single transaction at the end.
+    """
+    result = ImportResult()
+    valid_rows = []
+    for chunk in read_chunks(source, filename, chunksize):
+        chunk.index = pd.RangeIndex(result.rows_read, result.rows_read + len(chunk)) + _FIRST_DATA_LINE
+        result.rows_read += len(chunk)
+        chunk = normalise_chunk(chunk)
+        for column in chunk.columns:
+            if column not in BODY_COLUMNS and column not in result.unknown_columns:
+                result.unknown_columns.append(column)
+
+        errors = validate_frame(chunk)
+        result.errors.extend(errors)
+        rejected = {line for line, _ in errors}
+        valid = chunk.loc[~chunk.index.isin(rejected)].reindex(columns=list(BODY_COLUMNS))
+        valid[SCORE_COLUMNS] = valid[SCORE_COLUMNS].astype('int64')
+        valid = valid.astype(object).where(valid.notna(), None)
+        valid_rows.extend(valid.itertuples(index=False, name=None))
+
+    result.errors.sort()
+    if valid_rows:
+        result.body_ids = store.insert_bodies(valid_rows)
+    return result
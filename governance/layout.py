@@ -0,0 +1,118 @@
+"""Cached, warm-started layouts for the governance network"""
+import hashlib
+from collections import OrderedDict
+
+import networkx as nx
+
+LAYOUT_SEED = 42
+LAYOUT_MODES = {
+    "Standard": "spring",
+    "Fast (large graphs)": "fast",
+}
+
+
+def graph_key(G):
+    """Return a stable hash of the graph's nodes, edges and edge weights"""
+    nodes = sorted(map(str, G.nodes()))
+    edges = sorted(
+        tuple(sorted((str(u), str(v)))) + (data.get('weight', 1),)
+        for u, v, data in G.edges(data=True)
+    )
+    payload = repr((nodes, edges)).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()
+
+
+def positions_key(pos):
+    """Return a stable hash of node positions, e.g. to key a figure drawn from them"""
+    payload = repr(sorted((str(node), tuple(round(float(v), 9) for v in xy)) for node, xy in pos.items()))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _neighbourhoods(G):
+    """Map each node to the set of (neighbour, weight) pairs it is connected to"""
+    return {
+        node: frozenset((str(nbr), data.get('weight', 1)) for nbr, data in G[node].items())
+        for node in G.nodes()
+    }
+
+
+def changed_nodes(G, previous):
+    """Return nodes that are new or whose connections differ from the previous graph"""
+    before = _neighbourhoods(previous)
+    after = _neighbourhoods(G)
+    changed = {node for node, nbrs in after.items() if before.get(node) != nbrs}
+    # Nodes next to a change are free to move too, so the neighbourhood settles
+    for node in list(changed):
+        changed.update(G.neighbors(node))
+    return changed
+
+
+def spring(G, pos=None, fixed=None, seed=LAYOUT_SEED):
+    """Force-directed layout matching the original Network View settings"""
+    return nx.spring_layout(G, k=2, iterations=50, pos=pos, fixed=fixed, seed=seed)
+
+
+def fast(G, pos=None, fixed=None, seed=LAYOUT_SEED):
+    """Sparse spectral layout refined by a short force-directed pass
+
+    The spectral embedding is an eigen-solve over the sparse graph Laplacian,
+    so large registers only pay for a handful of spring iterations on top.
+    """
+    if pos is None and len(G) > 2:
+        pos = nx.spectral_layout(G)
+    return nx.spring_layout(G, k=2, iterations=15, pos=pos, fixed=fixed, seed=seed)
+
+
+LAYOUT_FUNCTIONS = {
+    "spring": spring,
+    "fast": fast,
+}
+
+
+class LayoutCache:
+    """LRU cache of node positions keyed by graph structure and layout mode
+
+    On a miss the layout warm-starts from the most recent positions, so only
+    the nodes around an added or edited body move.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self._layouts = OrderedDict()
+        self._last = {}
+
+    def get_layout(self, G, mode="spring"):
+        key = (graph_key(G), mode)
+        if key in self._layouts:
+            self._layouts.move_to_end(key)
+            pos = self._layouts[key]
+        else:
+            pos = self._compute(G, mode)
+            self._layouts[key] = pos
+            if len(self._layouts) > self.maxsize:
+                self._layouts.popitem(last=False)
+
+        self._last[mode] = (G.copy(), pos)
+        return pos
+
+    def _compute(self, G, mode):
+        layout = LAYOUT_FUNCTIONS[mode]
+        if len(G) == 0:
+            return {}
+
+        previous = self._last.get(mode)
+        if previous is None:
+            return layout(G)
+
+        previous_graph, previous_pos = previous
+        moving = changed_nodes(G, previous_graph)
+        initial = {node: previous_pos[node] for node in G.nodes() if node in previous_pos}
+        fixed = [node for node in initial if node not in moving]
+
+        if not initial or not fixed:
+            return layout(G, pos=initial or None)
+        return layout(G, pos=initial, fixed=fixed)
+
+    def clear(self):
+        self._layouts.clear()
+        self._last.clear()
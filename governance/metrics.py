@@ -0,0 +1,87 @@
+"""Derived numeric encodings shared by every page"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from governance.schema import ordinal
+
+COST_SCALE = {'Low': 1, 'Medium': 2, 'High': 3, 'Very High': 4}
+POWER_SCALE = {'Low': 1, 'Medium': 2, 'High': 3}
+INTEREST_SCALE = {'Low': 1, 'Medium': 2, 'High': 3, 'Very High': 4}
+SPEED_ORDER = ['Fast', 'Medium', 'Slow']
+SPEED_SCALE = {speed: rank for rank, speed in enumerate(SPEED_ORDER, start=1)}
+
+
+def dataset_hash(df):
+    """Return a version hash of the dataset's columns, index and values"""
+    digest = hashlib.sha1()
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df.astype(str), index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def compute_derived(df):
+    """Compute every numeric encoding and count in one pass
+
+    The result shares ``df``'s index and holds only the derived columns, so
+    pages can pass them alongside the original frame without copying it.
+    """
+    return pd.DataFrame({
+        'Cost_Numeric': ordinal(df['Cost_Impact'], COST_SCALE),
+        'Power_Numeric': ordinal(df['Stakeholder_Power'], POWER_SCALE),
+        'Interest_Numeric': ordinal(df['Stakeholder_Interest'], INTEREST_SCALE),
+        'Speed_Rank': ordinal(df['Decision_Speed'], SPEED_SCALE),
+        'Principle_Count': df['Fairer_Westminster_Alignment'].str.split(', ').str.len(),
+    }, index=df.index)
+
+
+# Entries kept per kind of derived structure (the first element of its key). Each
+# kind has its own LRU, so cheap, numerous entries such as sort orders never
+# evict expensive ones such as the scenario engine.
+DERIVED_CACHE_SIZES = {
+    'sort_order': 32,
+    'minimal_set': 16,
+    'communities': 8,
+    'centrality': 8,
+    'duplicates': 8,
+}
+DEFAULT_DERIVED_CACHE_SIZE = 4
+
+
+class DerivedCache:
+    """Process-wide LRUs of derived structures keyed by (kind, ..., dataset version hash)"""
+
+    def __init__(self, sizes=None, default_size=DEFAULT_DERIVED_CACHE_SIZE):
+        self.sizes = DERIVED_CACHE_SIZES if sizes is None else sizes
+        self.default_size = default_size
+        self._kinds = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        kind = key[0]
+        with self._lock:
+            entries = self._kinds.setdefault(kind, OrderedDict())
+            if key in entries:
+                entries.move_to_end(key)
+                return entries[key]
+
+        value = compute()
+        with self._lock:
+            entries[key] = value
+            while len(entries) > self.sizes.get(kind, self.default_size):
+                entries.popitem(last=False)
+        return value
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._kinds.get(key[0], ())
+
+
+derived_cache = DerivedCache()
+
+
+def get_derived(df, version=None):
+    """Return the derived columns for ``df``, memoized by its version hash"""
+    return derived_cache.get(('columns', version or dataset_hash(df)), lambda: compute_derived(df))
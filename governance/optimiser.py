@@ -0,0 +1,212 @@
+"""Minimum-cost set of bodies that keeps the register's coverage
+
+Coverage is every Fairer Westminster principle, value chain activity and
+primary stakeholder group that some body currently covers. Choosing the
+cheapest subset of bodies that still covers all of them is a weighted set
+cover. Every register gets the greedy cost-effectiveness heuristic, with
+bodies that alone cover an item kept up front and redundant picks pruned
+afterwards. Small registers are also given to SciPy's HiGHS solver as an
+integer programme under a short time limit; its answer is only labelled
+exact when the solver proves it optimal.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from governance.alignment import principle_matrix
+from governance.costs import governance_costs
+from governance.metrics import dataset_hash, derived_cache
+from governance.overlap import incidence_matrix
+
+COVERAGE_KINDS = ['Principle', 'Activity', 'Stakeholder']
+# Coverage kind -> comma-joined source column (principles come from the alignment matrix)
+COVERAGE_COLUMNS = {
+    'Activity': 'Value_Chain_Activities',
+    'Stakeholder': 'Primary_Stakeholders',
+}
+# Registers up to this size are also solved as an integer programme, for at most
+# EXACT_TIME_LIMIT seconds so the Scenario page stays interactive
+EXACT_MAX_BODIES = 200
+EXACT_TIME_LIMIT = 1.0
+# Largest relative MIP gap at which a solution still counts as optimal
+EXACT_GAP = 1e-4
+# MinimalSet.method values
+EXACT, TIME_LIMITED, GREEDY = 'exact', 'time_limited', 'greedy'
+
+
+def coverage_matrix(df, kinds=None):
+    """Return the sparse body x item coverage matrix and its ``(kind, item)`` labels"""
+    kinds = kinds or COVERAGE_KINDS
+    blocks, labels = [sparse.csr_matrix((len(df), 0), dtype=np.int8)], []
+    if 'Principle' in kinds:
+        principles = principle_matrix(df)
+        blocks.append(sparse.csr_matrix(principles.to_numpy(dtype=np.int8)))
+        labels += [('Principle', principle) for principle in principles.columns]
+    for kind, column in COVERAGE_COLUMNS.items():
+        if kind not in kinds:
+            continue
+        matrix, vocabulary = incidence_matrix([
+            (', '.join(item.strip() for item in value.split(',') if item.strip()) or None) if isinstance(value, str) else value
+            for value in df[column]
+        ])
+        blocks.append(matrix)
+        labels += [(kind, item) for item in vocabulary]
+    return sparse.hstack(blocks, format='csr').astype(np.int8), labels
+
+
+def greedy_cover(matrix, costs, required=None):
+    """Indices of a low-cost covering set of rows, by the greedy cost-effectiveness rule
+
+    Each step picks the row covering the most still-uncovered items per pound,
+    using one sparse product over all rows; rows made redundant by later picks
+    are then dropped, most expensive first.
+    """
+    rows, items = matrix.shape
+    chosen = np.zeros(rows, dtype=bool)
+    if required is not None:
+        chosen[required] = True
+    uncovered = np.asarray(matrix[chosen].sum(axis=0)).ravel() == 0
+    uncovered &= np.asarray(matrix.sum(axis=0)).ravel() > 0
+    costs = np.maximum(np.asarray(costs, dtype=float), 1e-9)
+
+    while uncovered.any():
+        gains = matrix @ uncovered.astype(np.int32)
+        ratio = np.where(chosen, -1.0, gains / costs)
+        best = int(np.argmax(ratio))
+        chosen[best] = True
+        uncovered &= matrix[best].toarray().ravel() == 0
+
+    # Drop picks whose items are all covered by the other chosen rows
+    cover_counts = np.asarray(matrix[chosen].sum(axis=0)).ravel()
+    optional = np.flatnonzero(chosen)
+    if required is not None:
+        optional = np.setdiff1d(optional, required)
+    for row in optional[np.argsort(-costs[optional], kind='stable')]:
+        items_of_row = matrix[row].indices
+        if (cover_counts[items_of_row] > 1).all():
+            chosen[row] = False
+            cover_counts[items_of_row] -= 1
+    return np.flatnonzero(chosen)
+
+
+def exact_cover(matrix, costs, required=None, time_limit=EXACT_TIME_LIMIT):
+    """Solve the cover as an integer programme: ``(indices, proven optimal)``, or None
+
+    A solve stopped by ``time_limit`` can still return a feasible but
+    possibly suboptimal cover; it is reported with ``False``.
+    """
+    from scipy.optimize import Bounds, LinearConstraint, milp
+
+    rows, _ = matrix.shape
+    coverable = np.asarray(matrix.sum(axis=0)).ravel() > 0
+    lower = np.zeros(rows)
+    if required is not None:
+        lower[required] = 1
+    result = milp(
+        c=np.asarray(costs, dtype=float),
+        constraints=LinearConstraint(matrix[:, coverable].T, lb=1, ub=np.inf),
+        integrality=np.ones(rows),
+        bounds=Bounds(lower, 1),
+        options={'time_limit': time_limit},
+    )
+    if result.x is None or result.status not in (0, 1):
+        return None
+    gap = getattr(result, 'mip_gap', None)
+    optimal = result.status == 0 and (gap is None or gap <= EXACT_GAP)
+    return np.flatnonzero(result.x > 0.5), optimal
+
+
+class MinimalSet:
+    """Bodies to keep and remove, with the coverage each removed body gave up"""
+
+    def __init__(self, df, matrix, labels, costs, keep, method):
+        self.df = df
+        self.matrix = matrix
+        self.labels = labels
+        self.costs = costs
+        self.keep = keep
+        self.method = method
+        kept = np.zeros(len(df), dtype=bool)
+        kept[keep] = True
+        self.kept_mask = kept
+        self._removed = None
+
+    @property
+    def kept_ids(self):
+        return list(self.df.index[self.kept_mask])
+
+    @property
+    def removed_ids(self):
+        return list(self.df.index[~self.kept_mask])
+
+    @property
+    def saving(self):
+        return float(self.costs[~self.kept_mask].sum())
+
+    def removed(self):
+        """One row per removed body: what it covered and which kept bodies now cover it"""
+        if self._removed is None:
+            self._removed = self._removed_report()
+        return self._removed
+
+    def _removed_report(self):
+        kept_matrix = self.matrix[self.kept_mask]
+        kept_names = self.df['Name'].to_numpy()[self.kept_mask]
+        records = []
+        for position in np.flatnonzero(~self.kept_mask):
+            items = self.matrix[position].indices
+            overlap = np.asarray(kept_matrix[:, items].sum(axis=1)).ravel()
+            order = np.argsort(-overlap, kind='stable')
+            given_up = {}
+            for item in items:
+                kind, label = self.labels[item]
+                given_up.setdefault(kind, []).append(label)
+            records.append({
+                'Body': self.df.index[position],
+                'Name': self.df['Name'].iloc[position],
+                'Annual_Cost': float(self.costs[position]),
+                'Principles': ', '.join(given_up.get('Principle', [])),
+                'Activities': ', '.join(given_up.get('Activity', [])),
+                'Stakeholders': ', '.join(given_up.get('Stakeholder', [])),
+                'Covered_By': ', '.join(kept_names[order[overlap[order] > 0]]),
+            })
+        columns = ['Body', 'Name', 'Annual_Cost', 'Principles', 'Activities', 'Stakeholders', 'Covered_By']
+        return pd.DataFrame(records, columns=columns)
+
+
+def minimal_set(df, keep=(), kinds=None, exact_max_bodies=EXACT_MAX_BODIES):
+    """Cheapest set of bodies (always including ``keep``) covering everything the register covers
+
+    ``kinds`` limits the coverage that must be kept to some of ``COVERAGE_KINDS``.
+    """
+    matrix, labels = coverage_matrix(df, kinds)
+    costs = governance_costs(df)['Annual_Cost'].to_numpy()
+    required = df.index.get_indexer(list(keep))
+    if (required < 0).any():
+        raise ValueError("Bodies to keep must be in the register")
+
+    # Bodies that alone cover an item can never go
+    sole = matrix[:, np.asarray(matrix.sum(axis=0)).ravel() == 1].tocoo().row
+    required = np.union1d(required, sole).astype(int)
+
+    # An empty register, or one with nothing to cover, keeps only the bodies asked for
+    if len(df) == 0 or matrix.nnz == 0:
+        return MinimalSet(df, matrix, labels, costs, required, EXACT)
+
+    chosen, method = greedy_cover(matrix, costs, required), GREEDY
+    if len(df) <= exact_max_bodies:
+        solved = exact_cover(matrix, costs, required)
+        if solved is not None:
+            exact, optimal = solved
+            if optimal:
+                chosen, method = exact, EXACT
+            elif costs[exact].sum() < costs[chosen].sum():
+                chosen, method = exact, TIME_LIMITED
+    return MinimalSet(df, matrix, labels, costs, chosen, method)
+
+
+def get_minimal_set(df, version=None, keep=(), kinds=None):
+    """Return ``minimal_set(df, keep, kinds)``, memoized per dataset version and options"""
+    kinds = tuple(kinds or COVERAGE_KINDS)
+    key = ('minimal_set', version or dataset_hash(df), tuple(sorted(keep)), kinds)
+    return derived_cache.get(key, lambda: minimal_set(df, keep, list(kinds)))
@@ -0,0 +1,54 @@
+"""Stakeholder-overlap engine for the governance network"""
+import numpy as np
+from scipy import sparse
+
+STAKEHOLDER_SEPARATOR = ', '
+
+
+def tokenize(value, separator=STAKEHOLDER_SEPARATOR):
+    """Split a comma-joined field into a set of tokens"""
+    if not isinstance(value, str):
+        return set()
+    return set(value.split(separator))
+
+
+def incidence_matrix(values, separator=STAKEHOLDER_SEPARATOR):
+    """Build a sparse body x token incidence matrix from comma-joined fields
+
+    Returns the CSR matrix and the token vocabulary (column labels).
+    """
+    vocabulary = {}
+    rows = []
+    cols = []
+    for row_idx, value in enumerate(values):
+        for token in tokenize(value, separator):
+            col_idx = vocabulary.setdefault(token, len(vocabulary))
+            rows.append(row_idx)
+            cols.append(col_idx)
+
+    data = np.ones(len(rows), dtype=np.int32)
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(len(values), len(vocabulary)))
+    return matrix, list(vocabulary)
+
+
+def overlap_counts(values, separator=STAKEHOLDER_SEPARATOR):
+    """Return the sparse upper-triangular matrix of pairwise shared-token counts"""
+    matrix, _ = incidence_matrix(values, separator)
+    counts = matrix @ matrix.T
+    return sparse.triu(counts, k=1).tocoo()
+
+
+def overlap_edges(names, values, separator=STAKEHOLDER_SEPARATOR):
+    """Return weighted edges between bodies that share at least one stakeholder
+
+    The result is a list of ``(name_a, name_b, {'weight': overlap})`` tuples in
+    row order, ready for ``nx.Graph.add_edges_from``.
+    """
+    names = list(names)
+    counts = overlap_counts(list(values), separator)
+    order = np.lexsort((counts.col, counts.row))
+    return [
+        (names[i], names[j], {'weight': int(w)})
+        for i, j, w in zip(counts.row[order], counts.col[order], counts.data[order])
+        if w > 0
+    ]
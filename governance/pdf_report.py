@@ -0,0 +1,211 @@
+"""ReportLab PDF report for the governance register
+
+Reports are cached by content; bump ``REPORT_FORMAT_VERSION`` in
+``governance.report_cache`` when changing what a report contains.
+"""
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from governance.alignment import principle_counts, principle_matrix
+from governance.costs import format_pounds, governance_costs, savings_summary
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+
+
+def create_pdf_report(df, report_date, progress=None):
+    """Generate comprehensive PDF report
+
+    ``progress(section, fraction)`` is called as each section is laid out.
+    """
+    if progress is None:
+        progress = lambda section, fraction: None
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72,
+                            topMargin=72, bottomMargin=18)
+    
+    # Container for the 'Flowable' objects
+    elements = []
+    
+    # Define styles
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='CustomTitle', parent=styles['Heading1'],
+                             fontSize=24, textColor=colors.HexColor('#1f77b4'),
+                             spaceAfter=30, alignment=TA_CENTER))
+    styles.add(ParagraphStyle(name='CustomHeading', parent=styles['Heading2'],
+                             fontSize=16, textColor=colors.HexColor('#1f77b4'),
+                             spaceAfter=12))
+    styles.add(ParagraphStyle(name='BodyJustify', parent=styles['BodyText'],
+                             alignment=TA_JUSTIFY, fontSize=11))
+    
+    # Title
+    title = Paragraph("Westminster City Council<br/>Governance Mapping & Analysis Report", styles['CustomTitle'])
+    elements.append(title)
+    elements.append(Spacer(1, 12))
+    
+    subtitle = Paragraph(f"Aligned with Fairer Westminster Principles<br/>Generated: {report_date}", 
+                        styles['Normal'])
+    elements.append(subtitle)
+    elements.append(Spacer(1, 24))
+    
+    # Executive Summary
+    progress("Executive summary", 0.05)
+    elements.append(Paragraph("Executive Summary", styles['CustomHeading']))
+    
+    summary_text = f"""
+    This report presents a comprehensive analysis of {len(df)} governance bodies at Westminster City Council, 
+    evaluated against the Fairer Westminster principles and assessed using multiple analytical frameworks 
+    including Rogers' Diffusion of Innovations, Schilling's Stakeholder Analysis, Smith's Knowledge Management, 
+    and Porter's Strategic Frameworks adapted for public sector use.
+    """
+    elements.append(Paragraph(summary_text, styles['BodyJustify']))
+    elements.append(Spacer(1, 12))
+    
+    # Key Findings
+    elements.append(Paragraph("Key Findings", styles['CustomHeading']))
+    
+    green_count = len(df[df['RAG_Status'] == 'Green'])
+    amber_count = len(df[df['RAG_Status'] == 'Amber'])
+    red_count = len(df[df['RAG_Status'] == 'Red'])
+    avg_efficiency = df['Efficiency_Score'].mean()
+    avg_value = df['Value_Added'].mean()
+    high_dup = len(df[df['Duplication_Risk'] >= 4])
+    
+    findings_data = [
+        ['Metric', 'Value'],
+        ['Total Governance Bodies', str(len(df))],
+        ['RAG Status - Green (Keep)', str(green_count)],
+        ['RAG Status - Amber (Review)', str(amber_count)],
+        ['RAG Status - Red (Urgent Action)', str(red_count)],
+        ['Average Efficiency Score', f"{avg_efficiency:.1f}/5"],
+        ['Average Value Added', f"{avg_value:.1f}/5"],
+        ['High Duplication Risk Bodies', str(high_dup)],
+    ]
+    
+    findings_table = Table(findings_data, colWidths=[4*inch, 2*inch])
+    findings_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    elements.append(findings_table)
+    elements.append(Spacer(1, 24))
+    
+    # Fairer Westminster Alignment
+    progress("Fairer Westminster alignment", 0.2)
+    elements.append(PageBreak())
+    elements.append(Paragraph("Fairer Westminster Principles Alignment", styles['CustomHeading']))
+    
+    fw_text = """
+    Westminster's governance has been assessed against the five Fairer Westminster principles:
+    """
+    elements.append(Paragraph(fw_text, styles['BodyJustify']))
+    elements.append(Spacer(1, 12))
+    
+    aligned_counts = principle_counts(principle_matrix(df))
+    for principle, description in FAIRER_WESTMINSTER_PRINCIPLES.items():
+        elements.append(Paragraph(f"<b>{principle}:</b> {description}", styles['Normal']))
+        elements.append(Spacer(1, 6))
+        
+        # Count bodies aligned with this principle
+        elements.append(Paragraph(f"Bodies aligned: {aligned_counts[principle]}", styles['Normal']))
+        elements.append(Spacer(1, 12))
+    
+    # Governance Bodies Detail
+    progress("Governance body assessments", 0.3)
+    elements.append(PageBreak())
+    elements.append(Paragraph("Governance Bodies Assessment", styles['CustomHeading']))
+    
+    for body_num, (_, row) in enumerate(df.iterrows(), start=1):
+        progress(f"Governance body assessments ({body_num}/{len(df)})", 0.3 + 0.5 * body_num / len(df))
+        rag_symbol = "GREEN" if row['RAG_Status'] == 'Green' else "AMBER" if row['RAG_Status'] == 'Amber' else "RED"
+        
+        elements.append(Paragraph(f"<b>{row['Name']}</b> - RAG: {rag_symbol}", styles['Heading3']))
+        
+        body_data = [
+            ['Attribute', 'Value'],
+            ['Type', row['Type']],
+            ['Level', row['Level']],
+            ['RAG Recommendation', row['RAG_Recommendation']],
+            ['Fairer Westminster Alignment', row['Fairer_Westminster_Alignment']],
+            ['Efficiency Score', f"{row['Efficiency_Score']}/5"],
+            ['Value Added', f"{row['Value_Added']}/5"],
+            ['Duplication Risk', f"{row['Duplication_Risk']}/5"],
+            ['Decision Speed', row['Decision_Speed']],
+            ['Primary Stakeholders', row['Primary_Stakeholders']],
+        ]
+        
+        body_table = Table(body_data, colWidths=[2.5*inch, 3.5*inch])
+        body_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        elements.append(body_table)
+        elements.append(Spacer(1, 16))
+    
+    # Recommendations
+    progress("Strategic recommendations", 0.85)
+    elements.append(PageBreak())
+    elements.append(Paragraph("Strategic Recommendations", styles['CustomHeading']))
+    
+    # Merge recommendations
+    merge_bodies = df[df['RAG_Recommendation'] == 'Merge']
+    if len(merge_bodies) > 0:
+        elements.append(Paragraph("<b>1. Consolidation Opportunities (MERGE)</b>", styles['Heading3']))
+        for _, row in merge_bodies.iterrows():
+            elements.append(Paragraph(f"• {row['Name']} - Duplication Risk: {row['Duplication_Risk']}/5", 
+                                     styles['Normal']))
+        elements.append(Spacer(1, 12))
+    
+    # Close recommendations
+    close_bodies = df[df['RAG_Recommendation'] == 'Close']
+    if len(close_bodies) > 0:
+        elements.append(Paragraph("<b>2. Bodies to Close</b>", styles['Heading3']))
+        for _, row in close_bodies.iterrows():
+            elements.append(Paragraph(f"• {row['Name']} - Low value or high cost", styles['Normal']))
+        elements.append(Spacer(1, 12))
+    
+    # Efficiency improvements
+    low_eff = df[df['Efficiency_Score'] < 3]
+    if len(low_eff) > 0:
+        elements.append(Paragraph("<b>3. Efficiency Improvement Priorities</b>", styles['Heading3']))
+        for _, row in low_eff.iterrows():
+            elements.append(Paragraph(f"• {row['Name']} - Current efficiency: {row['Efficiency_Score']}/5", 
+                                     styles['Normal']))
+        elements.append(Spacer(1, 12))
+    
+    # Estimated savings
+    elements.append(Paragraph("<b>4. Estimated Financial Impact</b>", styles['Heading3']))
+    savings, total_saving = savings_summary(governance_costs(df))
+    savings_lines = "<br/>".join(
+        f"• {label}: {format_pounds(saving)} annually" for label, saving in savings.items() if saving > 0
+    )
+    savings_text = f"""
+    Based on the cost model (attendee time, preparation and secretariat for each body):<br/>
+    {savings_lines}<br/><br/>
+    <b>Total Estimated Annual Savings: {format_pounds(total_saving)}</b>
+    """
+    elements.append(Paragraph(savings_text, styles['Normal']))
+    elements.append(Spacer(1, 24))
+    
+    # Build PDF
+    progress("Building PDF", 0.9)
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,305 @@
+"""Indexed filtering and a small query language over the bodies frame
+
+Queries combine conditions with AND, OR, NOT and parentheses::
+
+    Efficiency_Score<3 AND Cost_Impact in (High, Very High)
+    RAG_Status = Red OR (Duplication_Risk >= 4 AND NOT Level = Community)
+    Name ~ housing
+
+Categorical fields accept ``=``, ``!=``, ``in (...)`` and, using their
+category order, ``<``, ``<=``, ``>`` and ``>=``. Score fields accept the
+comparison operators. ``field ~ text`` is a case-insensitive substring
+match, and bare words match any of the text fields. A value with spaces is
+quoted, unless it names a category (``Cost_Impact = Very High``); words
+after a condition's value are searched for as bare words.
+"""
+import re
+
+import numpy as np
+
+from governance.metrics import dataset_hash, derived_cache
+from governance.schema import CATEGORIES, SCORE_COLUMNS
+
+TEXT_COLUMNS = [
+    'Name', 'Outcome_Focus', 'Primary_Stakeholders', 'Secondary_Stakeholders',
+    'Fairer_Westminster_Alignment', 'Value_Chain_Activities',
+]
+COMPARISONS = ['<=', '>=', '!=', '=', '<', '>']
+KEYWORDS = {'AND', 'OR', 'NOT', 'IN'}
+
+_TOKEN = re.compile(r'\s*(?:"([^"]*)"|\'([^\']*)\'|(<=|>=|!=|=|<|>|~|\(|\)|,)|([^\s(),<>=!~"\']+))')
+
+
+class QueryError(ValueError):
+    """Raised for a query that cannot be parsed or names an unknown field"""
+
+
+class BodyIndex:
+    """Per-value bitmaps for categorical fields and sorted indexes for scores
+
+    Every lookup returns a boolean bitmap aligned with the frame's rows, so
+    filter combinations resolve by intersecting bitmaps instead of
+    re-scanning columns.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.size = len(df)
+        self.columns = {column.lower(): column for column in df.columns}
+        self.bitmaps = {}
+        for column in CATEGORIES:
+            if column in df.columns:
+                codes = df[column].cat.codes.to_numpy()
+                self.bitmaps[column] = {
+                    category: codes == code for code, category in enumerate(df[column].cat.categories)
+                }
+        self.sorted = {}
+        for column in SCORE_COLUMNS:
+            if column in df.columns:
+                values = df[column].to_numpy(dtype=float, na_value=np.nan)
+                order = np.argsort(values, kind='stable')
+                self.sorted[column] = (order, values[order])
+
+    def all(self):
+        return np.ones(self.size, dtype=bool)
+
+    def none(self):
+        return np.zeros(self.size, dtype=bool)
+
+    def field(self, name):
+        column = self.columns.get(name.lower())
+        if column is None:
+            raise QueryError(f"Unknown field '{name}'")
+        return column
+
+    def category(self, column, value):
+        """Return the category of ``column`` matching ``value`` regardless of case"""
+        lowered = str(value).lower()
+        return next((category for category in self.bitmaps[column] if category.lower() == lowered), value)
+
+    def isin(self, column, values):
+        """Bitmap of rows whose categorical ``column`` is any of ``values``"""
+        bitmaps = self.bitmaps[column]
+        result = self.none()
+        for value in values:
+            value = self.category(column, value)
+            if value in bitmaps:
+                result |= bitmaps[value]
+        return result
+
+    def score_range(self, column, low=-np.inf, high=np.inf, include_low=True, include_high=True):
+        """Bitmap of rows whose score lies between ``low`` and ``high``"""
+        order, values = self.sorted[column]
+        start = np.searchsorted(values, low, side='left' if include_low else 'right')
+        stop = np.searchsorted(values, high, side='right' if include_high else 'left')
+        result = self.none()
+        result[order[start:stop]] = True
+        return result
+
+    def compare(self, column, op, value):
+        """Bitmap of rows where ``column <op> value``"""
+        if column in self.sorted:
+            try:
+                number = float(value)
+            except ValueError:
+                raise QueryError(f"{column} needs a number, not '{value}'") from None
+            if op == '=':
+                return self.score_range(column, number, number)
+            if op == '!=':
+                return ~self.score_range(column, number, number) & ~self._missing(column)
+            if op in ('<', '<='):
+                return self.score_range(column, high=number, include_high=op == '<=')
+            return self.score_range(column, low=number, include_low=op == '>=')
+
+        if column in self.bitmaps:
+            categories = list(self.bitmaps[column])
+            match = self.category(column, value)
+            if op == '=':
+                return self.isin(column, [match])
+            if op == '!=':
+                return self.isin(column, [category for category in categories if category != match])
+            if match not in categories:
+                raise QueryError(f"'{value}' is not a {column} value")
+            position = categories.index(match)
+            selected = {
+                '<': categories[:position], '<=': categories[:position + 1],
+                '>': categories[position + 1:], '>=': categories[position:],
+            }[op]
+            return self.isin(column, selected)
+
+        text = self.df[column].astype(str).str.lower()
+        if op == '=':
+            return (text == value.lower()).to_numpy()
+        if op == '!=':
+            return (text != value.lower()).to_numpy()
+        raise QueryError(f"'{op}' is not supported for text field {column}")
+
+    def _missing(self, column):
+        order, values = self.sorted[column]
+        result = self.none()
+        result[order[np.isnan(values)]] = True
+        return result
+
+    def contains(self, text, columns=None):
+        """Bitmap of rows where any of ``columns`` contains ``text`` (case-insensitive)"""
+        result = self.none()
+        for column in columns or TEXT_COLUMNS:
+            if column in self.df.columns:
+                result |= self.df[column].astype(str).str.contains(text, case=False, regex=False).to_numpy()
+        return result
+
+    def filter(self, **selections):
+        """Intersect ``column=[allowed values]`` selections into one bitmap"""
+        result = self.all()
+        for column, values in selections.items():
+            if len(values) < len(self.bitmaps[column]):
+                result &= self.isin(column, values)
+        return result
+
+    def query(self, text):
+        """Evaluate a query string into a bitmap; an empty query matches every row"""
+        if not text.strip():
+            return self.all()
+        return _Parser(self, text).parse()
+
+
+def get_body_index(df, version=None):
+    """Return the ``BodyIndex`` for ``df``, built once per dataset version"""
+    return derived_cache.get(('body_index', version or dataset_hash(df)), lambda: BodyIndex(df))
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise QueryError(f"Unexpected character at position {position + 1}")
+        quoted = match.group(1) if match.group(1) is not None else match.group(2)
+        if quoted is not None:
+            tokens.append(('value', quoted))
+        elif match.group(3):
+            tokens.append(('symbol', match.group(3)))
+        else:
+            word = match.group(4)
+            kind = 'keyword' if word.upper() in KEYWORDS else 'word'
+            tokens.append((kind, word.upper() if kind == 'keyword' else word))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser evaluating straight to bitmaps"""
+
+    def __init__(self, index, text):
+        self.index = index
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def peek(self, offset=0):
+        position = self.position + offset
+        return self.tokens[position] if position < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        token = self.peek()
+        if token[0] is None or (kind and token[0] != kind) or (value and token[1] != value):
+            expected = value or kind or 'more input'
+            raise QueryError(f"Expected {expected}, found {token[1] or 'end of query'}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        result = self.expression()
+        if self.peek()[0] is not None:
+            raise QueryError(f"Unexpected '{self.peek()[1]}'")
+        return result
+
+    def expression(self):
+        result = self.term()
+        while self.peek() == ('keyword', 'OR'):
+            self.take()
+            result = result | self.term()
+        return result
+
+    def term(self):
+        result = self.factor()
+        while True:
+            token = self.peek()
+            if token == ('keyword', 'AND'):
+                self.take()
+            elif token[0] in ('word', 'value') or token in (('keyword', 'NOT'), ('symbol', '(')):
+                pass  # adjacent conditions are implicitly ANDed
+            else:
+                return result
+            result = result & self.factor()
+
+    def factor(self):
+        token = self.peek()
+        if token == ('keyword', 'NOT'):
+            self.take()
+            return ~self.factor()
+        if token == ('symbol', '('):
+            self.take()
+            result = self.expression()
+            self.take('symbol', ')')
+            return result
+        if token[0] == 'value':
+            self.take()
+            return self.index.contains(token[1])
+
+        word = self.take('word')[1]
+        following = self.peek()
+        if following == ('keyword', 'IN'):
+            self.take()
+            column = self.categorical(word)
+            self.take('symbol', '(')
+            values = [self.value(in_list=True)]
+            while self.peek() == ('symbol', ','):
+                self.take()
+                values.append(self.value(in_list=True))
+            self.take('symbol', ')')
+            return self.index.isin(column, values)
+        if following[0] == 'symbol' and following[1] in COMPARISONS:
+            self.take()
+            column = self.index.field(word)
+            return self.index.compare(column, following[1], self.value(column))
+        if following == ('symbol', '~'):
+            self.take()
+            return self.index.contains(self.value(), [self.index.field(word)])
+        return self.index.contains(word)
+
+    def categorical(self, name):
+        column = self.index.field(name)
+        if column not in self.index.bitmaps:
+            raise QueryError(f"'in' needs a categorical field, not {column}")
+        return column
+
+    def value(self, column=None, in_list=False):
+        """A quoted string, or bare words up to the end of the condition
+
+        In an ``in (...)`` list the bare words up to the next comma are joined
+        with spaces. Elsewhere a bare value is one word, or for a categorical
+        ``column`` the longest run of words naming one of its values (such as
+        ``Very High``); the words after it are left as free-text terms.
+        """
+        if self.peek()[0] == 'value':
+            return self.take()[1]
+        words = [self.take('word')[1]]
+        while self.peek(len(words) - 1)[0] == 'word' and not self._starts_condition(len(words) - 1):
+            words.append(self.peek(len(words) - 1)[1])
+        count = 1
+        if in_list:
+            count = len(words)
+        elif column in self.index.bitmaps:
+            categories = {category.lower() for category in self.index.bitmaps[column]}
+            count = max((n for n in range(1, len(words) + 1) if ' '.join(words[:n]).lower() in categories), default=1)
+        self.position += count - 1
+        return ' '.join(words[:count])
+
+    def _starts_condition(self, offset):
+        """Whether the word at ``offset`` is a field name followed by an operator"""
+        following = self.peek(offset + 1)
+        return following in (('symbol', '~'), ('keyword', 'IN')) or (
+            following[0] == 'symbol' and following[1] in COMPARISONS
+        )
@@ -0,0 +1,181 @@
+"""Declarative, vectorised RAG scoring with per-body explanation traces
+
+Each body gets a weighted score from 0 (worst) to 1 (best) over five
+factors, which the thresholds turn into a status. Rules then adjust the
+result: ``cap`` limits how good the status can be and ``recommend`` sets the
+recommendation (the first matching rule wins). Rule conditions use the
+query language of ``governance.query``, so every rule compiles to one
+bitmap over the whole register.
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+
+from governance.metrics import COST_SCALE, SPEED_SCALE
+from governance.query import get_body_index
+from governance.schema import CATEGORIES, ordinal
+
+RAG_LEVELS = CATEGORIES['RAG_Status']   # best to worst
+
+# Factor column -> (label, function mapping the column to 0 (worst) .. 1 (best))
+RAG_FACTORS = {
+    'Efficiency_Score': ("Efficiency", lambda values: (values - 1) / 4),
+    'Value_Added': ("Value Added", lambda values: (values - 1) / 4),
+    'Duplication_Risk': ("Duplication Risk", lambda values: (5 - values) / 4),
+    'Cost_Impact': ("Cost Impact", lambda values: (4 - ordinal(values, COST_SCALE)) / 3),
+    'Decision_Speed': ("Decision Speed", lambda values: (3 - ordinal(values, SPEED_SCALE)) / 2),
+}
+
+DEFAULT_RAG_CONFIG = {
+    'weights': {
+        'Efficiency_Score': 0.30,
+        'Value_Added': 0.35,
+        'Duplication_Risk': 0.20,
+        'Cost_Impact': 0.10,
+        'Decision_Speed': 0.05,
+    },
+    # Minimum weighted score for each status; anything lower is Red
+    'thresholds': {'Green': 0.65, 'Amber': 0.30},
+    'recommendations': {'Green': 'Keep', 'Amber': 'Keep', 'Red': 'Close'},
+    'rules': [
+        {'name': "Severe duplication", 'when': "Duplication_Risk >= 5", 'cap': 'Red'},
+        {'name': "Duplicated remit", 'when': "Duplication_Risk >= 4", 'recommend': 'Merge'},
+        {'name': "Low value for its cost", 'when': "Value_Added <= 2 AND Cost_Impact >= High", 'cap': 'Amber'},
+    ],
+}
+
+
+def default_rag_config():
+    """A fresh, editable copy of the default configuration"""
+    return copy.deepcopy(DEFAULT_RAG_CONFIG)
+
+
+class RagResult:
+    """Scores, statuses and recommendations for a whole register, with traces"""
+
+    def __init__(self, df, config, factors, weights, score, status, recommendation, fired, recommended_by):
+        self.df = df
+        self.config = config
+        self.factors = factors                  # body x factor, 0..1
+        self.weights = weights                  # normalised factor weights
+        self.score = score
+        self.status = status
+        self.recommendation = recommendation
+        self.fired = fired                      # body x rule name, bool
+        self.recommended_by = recommended_by    # rule name or None per body
+
+    @property
+    def frame(self):
+        return pd.DataFrame({
+            'RAG_Score': self.score,
+            'RAG_Status': self.status,
+            'RAG_Recommendation': self.recommendation,
+        }, index=self.df.index)
+
+    def changes(self):
+        """Bodies whose computed status or recommendation differs from the stored one"""
+        computed = self.frame
+        differs = (
+            computed['RAG_Status'].ne(self.df['RAG_Status'].astype(object)) |
+            computed['RAG_Recommendation'].ne(self.df['RAG_Recommendation'].astype(object))
+        )
+        return computed[differs]
+
+    def explain(self, body_id):
+        """Return the explanation trace for one body as a list of lines"""
+        position = self.df.index.get_loc(body_id)
+        row = self.df.iloc[position]
+        thresholds = self.config['thresholds']
+        base_status = RAG_LEVELS[int(_severity(self.score[position], thresholds))]
+
+        lines = [
+            f"Weighted score {self.score[position]:.2f} → {base_status} "
+            f"(Green ≥ {thresholds['Green']:.2f}, Amber ≥ {thresholds['Amber']:.2f})"
+        ]
+        for column, weight in self.weights.items():
+            value = self.factors[column].iloc[position]
+            lines.append(
+                f"• {RAG_FACTORS[column][0]}: {row[column]} → {value:.2f} × weight {weight:.2f} = {value * weight:.2f}"
+            )
+        for rule in self.config['rules']:
+            if not self.fired[rule['name']].iloc[position]:
+                continue
+            effects = []
+            if rule.get('cap'):
+                effects.append(f"status no better than {rule['cap']}")
+            if rule.get('recommend'):
+                effects.append(f"recommend {rule['recommend']}")
+            lines.append(f"Rule '{rule['name']}' ({rule['when']}): {', '.join(effects)}")
+        source = (
+            f"rule '{self.recommended_by[position]}'" if self.recommended_by[position]
+            else f"default for {self.status[position]}"
+        )
+        lines.append(f"Result: {self.status[position]}, recommendation {self.recommendation[position]} ({source})")
+        return lines
+
+
+def _severity(score, thresholds):
+    """0 (Green), 1 (Amber) or 2 (Red) for each score"""
+    return np.where(score >= thresholds['Green'], 0, np.where(score >= thresholds['Amber'], 1, 2))
+
+
+def validate_rules(rules):
+    """Raise ``ValueError`` unless every rule has a unique, non-empty name and a condition
+
+    Rules are keyed by name in the result's ``fired`` table and its traces.
+    """
+    seen = set()
+    for number, rule in enumerate(rules, start=1):
+        name = rule.get('name')
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Rule {number} needs a name")
+        if name in seen:
+            raise ValueError(f"Rule name '{name}' is used more than once")
+        seen.add(name)
+        when = rule.get('when')
+        if not isinstance(when, str) or not when.strip():
+            raise ValueError(f"Rule '{name}' needs a condition")
+
+
+def score_rag(df, config=None, version=None):
+    """Score every body in ``df`` in one vectorised pass
+
+    Raises ``ValueError`` for an invalid configuration and ``QueryError``
+    for a rule condition that cannot be parsed.
+    """
+    config = config or DEFAULT_RAG_CONFIG
+    validate_rules(config['rules'])
+    total_weight = sum(config['weights'].values())
+    if total_weight <= 0:
+        raise ValueError("At least one factor needs a positive weight")
+    weights = {column: weight / total_weight for column, weight in config['weights'].items() if weight > 0}
+
+    factors = pd.DataFrame(
+        {column: RAG_FACTORS[column][1](df[column]).astype(float) for column in weights},
+        index=df.index,
+    ).clip(0, 1)
+    score = factors.fillna(0).to_numpy().dot(np.array(list(weights.values())))
+
+    severity = _severity(score, config['thresholds'])
+    index = get_body_index(df, version)
+    fired = {}
+    for rule in config['rules']:
+        mask = index.query(rule['when'])
+        fired[rule['name']] = mask
+        if rule.get('cap'):
+            if rule['cap'] not in RAG_LEVELS:
+                raise ValueError(f"Rule '{rule['name']}' caps at unknown status '{rule['cap']}'")
+            severity = np.maximum(severity, np.where(mask, RAG_LEVELS.index(rule['cap']), 0))
+
+    status = np.array(RAG_LEVELS, dtype=object)[severity]
+    recommendation = np.array([config['recommendations'][level] for level in RAG_LEVELS], dtype=object)[severity]
+    recommended_by = np.full(len(df), None, dtype=object)
+    for rule in reversed(config['rules']):
+        if rule.get('recommend'):
+            mask = fired[rule['name']]
+            recommendation = np.where(mask, rule['recommend'], recommendation)
+            recommended_by = np.where(mask, rule['name'], recommended_by)
+
+    fired = pd.DataFrame(fired, index=df.index, columns=[rule['name'] for rule in config['rules']])
+    return RagResult(df, config, factors, weights, score, status, recommendation, fired, recommended_by)
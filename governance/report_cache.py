@@ -0,0 +1,100 @@
+"""Content-addressed cache for generated PDF reports"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+REPORT_CACHE_DIR_ENV = "GOVERNANCE_REPORT_CACHE_DIR"
+# Part of every report's key: bump it whenever governance/pdf_report.py changes what a
+# report contains, so reports cached on disk before the change are not served again
+REPORT_FORMAT_VERSION = 2
+
+
+def content_hash(df, five_forces, options=None):
+    """Return a SHA-256 digest of the report format, dataset, five forces and report options"""
+    digest = hashlib.sha256()
+    digest.update(f"report-format:{REPORT_FORMAT_VERSION}".encode('utf-8'))
+    digest.update(json.dumps(list(map(str, df.columns))).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    digest.update(json.dumps(five_forces, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(json.dumps(options or {}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ReportCache:
+    """Two-tier LRU cache of report bytes: in memory, optionally backed by disk
+
+    The disk tier keeps at most ``max_disk_entries`` files and evicts the least
+    recently read, so cached reports survive app restarts.
+    """
+
+    def __init__(self, maxsize=8, cache_dir=None, max_disk_entries=64):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+
+        with open(self._path(key), 'rb') as f:
+            data = f.read()
+        os.utime(self._path(key))
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        self._remember(key, data)
+        if self.cache_dir:
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+            self._prune_disk()
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _prune_disk(self):
+        files = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith('.pdf')
+        ]
+        files.sort(key=os.path.getmtime)
+        for path in files[:max(0, len(files) - self.max_disk_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def get_or_build(self, key, build):
+        """Return cached bytes for ``key``, calling ``build()`` on a miss"""
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,78 @@
+"""Background PDF report generation with per-section progress"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class ReportJob:
+    """State of one report build, updated from the worker thread"""
+
+    def __init__(self, key):
+        self.key = key
+        self.status = QUEUED
+        self.section = "Waiting for a worker"
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+
+    def update(self, section, progress):
+        self.section = section
+        self.progress = min(max(progress, 0.0), 1.0)
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+
+class ReportJobQueue:
+    """Thread pool that builds reports off the Streamlit script thread
+
+    Jobs are keyed by report content hash, so repeated requests for the same
+    report share one build, and finished reports go into the report cache.
+    """
+
+    def __init__(self, cache, max_workers=2):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, build):
+        """Queue ``build(progress)`` unless the report is cached or already in progress"""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status != FAILED:
+                return job
+
+            job = ReportJob(key)
+            self._jobs[key] = job
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            job.result = cached
+            job.update("Complete", 1.0)
+            job.status = DONE
+            return job
+
+        self._executor.submit(self._run, job, build)
+        return job
+
+    def _run(self, job, build):
+        job.status = RUNNING
+        try:
+            job.result = build(job.update)
+            self.cache.put(job.key, job.result)
+            job.update("Complete", 1.0)
+            job.status = DONE
+        except Exception as exc:
+            job.error = str(exc)
+            job.status = FAILED
+        finally:
+            # The cache holds finished reports; only in-flight jobs stay here
+            with self._lock:
+                if job.status == DONE and self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
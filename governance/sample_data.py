@@ -0,0 +1,191 @@
+"""Westminster example dataset and Fairer Westminster pillar definitions"""
+
+# Enhanced sample data with Fairer Westminster alignment and RAG status
+SAMPLE_DATA = {
+    "governance_bodies": [
+        {
+            "Name": "Cabinet", 
+            "Type": "Cabinet", 
+            "Level": "Strategic",
+            "Outcome_Focus": "Fairer Westminster, Service Efficiency",
+            "Fairer_Westminster_Alignment": "Fairer Council, Fairer Communities",
+            "Process_Type": "Explicit",
+            "Efficiency_Score": 4,
+            "Cost_Impact": "Very High",
+            "Value_Added": 5,
+            "Duplication_Risk": 1,
+            "RAG_Status": "Green",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "Council Members, Chief Executive, Directors",
+            "Secondary_Stakeholders": "Residents, Media, Government",
+            "Stakeholder_Power": "High",
+            "Stakeholder_Interest": "High",
+            "Value_Chain_Activities": "Strategic Decision-Making, Resource Allocation, Policy Setting",
+            "Decision_Speed": "Slow",
+            "Innovation_Posture": "Ambidextrous"
+        },
+        {
+            "Name": "Commercial Gateway Review Board",
+            "Type": "Board",
+            "Level": "Tactical",
+            "Outcome_Focus": "Service Efficiency",
+            "Fairer_Westminster_Alignment": "Fairer Economy",
+            "Process_Type": "Mixed",
+            "Efficiency_Score": 2,
+            "Cost_Impact": "High",
+            "Value_Added": 3,
+            "Duplication_Risk": 4,
+            "RAG_Status": "Amber",
+            "RAG_Recommendation": "Merge",
+            "Primary_Stakeholders": "Procurement, Finance, Legal",
+            "Secondary_Stakeholders": "Suppliers, Service Directors",
+            "Stakeholder_Power": "Medium",
+            "Stakeholder_Interest": "High",
+            "Value_Chain_Activities": "Procurement Approval, Contract Review, Risk Assessment",
+            "Decision_Speed": "Slow",
+            "Innovation_Posture": "Exploit"
+        },
+        {
+            "Name": "Procuring Board",
+            "Type": "Board",
+            "Level": "Tactical",
+            "Outcome_Focus": "Service Efficiency",
+            "Fairer_Westminster_Alignment": "Fairer Economy",
+            "Process_Type": "Partially Explicit",
+            "Efficiency_Score": 3,
+            "Cost_Impact": "High",
+            "Value_Added": 3,
+            "Duplication_Risk": 5,
+            "RAG_Status": "Red",
+            "RAG_Recommendation": "Merge",
+            "Primary_Stakeholders": "Procurement, Finance, Commercial",
+            "Secondary_Stakeholders": "Suppliers, Market",
+            "Stakeholder_Power": "Medium",
+            "Stakeholder_Interest": "High",
+            "Value_Chain_Activities": "Procurement Strategy, Supplier Management, Contract Awards",
+            "Decision_Speed": "Slow",
+            "Innovation_Posture": "Exploit"
+        },
+        {
+            "Name": "Church Street JV Board",
+            "Type": "Place-Based Board",
+            "Level": "Community",
+            "Outcome_Focus": "Place-Based, Fairer Westminster, Housing",
+            "Fairer_Westminster_Alignment": "Fairer Council, Fairer Housing, Fairer Communities",
+            "Process_Type": "Mixed",
+            "Efficiency_Score": 3,
+            "Cost_Impact": "Medium",
+            "Value_Added": 4,
+            "Duplication_Risk": 2,
+            "RAG_Status": "Green",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "Local Residents, Community Groups, Housing",
+            "Secondary_Stakeholders": "Developers, GLA, Councillors",
+            "Stakeholder_Power": "Medium",
+            "Stakeholder_Interest": "Very High",
+            "Value_Chain_Activities": "Community Engagement, Local Decision-Making, Project Approval",
+            "Decision_Speed": "Medium",
+            "Innovation_Posture": "Explore"
+        },
+        {
+            "Name": "Climate Leadership Group",
+            "Type": "Board",
+            "Level": "Tactical",
+            "Outcome_Focus": "Net Zero, Place-Based",
+            "Fairer_Westminster_Alignment": "Fairer Environment",
+            "Process_Type": "Explicit",
+            "Efficiency_Score": 4,
+            "Cost_Impact": "Medium",
+            "Value_Added": 5,
+            "Duplication_Risk": 1,
+            "RAG_Status": "Green",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "Environment Team, Cabinet, Service Directors",
+            "Secondary_Stakeholders": "Residents, Climate Activists, Government",
+            "Stakeholder_Power": "High",
+            "Stakeholder_Interest": "Very High",
+            "Value_Chain_Activities": "Climate Strategy, Carbon Monitoring, Innovation Projects",
+            "Decision_Speed": "Medium",
+            "Innovation_Posture": "Ambidextrous"
+        },
+        {
+            "Name": "Joint Health and Wellbeing Board",
+            "Type": "Board",
+            "Level": "Strategic",
+            "Outcome_Focus": "Public Health, Fairer Westminster",
+            "Fairer_Westminster_Alignment": "Fairer Communities, Fairer Housing",
+            "Process_Type": "Explicit",
+            "Efficiency_Score": 3,
+            "Cost_Impact": "High",
+            "Value_Added": 5,
+            "Duplication_Risk": 2,
+            "RAG_Status": "Green",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "NHS, Public Health, Adult Social Care",
+            "Secondary_Stakeholders": "GPs, Residents, Voluntary Sector",
+            "Stakeholder_Power": "High",
+            "Stakeholder_Interest": "High",
+            "Value_Chain_Activities": "Health Strategy, Service Integration, Commissioning",
+            "Decision_Speed": "Slow",
+            "Innovation_Posture": "Ambidextrous"
+        },
+        {
+            "Name": "Digital Governance Board",
+            "Type": "Board",
+            "Level": "Tactical",
+            "Outcome_Focus": "Digital Transformation, Service Efficiency",
+            "Fairer_Westminster_Alignment": "Fairer Council, Fairer Communities",
+            "Process_Type": "Explicit",
+            "Efficiency_Score": 4,
+            "Cost_Impact": "High",
+            "Value_Added": 4,
+            "Duplication_Risk": 1,
+            "RAG_Status": "Green",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "IT, Digital Services, Service Directors",
+            "Secondary_Stakeholders": "Residents, Staff, Suppliers",
+            "Stakeholder_Power": "Medium",
+            "Stakeholder_Interest": "High",
+            "Value_Chain_Activities": "Technology Strategy, Project Approval, Standards Setting",
+            "Decision_Speed": "Fast",
+            "Innovation_Posture": "Explore"
+        },
+        {
+            "Name": "Beyond Lisson Grove Board",
+            "Type": "Place-Based Board",
+            "Level": "Community",
+            "Outcome_Focus": "Place-Based, Fairer Westminster, Community Safety",
+            "Fairer_Westminster_Alignment": "Fairer Council, Fairer Communities, Fairer Economy",
+            "Process_Type": "Mixed",
+            "Efficiency_Score": 2,
+            "Cost_Impact": "Low",
+            "Value_Added": 4,
+            "Duplication_Risk": 2,
+            "RAG_Status": "Amber",
+            "RAG_Recommendation": "Keep",
+            "Primary_Stakeholders": "Local Residents, Community Leaders, Housing",
+            "Secondary_Stakeholders": "Police, Youth Services, Councillors",
+            "Stakeholder_Power": "Low",
+            "Stakeholder_Interest": "Very High",
+            "Value_Chain_Activities": "Community Engagement, Local Priorities, Project Approval",
+            "Decision_Speed": "Medium",
+            "Innovation_Posture": "Explore"
+        }
+    ],
+    "five_forces": {
+        "Threat of New Entrants": 3,
+        "Bargaining Power of Stakeholders": 4,
+        "Threat of Alternative Models": 2,
+        "Pressure for Accountability": 5,
+        "Resource Competition": 4
+    }
+}
+
+# Fairer Westminster principles - The five key pillars
+FAIRER_WESTMINSTER_PRINCIPLES = {
+    "Fairer Communities": "Reducing inequality, enhancing safety (including doubling CCTV), and improving access to education and culture",
+    "Fairer Housing": "Delivering greener, more affordable, and social housing (70% on council-owned developments) and reducing homelessness",
+    "Fairer Economy": "Supporting local businesses, boosting high streets, and promoting inclusive growth for all residents",
+    "Fairer Environment": "Targeting net-zero for council by 2030 and city by 2040 through sustainability, air quality improvements, and climate action",
+    "Fairer Council": "Listening to and acting on resident feedback through citizens' assemblies and participatory, transparent decision-making"
+}
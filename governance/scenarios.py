@@ -0,0 +1,274 @@
+"""What-if merge and close scenarios, evaluated without touching the register
+
+A scenario closes some bodies and merges groups of others into the first body
+of each group, which keeps its own scores and meetings and takes on the union
+of the group's stakeholders and principle alignment. The engine builds the
+register's stakeholder adjacency and principle matrices once; a scenario is
+then a sparse matrix folding merged rows together and dropping closed ones,
+so each evaluation is a few sparse products rather than a rebuilt frame.
+Batches of scenarios can be spread over a ``ScenarioPool``, whose worker
+processes receive the engine once when they start.
+"""
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from governance.alignment import principle_matrix
+from governance.costs import governance_costs, member_count
+from governance.metrics import dataset_hash, derived_cache
+from governance.overlap import incidence_matrix
+
+# Smaller batches are evaluated in-process; a pool would cost more to start
+PARALLEL_MIN_SCENARIOS = 50
+SCENARIO_CHUNK_SIZE = 25
+MAX_CANDIDATES = 500
+# Dataset versions a ScenarioPool keeps workers for at once
+POOL_MAX_ENGINES = 2
+
+
+class Scenario:
+    """Merge groups and closures of body ids; the first body of a group survives"""
+
+    def __init__(self, merges=(), closes=(), name=None):
+        self.merges = [list(group) for group in merges if len(group) > 1]
+        self.closes = list(closes)
+        self.name = name
+
+    def validate(self, index):
+        """Raise ``ValueError`` if the scenario cannot be applied to bodies with ids ``index``"""
+        seen = set()
+        for body_id in [body_id for group in self.merges for body_id in group] + self.closes:
+            if body_id not in index:
+                raise ValueError(f"Body {body_id} is not in the register")
+            if body_id in seen:
+                raise ValueError(f"Body {body_id} appears in more than one operation")
+            seen.add(body_id)
+
+    def describe(self, names):
+        """One-line summary using ``names`` (body id -> name)"""
+        parts = [f"Merge {' + '.join(names[body_id] for body_id in group)}" for group in self.merges]
+        if self.closes:
+            parts.append(f"Close {', '.join(names[body_id] for body_id in self.closes)}")
+        return '; '.join(parts) or "No change"
+
+
+class ScenarioEngine:
+    """Precomputed register matrices that scenarios are evaluated against
+
+    ``version`` identifies the dataset version the engine was built from.
+    """
+
+    def __init__(self, df, version=None):
+        self.df = df
+        self.version = version or dataset_hash(df)
+        self.names = dict(zip(df.index, df['Name']))
+        self.stakeholders, _ = incidence_matrix(list(df['Primary_Stakeholders']))
+        # Bodies sharing a stakeholder; a merged body shares one with anything its members did
+        self.adjacency = (self.stakeholders @ self.stakeholders.T).astype(bool).astype(np.int32)
+        principles = principle_matrix(df)
+        self.principle_names = list(principles.columns)
+        self.principles = sparse.csr_matrix(principles.to_numpy(dtype=np.int8))
+        costs = governance_costs(df)
+        self.costs = costs['Annual_Cost'].to_numpy()
+        self.member_costs = costs['Member_Cost'].to_numpy()
+        self.fixed_costs = (costs['Annual_Cost'] - costs['Members'] * costs['Member_Cost']).to_numpy()
+        self.efficiency = df['Efficiency_Score'].to_numpy(dtype=float)
+        self.value = df['Value_Added'].to_numpy(dtype=float)
+        self.duplication = df['Duplication_Risk'].to_numpy(dtype=float)
+        self.baseline_cost = float(self.costs.sum())
+        self.baseline_covered = np.asarray(self.principles.sum(axis=0)).ravel() > 0
+        self.baseline = self.evaluate(Scenario(name="Current register"))
+
+    def _positions(self, ids):
+        return self.df.index.get_indexer(ids)
+
+    def evaluate(self, scenario):
+        """Return the scenario's metrics as a dict (see ``SCENARIO_METRICS``)"""
+        scenario.validate(self.df.index)
+        count = len(self.df)
+
+        # Each body maps to the row it ends up in: itself, its group's survivor, or none
+        target = np.arange(count)
+        target[self._positions(scenario.closes)] = -1
+        survivors = []
+        for group in scenario.merges:
+            positions = self._positions(group)
+            target[positions] = positions[0]
+            survivors.append(positions[0])
+        kept = np.flatnonzero(target == np.arange(count))
+        row = np.full(count, -1)
+        row[kept] = np.arange(len(kept))
+        members = np.flatnonzero(target >= 0)
+        fold = sparse.csr_matrix(
+            (np.ones(len(members), dtype=np.int32), (row[target[members]], members)), shape=(len(kept), count)
+        )
+
+        shared = sparse.triu(fold @ self.adjacency @ fold.T, k=1, format='csr')
+        edges = shared.count_nonzero()
+        components = connected_components(shared, directed=False)[0] if len(kept) else 0
+        covered = np.asarray((fold @ self.principles).sum(axis=0)).ravel() > 0
+
+        # A merged body keeps its survivor's meetings, attended by the union of the groups' stakeholders
+        costs = self.costs[kept].copy()
+        if survivors:
+            groups = np.diff((fold[row[survivors]] @ self.stakeholders).tocsr().indptr)
+            costs[row[survivors]] = member_count(groups) * self.member_costs[survivors] + self.fixed_costs[survivors]
+
+        unmerged = np.setdiff1d(kept, survivors)
+        pairs = len(kept) * (len(kept) - 1) / 2
+        annual_cost = float(costs.sum())
+        return {
+            'Scenario': scenario.name or scenario.describe(self.names),
+            'Bodies': int(len(kept)),
+            'Merged': sum(len(group) for group in scenario.merges),
+            'Closed': len(scenario.closes),
+            'Avg_Efficiency': float(self.efficiency[kept].mean()) if len(kept) else np.nan,
+            'Avg_Value_Added': float(self.value[kept].mean()) if len(kept) else np.nan,
+            'High_Duplication': int((self.duplication[unmerged] >= 4).sum()),
+            'Network_Density': edges / pairs if pairs else 0.0,
+            'Components': int(components),
+            'Principles_Covered': int(covered.sum()),
+            'Principles_Lost': ', '.join(
+                name for name, was, now in zip(self.principle_names, self.baseline_covered, covered) if was and not now
+            ),
+            'Annual_Cost': annual_cost,
+            'Saving': self.baseline_cost - annual_cost,
+        }
+
+
+SCENARIO_METRICS = [
+    'Scenario', 'Bodies', 'Merged', 'Closed', 'Avg_Efficiency', 'Avg_Value_Added', 'High_Duplication',
+    'Network_Density', 'Components', 'Principles_Covered', 'Principles_Lost', 'Annual_Cost', 'Saving',
+]
+
+
+def get_scenario_engine(df, version=None):
+    """Return a ``ScenarioEngine`` for ``df``, memoized per dataset version"""
+    version = version or dataset_hash(df)
+    return derived_cache.get(('scenario_engine', version), lambda: ScenarioEngine(df, version))
+
+
+def _evaluate_chunk(engine, scenarios):
+    return [engine.evaluate(scenario) for scenario in scenarios]
+
+
+# The engine a pool worker process was started with
+_worker_engine = None
+
+
+def _init_worker(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _evaluate_specs(specs):
+    return _evaluate_chunk(_worker_engine, [Scenario(merges, closes, name) for merges, closes, name in specs])
+
+
+class ScenarioPool:
+    """Worker processes for scenario batches, each given the engine once when it starts
+
+    Tasks then carry only the scenarios' merge groups and closures. Workers
+    are kept for the ``max_engines`` most recently used dataset versions, so
+    sessions on different versions reuse their own workers rather than
+    replacing each other's. The workers of the least recently used version
+    are shut down; they finish any work already submitted and exit.
+    """
+
+    def __init__(self, max_workers, mp_context=None, max_engines=POOL_MAX_ENGINES):
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.max_engines = max_engines
+        self._executors = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def versions(self):
+        """Dataset versions with running workers, least recently used first"""
+        with self._lock:
+            return list(self._executors)
+
+    def submit(self, engine, specs):
+        with self._lock:
+            executor = self._executors.get(engine.version)
+            if executor is None:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self.mp_context,
+                    initializer=_init_worker, initargs=(engine,),
+                )
+                self._executors[engine.version] = executor
+                while len(self._executors) > self.max_engines:
+                    _, evicted = self._executors.popitem(last=False)
+                    evicted.shutdown(wait=False)
+            else:
+                self._executors.move_to_end(engine.version)
+            return executor.submit(_evaluate_specs, specs)
+
+    def shutdown(self):
+        with self._lock:
+            for executor in self._executors.values():
+                executor.shutdown(wait=False)
+            self._executors.clear()
+
+
+def evaluate_scenarios(engine, scenarios, pool=None, chunksize=SCENARIO_CHUNK_SIZE):
+    """Evaluate ``scenarios`` into one DataFrame row each, in order
+
+    With a ``ScenarioPool`` and a large enough batch, chunks of scenarios are
+    evaluated in parallel.
+    """
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        scenario.validate(engine.df.index)
+
+    if pool is None or len(scenarios) < PARALLEL_MIN_SCENARIOS:
+        results = _evaluate_chunk(engine, scenarios)
+    else:
+        futures = [
+            pool.submit(engine, [
+                (scenario.merges, scenario.closes, scenario.name) for scenario in scenarios[start:start + chunksize]
+            ])
+            for start in range(0, len(scenarios), chunksize)
+        ]
+        results = [result for future in futures for result in future.result()]
+    return pd.DataFrame(results, columns=SCENARIO_METRICS)
+
+
+def candidate_scenarios(df, pairs=None, max_operations=2, limit=MAX_CANDIDATES):
+    """Generate scenarios from the register's own signals
+
+    Single operations are: merging each likely duplicate pair (``pairs`` from
+    ``governance.duplicates``), merging all bodies recommended for Merge, and
+    closing each body recommended for Close, rated Red or adding little value.
+    Combinations of up to ``max_operations`` operations on distinct bodies
+    follow, up to ``limit`` scenarios in all.
+    """
+    operations = []
+    if pairs is not None:
+        operations += [('merge', (a, b)) for a, b in zip(pairs['Body_A'], pairs['Body_B'])]
+    merge_recommended = tuple(df.index[df['RAG_Recommendation'] == 'Merge'])
+    if len(merge_recommended) > 1:
+        operations.append(('merge', merge_recommended))
+    to_close = (df['RAG_Recommendation'] == 'Close') | (df['RAG_Status'] == 'Red') | (df['Value_Added'] <= 2)
+    operations += [('close', (body_id,)) for body_id in df.index[to_close]]
+    operations = list(dict.fromkeys(operations))
+
+    scenarios = []
+    for size in range(1, max_operations + 1):
+        for combination in itertools.combinations(operations, size):
+            bodies = [body_id for _, group in combination for body_id in group]
+            if len(bodies) != len(set(bodies)):
+                continue
+            scenarios.append(Scenario(
+                merges=[group for kind, group in combination if kind == 'merge'],
+                closes=[group[0] for kind, group in combination if kind == 'close'],
+            ))
+            if len(scenarios) >= limit:
+                return scenarios
+    return scenarios
@@ -0,0 +1,60 @@
+"""Typed column schema for the governance bodies frame"""
+import numpy as np
+import pandas as pd
+
+# Low-cardinality columns stored as ordered Categoricals, in display order
+CATEGORIES = {
+    "Type": ["Board", "Cabinet", "Committee", "Place-Based Board", "Partnership", "Working Group"],
+    "Level": ["Strategic", "Tactical", "Operational", "Community"],
+    "Process_Type": ["Explicit", "Partially Explicit", "Mixed", "Tacit"],
+    "Cost_Impact": ["Low", "Medium", "High", "Very High"],
+    "RAG_Status": ["Green", "Amber", "Red"],
+    "RAG_Recommendation": ["Keep", "Merge", "Close"],
+    "Stakeholder_Power": ["Low", "Medium", "High"],
+    "Stakeholder_Interest": ["Low", "Medium", "High", "Very High"],
+    "Decision_Speed": ["Fast", "Medium", "Slow"],
+    "Innovation_Posture": ["Exploit", "Explore", "Ambidextrous"],
+}
+
+# 1-5 scores
+SCORE_COLUMNS = ["Efficiency_Score", "Value_Added", "Duplication_Risk"]
+SCORE_DTYPE = "int8"
+
+
+def categorical(values, column):
+    """Return ``values`` as an ordered Categorical for ``column``
+
+    Values outside the known categories are kept, appended after them, so
+    imported data is never silently dropped.
+    """
+    known = CATEGORIES[column]
+    if isinstance(values.dtype, pd.CategoricalDtype) and list(values.cat.categories[:len(known)]) == known:
+        return values
+    observed = pd.unique(values.dropna())
+    extras = sorted(str(value) for value in observed if value not in known)
+    return pd.Categorical(values, categories=known + extras, ordered=True)
+
+
+def apply_schema(df):
+    """Return ``df`` with categorical and score columns converted to compact dtypes"""
+    typed = {}
+    for column in CATEGORIES:
+        if column in df.columns:
+            typed[column] = categorical(df[column], column)
+    for column in SCORE_COLUMNS:
+        if column in df.columns and df[column].dtype != SCORE_DTYPE:
+            scores = pd.to_numeric(df[column], errors='coerce')
+            typed[column] = scores.astype(SCORE_DTYPE) if scores.notna().all() else scores.astype("Int8")
+    return df.assign(**typed) if typed else df
+
+
+def ordinal(series, scale):
+    """Map a (possibly categorical) column through an ordinal ``scale`` dict
+
+    For categoricals the scale is applied to the categories once and then
+    gathered by code, instead of mapping every row.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        lookup = np.array([scale.get(category, np.nan) for category in series.cat.categories] + [np.nan])
+        return pd.Series(lookup[series.cat.codes.to_numpy()], index=series.index, name=series.name)
+    return series.map(scale)
@@ -0,0 +1,190 @@
+"""Inverted full-text index over governance bodies"""
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+
+# Fields indexed for search, with their ranking weights
+SEARCH_FIELDS = {
+    'Name': 3.0,
+    'Outcome_Focus': 2.0,
+    'Primary_Stakeholders': 1.0,
+    'Secondary_Stakeholders': 1.0,
+    'Value_Chain_Activities': 1.0,
+}
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+MIN_PREFIX_LENGTH = 2
+MIN_FUZZY_LENGTH = 4
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def words(text):
+    """Lower-cased alphanumeric words of ``text``"""
+    return _WORD.findall(text.lower()) if isinstance(text, str) else []
+
+
+def deletions(term):
+    """``term`` plus every variant with one character removed"""
+    return {term} | {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+class SearchIndex:
+    """Term -> body postings with prefix and one-edit fuzzy matching
+
+    Prefixes are found by bisecting a sorted vocabulary. Fuzzy candidates come
+    from a one-deletion neighbourhood index: two terms within one edit of each
+    other always share a deletion variant. Bodies are added, replaced and
+    removed one at a time, touching only their own terms.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(dict)   # term -> {body_id: field weight}
+        self.body_terms = {}                # body_id -> set of terms
+        self.names = {}                     # body_id -> name
+        self.vocabulary = []                # sorted terms
+        self.variants = defaultdict(set)    # deletion variant -> terms
+
+    @classmethod
+    def from_frame(cls, df):
+        index = cls()
+        for body_id, body in zip(df.index, df.to_dict('records')):
+            index.add(body_id, body)
+        return index
+
+    def copy(self):
+        other = SearchIndex()
+        other.postings = defaultdict(dict, {term: dict(bodies) for term, bodies in self.postings.items()})
+        other.body_terms = {body_id: set(terms) for body_id, terms in self.body_terms.items()}
+        other.names = dict(self.names)
+        other.vocabulary = list(self.vocabulary)
+        other.variants = defaultdict(set, {variant: set(terms) for variant, terms in self.variants.items()})
+        return other
+
+    def __len__(self):
+        return len(self.body_terms)
+
+    def add(self, body_id, body):
+        """Index one body, replacing any earlier version of it"""
+        self.remove(body_id)
+        weights = {}
+        for field, weight in SEARCH_FIELDS.items():
+            for term in words(body.get(field)):
+                weights[term] = max(weights.get(term, 0.0), weight)
+        for term, weight in weights.items():
+            if term not in self.postings:
+                bisect.insort(self.vocabulary, term)
+                for variant in deletions(term):
+                    self.variants[variant].add(term)
+            self.postings[term][body_id] = weight
+        self.body_terms[body_id] = set(weights)
+        self.names[body_id] = body.get('Name')
+
+    def remove(self, body_id):
+        """Drop one body from the index (no-op if it is not indexed)"""
+        for term in self.body_terms.pop(body_id, ()):
+            bodies = self.postings[term]
+            bodies.pop(body_id, None)
+            if not bodies:
+                del self.postings[term]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, term)]
+                for variant in deletions(term):
+                    self.variants[variant].discard(term)
+                    if not self.variants[variant]:
+                        del self.variants[variant]
+        self.names.pop(body_id, None)
+
+    def expand(self, word):
+        """Return ``{term: match weight}`` for the exact, prefix and fuzzy matches of ``word``"""
+        matches = {}
+        if len(word) >= MIN_FUZZY_LENGTH:
+            for variant in deletions(word):
+                for term in self.variants.get(variant, ()):
+                    matches[term] = FUZZY_WEIGHT
+        if len(word) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self.vocabulary, word)
+            for term in self.vocabulary[start:]:
+                if not term.startswith(word):
+                    break
+                matches[term] = PREFIX_WEIGHT
+        if word in self.postings:
+            matches[word] = EXACT_WEIGHT
+        return matches
+
+    def _postings(self, term):
+        return self.postings.get(term, {})
+
+    def _name(self, body_id):
+        return self.names.get(body_id)
+
+    def search(self, text, limit=20):
+        """Return up to ``limit`` ``(body_id, score)`` pairs matching every word of ``text``, best first"""
+        query = words(text)
+        if not query:
+            return []
+        total = len(self)
+        scores = None
+        for word in dict.fromkeys(query):
+            word_scores = {}
+            for term, match in self.expand(word).items():
+                bodies = self._postings(term)
+                if not bodies:
+                    continue
+                idf = math.log(1 + total / len(bodies))
+                for body_id, field_weight in bodies.items():
+                    score = match * field_weight * idf
+                    if score > word_scores.get(body_id, 0.0):
+                        word_scores[body_id] = score
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {body_id: score + word_scores[body_id] for body_id, score in scores.items() if body_id in word_scores}
+            if not scores:
+                return []
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], str(self._name(item[0]))))
+
+
+class OverlaySearchIndex(SearchIndex):
+    """A shared, read-only ``SearchIndex`` plus one session's added, edited and deleted bodies
+
+    Only the session's own bodies are indexed here; lookups combine them with
+    the base's postings, hiding base bodies the session replaced or removed,
+    so results and scores match an index rebuilt over the session's bodies.
+    """
+
+    def __init__(self, base):
+        super().__init__()
+        self.base = base
+        self.hidden = set()     # base bodies replaced or removed by the session
+
+    def __len__(self):
+        return len(self.base) - len(self.hidden) + len(self.body_terms)
+
+    def add(self, body_id, body):
+        if body_id in self.base.body_terms:
+            self.hidden.add(body_id)
+        super().add(body_id, body)
+
+    def remove(self, body_id):
+        if body_id in self.base.body_terms:
+            self.hidden.add(body_id)
+        super().remove(body_id)
+
+    def expand(self, word):
+        matches = self.base.expand(word)
+        for term, match in super().expand(word).items():
+            matches[term] = max(match, matches.get(term, 0.0))
+        return matches
+
+    def _postings(self, term):
+        bodies = {body_id: weight for body_id, weight in self.base.postings.get(term, {}).items() if body_id not in self.hidden}
+        bodies.update(self.postings.get(term, {}))
+        return bodies
+
+    def _name(self, body_id):
+        if body_id in self.names:
+            return self.names[body_id]
+        return self.base.names.get(body_id)
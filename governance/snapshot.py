@@ -0,0 +1,218 @@
+"""Columnar snapshots of a governance map in Arrow IPC or Parquet
+
+A snapshot holds the bodies (keeping their ids and typed columns), the Five
+Forces scores and the derived indexes computed from the bodies: the numeric
+encodings and the principle membership matrix. Arrow IPC files are read
+through a memory map, so reopening a large map parses no text and does not
+copy the file into memory before converting it to a frame.
+"""
+import json
+import os
+
+import pandas as pd
+
+from governance.alignment import principle_matrix
+from governance.metrics import compute_derived, dataset_hash, derived_cache
+from governance.schema import apply_schema
+from governance.storage import BODY_COLUMNS
+from governance.validation import validate_frame
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FORMATS = {
+    'arrow': 'application/vnd.apache.arrow.file',
+    'parquet': 'application/vnd.apache.parquet',
+}
+DERIVED_PREFIX = 'derived:'
+PRINCIPLE_PREFIX = 'principle:'
+
+_METADATA_KEY = b'governance'
+_MAGIC = {b'ARROW1': 'arrow', b'PAR1': 'parquet'}
+
+
+class Snapshot:
+    """Bodies plus the Five Forces and derived indexes saved alongside them"""
+
+    def __init__(self, bodies, five_forces=None, derived=None, principles=None, revision=None, version_hash=None,
+                 store_id=None, missing_columns=()):
+        self.bodies = bodies
+        self.five_forces = five_forces
+        self.derived = derived
+        self.principles = principles
+        self.revision = revision
+        self.version_hash = version_hash
+        self.store_id = store_id
+        self.missing_columns = list(missing_columns)    # body columns absent from the file read
+
+    @classmethod
+    def from_bodies(cls, bodies, five_forces=None, revision=None, store_id=None):
+        """Build a snapshot, computing the derived indexes for ``bodies``"""
+        return cls(
+            bodies, five_forces, compute_derived(bodies), principle_matrix(bodies),
+            revision, dataset_hash(bodies), store_id,
+        )
+
+    def seed_caches(self):
+        """Make the saved derived indexes the memoized ones for this dataset version"""
+        if self.version_hash is None:
+            return
+        if self.derived is not None:
+            derived_cache.get(('columns', self.version_hash), lambda: self.derived)
+        if self.principles is not None:
+            derived_cache.get(('principles', self.version_hash), lambda: self.principles)
+
+    def to_table(self):
+        import pyarrow as pa
+
+        parts = [self.bodies.rename_axis('id').reset_index()]
+        if self.derived is not None:
+            parts.append(self.derived.add_prefix(DERIVED_PREFIX).reset_index(drop=True))
+        if self.principles is not None:
+            parts.append(self.principles.add_prefix(PRINCIPLE_PREFIX).reset_index(drop=True))
+        table = pa.Table.from_pandas(pd.concat(parts, axis=1), preserve_index=False)
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps({
+            'snapshot_version': SNAPSHOT_VERSION,
+            'five_forces': self.five_forces,
+            'revision': self.revision,
+            'version_hash': self.version_hash,
+            'store_id': self.store_id,
+        }).encode('utf-8')
+        return table.replace_schema_metadata(metadata)
+
+    @classmethod
+    def from_table(cls, table):
+        metadata = snapshot_metadata(table.schema)
+
+        frame = table.to_pandas(split_blocks=True, self_destruct=True)
+        frame = frame.set_index('id').rename_axis(None)
+
+        def prefixed(prefix):
+            columns = [column for column in frame.columns if column.startswith(prefix)]
+            if not columns:
+                return None
+            return frame[columns].rename(columns=lambda column: column[len(prefix):])
+
+        bodies = apply_schema(frame.reindex(columns=list(BODY_COLUMNS)))
+        principles = prefixed(PRINCIPLE_PREFIX)
+        return cls(
+            bodies, metadata.get('five_forces'), prefixed(DERIVED_PREFIX),
+            principles.astype(bool) if principles is not None else None,
+            metadata.get('revision'), metadata.get('version_hash'), metadata.get('store_id'),
+            [column for column in BODY_COLUMNS if column not in frame.columns],
+        )
+
+    def errors(self):
+        """``(body id, message)`` problems that stop these bodies replacing the register
+
+        The bodies get the same checks as an imported file, plus unique,
+        whole-number ids.
+        """
+        index = self.bodies.index
+        if not pd.api.types.is_integer_dtype(index):
+            return [(None, "Body ids must be whole numbers")]
+        errors = [(body_id, "Body id is used more than once") for body_id in index[index.duplicated()].unique()]
+        return errors + validate_frame(self.bodies.drop(columns=self.missing_columns))
+
+
+def snapshot_metadata(schema):
+    """Return the governance metadata saved in a snapshot's schema"""
+    metadata = (schema.metadata or {}).get(_METADATA_KEY)
+    if metadata is None:
+        raise ValueError("Not a governance map snapshot")
+    metadata = json.loads(metadata)
+    if metadata.get('snapshot_version', 0) > SNAPSHOT_VERSION:
+        raise ValueError("Snapshot was written by a newer version of the tool")
+    return metadata
+
+
+def snapshot_format(header):
+    """Return 'arrow' or 'parquet' from the first bytes of a snapshot file"""
+    for magic, fmt in _MAGIC.items():
+        if header.startswith(magic):
+            return fmt
+    raise ValueError("Unrecognised snapshot file (expected Arrow IPC or Parquet)")
+
+
+def write_snapshot(snapshot, sink, fmt='arrow'):
+    """Write ``snapshot`` to a path or pyarrow sink"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = snapshot.to_table()
+    if fmt == 'arrow':
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif fmt == 'parquet':
+        pq.write_table(table, sink)
+    else:
+        raise ValueError(f"Unknown snapshot format '{fmt}'")
+
+
+def snapshot_bytes(snapshot, fmt='arrow'):
+    """Serialise ``snapshot`` in memory, e.g. for a download button"""
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    write_snapshot(snapshot, sink, fmt)
+    return sink.getvalue().to_pybytes()
+
+
+def read_snapshot(source):
+    """Read a snapshot from a file path (memory-mapped) or from bytes"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        buffer = pa.py_buffer(source)
+        fmt = snapshot_format(buffer[:6].to_pybytes())
+        reader = pa.BufferReader(buffer)
+    else:
+        reader = pa.memory_map(os.fspath(source))
+        fmt = snapshot_format(reader.read(6))
+        reader.seek(0)
+
+    if fmt == 'arrow':
+        table = pa.ipc.open_file(reader).read_all()
+    else:
+        table = pq.read_table(reader)
+    return Snapshot.from_table(table)
+
+
+def store_snapshot_path(store):
+    """Path of the Arrow snapshot kept next to a SQLite store (None for in-memory stores)"""
+    if store.path == ':memory:':
+        return None
+    return f"{store.path}.arrow"
+
+
+def open_store_snapshot(store, revision):
+    """Return the store's bodies at ``revision`` as a snapshot
+
+    The Arrow file next to the database is reused when it was written by the
+    same database (its ``store_id``) at the same revision; only its schema is
+    read to check. Otherwise the bodies are read from SQLite and the file is
+    rewritten for the next process. Without pyarrow, or when the file cannot
+    be written, this falls back to the plain SQLite read.
+    """
+    path = store_snapshot_path(store)
+    store_id = store.store_id
+    if path and os.path.exists(path):
+        try:
+            import pyarrow as pa
+
+            with pa.memory_map(path) as source:
+                metadata = snapshot_metadata(pa.ipc.open_file(source).schema)
+            if metadata.get('store_id') == store_id and metadata.get('revision') == revision:
+                return read_snapshot(path)
+        except (ImportError, OSError, ValueError):
+            pass
+
+    snapshot = Snapshot.from_bodies(store.load_bodies(), revision=revision, store_id=store_id)
+    if path:
+        try:
+            write_snapshot(snapshot, f"{path}.tmp")
+            os.replace(f"{path}.tmp", path)
+        except (ImportError, OSError):
+            pass
+    return snapshot
@@ -0,0 +1,247 @@
+"""Embedded SQLite storage for governance bodies"""
+import sqlite3
+import threading
+import uuid
+
+import pandas as pd
+
+from governance.schema import apply_schema
+
+BODY_STORE_PATH_ENV = "GOVERNANCE_DB_PATH"
+DEFAULT_BODY_STORE_PATH = "governance.db"
+
+# Column name -> SQLite type, in display order
+BODY_COLUMNS = {
+    "Name": "TEXT NOT NULL",
+    "Type": "TEXT",
+    "Level": "TEXT",
+    "Outcome_Focus": "TEXT",
+    "Fairer_Westminster_Alignment": "TEXT",
+    "Process_Type": "TEXT",
+    "Efficiency_Score": "INTEGER",
+    "Cost_Impact": "TEXT",
+    "Value_Added": "INTEGER",
+    "Duplication_Risk": "INTEGER",
+    "RAG_Status": "TEXT",
+    "RAG_Recommendation": "TEXT",
+    "Primary_Stakeholders": "TEXT",
+    "Secondary_Stakeholders": "TEXT",
+    "Stakeholder_Power": "TEXT",
+    "Stakeholder_Interest": "TEXT",
+    "Value_Chain_Activities": "TEXT",
+    "Decision_Speed": "TEXT",
+    "Innovation_Posture": "TEXT",
+}
+
+INDEXED_COLUMNS = ["Name", "Level", "RAG_Status", "RAG_Recommendation", "Type"]
+
+
+class MissingBodyError(LookupError):
+    """Raised when a write targets bodies that are no longer in the store, e.g. deleted by another session"""
+
+    def __init__(self, body_ids):
+        self.body_ids = list(body_ids)
+        super().__init__(f"Bodies no longer in the store: {', '.join(map(str, self.body_ids))}")
+
+
+class BodyStore:
+    """Governance bodies persisted in SQLite, one row per body
+
+    The SQLite ``id`` is used as the DataFrame index, so the Manage Bodies
+    page can write a single row through on every add, edit or delete. Ids
+    are never reused, so an edit kept by one session can never land on a
+    body another session added after a delete. The connection is opened on
+    first use.
+    """
+
+    def __init__(self, path=DEFAULT_BODY_STORE_PATH):
+        self.path = path
+        self._conn = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self):
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._create_schema()
+            return self._conn
+
+    def _create_schema(self):
+        columns = ", ".join(f'"{name}" {sql_type}' for name, sql_type in BODY_COLUMNS.items())
+        with self._conn:
+            table = self._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'governance_bodies'"
+            ).fetchone()
+            create = f"CREATE TABLE {{}} (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})"
+            if table is None:
+                self._conn.execute(create.format("governance_bodies"))
+            elif "AUTOINCREMENT" not in table[0].upper():
+                # Stores created before ids were AUTOINCREMENT are copied across once
+                names = ", ".join(["id"] + [f'"{name}"' for name in BODY_COLUMNS])
+                self._conn.execute("DROP TABLE IF EXISTS governance_bodies_new")
+                self._conn.execute(create.format("governance_bodies_new"))
+                self._conn.execute(f"INSERT INTO governance_bodies_new ({names}) SELECT {names} FROM governance_bodies")
+                self._conn.execute("DROP TABLE governance_bodies")
+                self._conn.execute("ALTER TABLE governance_bodies_new RENAME TO governance_bodies")
+            for column in INDEXED_COLUMNS:
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_bodies_{column.lower()} ON governance_bodies ("{column}")'
+                )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+            # Identifies this database file, so copies kept beside it are never mistaken for a recreated one's
+            self._conn.execute(
+                "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('store_id', ?)", (uuid.uuid4().hex,)
+            )
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM governance_bodies").fetchone()[0]
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def seed(self, bodies):
+        """Load sample bodies into an empty store; returns True if seeding happened"""
+        with self._lock:
+            if self.count() > 0:
+                return False
+            with self.conn:
+                self.conn.executemany(self._insert_sql(), [self._values(body) for body in bodies])
+                self._set_meta("source", "sample")
+                self._set_meta("revision", "0")
+            return True
+
+    @property
+    def is_sample_data(self):
+        return self.get_meta("source") == "sample"
+
+    @property
+    def store_id(self):
+        """Random id given to the database when it is created"""
+        return self.get_meta("store_id")
+
+    @property
+    def revision(self):
+        """Counter bumped by every write, used to version cached copies of the data"""
+        return int(self.get_meta("revision", 0))
+
+    def _record_write(self):
+        self._set_meta("source", "user")
+        self.conn.execute(
+            "INSERT INTO store_meta (key, value) VALUES ('revision', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def load_bodies(self):
+        """Read every body into a typed DataFrame indexed by SQLite id"""
+        columns = ", ".join(f'"{name}"' for name in BODY_COLUMNS)
+        with self._lock:
+            df = pd.read_sql_query(f"SELECT id, {columns} FROM governance_bodies ORDER BY id", self.conn)
+        return apply_schema(df.set_index("id").rename_axis(None))
+
+    def _insert_sql(self):
+        columns = ", ".join(f'"{name}"' for name in BODY_COLUMNS)
+        placeholders = ", ".join("?" for _ in BODY_COLUMNS)
+        return f"INSERT INTO governance_bodies ({columns}) VALUES ({placeholders})"
+
+    @staticmethod
+    def _values(body):
+        return [_to_sql(body.get(name)) for name in BODY_COLUMNS]
+
+    def insert_body(self, body):
+        """Insert one body and return its new id"""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(self._insert_sql(), self._values(body))
+            self._record_write()
+            return cursor.lastrowid
+
+    def insert_bodies(self, rows):
+        """Insert many bodies in one transaction and return their new ids
+
+        ``rows`` are value sequences in ``BODY_COLUMNS`` order. Without an
+        explicit id SQLite assigns one more than the largest id ever used, so
+        the ids of one batch are consecutive.
+        """
+        with self._lock, self.conn:
+            # Hold the write lock from reading the next id, so another process cannot insert in between
+            self.conn.execute("BEGIN IMMEDIATE")
+            first = self.conn.execute(
+                "SELECT MAX(COALESCE((SELECT MAX(id) FROM governance_bodies), 0), "
+                "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'governance_bodies'), 0)) + 1"
+            ).fetchone()[0]
+            cursor = self.conn.executemany(self._insert_sql(), ([_to_sql(value) for value in row] for row in rows))
+            if cursor.rowcount:
+                self._record_write()
+            return list(range(first, first + max(cursor.rowcount, 0)))
+
+    def replace_bodies(self, bodies):
+        """Replace every body with the rows of ``bodies``, keeping its index as the ids"""
+        columns = ", ".join(f'"{name}"' for name in BODY_COLUMNS)
+        placeholders = ", ".join("?" for _ in range(len(BODY_COLUMNS) + 1))
+        rows = bodies.reindex(columns=list(BODY_COLUMNS)).astype(object).itertuples(name=None)
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM governance_bodies")
+            self.conn.executemany(
+                f"INSERT INTO governance_bodies (id, {columns}) VALUES ({placeholders})",
+                ([int(row[0])] + [_to_sql(value) for value in row[1:]] for row in rows),
+            )
+            self._record_write()
+
+    def update_body(self, body_id, changes):
+        """Write the given column values for one body
+
+        Raises ``MissingBodyError`` if the body is no longer in the store.
+        """
+        self.update_bodies({body_id: changes})
+
+    def update_bodies(self, changes):
+        """Write ``{body_id: {column: value}}`` changes for many bodies in one transaction
+
+        If any of the bodies is no longer in the store nothing is written and
+        ``MissingBodyError`` names the missing ones.
+        """
+        missing, written = [], 0
+        with self._lock, self.conn:
+            for body_id, body_changes in changes.items():
+                body_changes = {name: value for name, value in body_changes.items() if name in BODY_COLUMNS}
+                if body_changes:
+                    assignments = ", ".join(f'"{name}" = ?' for name in body_changes)
+                    cursor = self.conn.execute(
+                        f"UPDATE governance_bodies SET {assignments} WHERE id = ?",
+                        [_to_sql(value) for value in body_changes.values()] + [int(body_id)],
+                    )
+                    if cursor.rowcount == 0:
+                        missing.append(body_id)
+                    written += cursor.rowcount
+            # Raising inside the transaction rolls back the rows already written
+            if missing:
+                raise MissingBodyError(missing)
+            if written:
+                self._record_write()
+
+    def delete_body(self, body_id):
+        """Delete one body; returns False if it had already gone"""
+        with self._lock, self.conn:
+            cursor = self.conn.execute("DELETE FROM governance_bodies WHERE id = ?", (int(body_id),))
+            if cursor.rowcount:
+                self._record_write()
+            return bool(cursor.rowcount)
+
+
+def _to_sql(value):
+    """Convert numpy scalars and missing values to plain SQLite-compatible values"""
+    if value is None:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
@@ -0,0 +1,69 @@
+"""Validation rules for governance bodies, shared by the add form and bulk import"""
+import pandas as pd
+
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+from governance.schema import CATEGORIES, SCORE_COLUMNS
+
+PILLAR_SEPARATOR = ', '
+SCORE_RANGE = (1, 5)
+
+# Required text fields and the message shown when one is missing
+REQUIRED_FIELDS = {
+    'Name': "Body Name is required",
+    'Outcome_Focus': "Outcome Focus is required",
+    'Fairer_Westminster_Alignment': "Please select at least one Fairer Westminster Pillar",
+    'Primary_Stakeholders': "Primary Stakeholders are required",
+    'Value_Chain_Activities': "Value Chain Activities are required",
+}
+
+
+def _blank(series):
+    return series.isna() | series.astype('object').fillna('').astype(str).str.strip().eq('')
+
+
+def validate_frame(df):
+    """Return a list of ``(row label, message)`` errors for every invalid row of ``df``
+
+    Each rule is evaluated as one vectorised mask over the frame, so a chunk
+    of an import file is checked without looping over rows.
+    """
+    checks = []
+    for column, message in REQUIRED_FIELDS.items():
+        if column in df.columns:
+            checks.append((_blank(df[column]), message))
+        else:
+            checks.append((pd.Series(True, index=df.index), message))
+
+    if 'Fairer_Westminster_Alignment' in df.columns:
+        pillars = df['Fairer_Westminster_Alignment'].astype('object').fillna('').astype(str).str.split(',').explode().str.strip()
+        unknown = pillars.ne('') & ~pillars.isin(FAIRER_WESTMINSTER_PRINCIPLES)
+        bad_rows = unknown.groupby(level=0).any().reindex(df.index, fill_value=False)
+        checks.append((bad_rows, "Unknown Fairer Westminster Pillar"))
+
+    # Category and score columns are required: a file without one is rejected row by row
+    # rather than stored with empty values
+    for column, allowed in CATEGORIES.items():
+        if column in df.columns:
+            values = df[column].astype('object')
+            checks.append((values.isna() | ~values.isin(allowed), f"{column.replace('_', ' ')} must be one of {', '.join(allowed)}"))
+        else:
+            checks.append((pd.Series(True, index=df.index), f"{column.replace('_', ' ')} column is missing"))
+
+    low, high = SCORE_RANGE
+    for column in SCORE_COLUMNS:
+        if column in df.columns:
+            scores = pd.to_numeric(df[column], errors='coerce')
+            invalid = scores.isna() | scores.lt(low) | scores.gt(high) | scores.mod(1).ne(0)
+            checks.append((invalid, f"{column.replace('_', ' ')} must be a whole number from {low} to {high}"))
+        else:
+            checks.append((pd.Series(True, index=df.index), f"{column.replace('_', ' ')} column is missing"))
+
+    errors = []
+    for mask, message in checks:
+        errors.extend((label, message) for label in df.index[mask.to_numpy(dtype=bool)])
+    return errors
+
+
+def validate_body(body):
+    """Return the error messages for one body dict, in form order"""
+    return [message for _, message in validate_frame(pd.DataFrame([body]))]
@@ -0,0 +1,84 @@
+"""Check that each page module stays within its cold-start import budget
+
+Each page is imported in a fresh interpreter after the app shell (Streamlit,
+pandas and the shared helpers), so the time measured is what opening that
+page adds to a cold start. Pages must also not pull in libraries that belong
+to other pages; ReportLab is only imported once a PDF is actually built. Run from the repository root:
+
+    python scripts/check_import_budget.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from views import PAGES  # noqa: E402
+
+# Seconds a page may add on top of the app shell (Streamlit itself pulls in
+# Plotly, so Plotly is part of the shell rather than any page)
+SHELL_BUDGET = 3.0
+DEFAULT_PAGE_BUDGET = 0.5
+PAGE_BUDGETS = {
+    "views.network": 1.0,
+    "views.scenarios": 1.0,
+}
+
+# Libraries a page may add to the process beyond the shell
+HEAVY_MODULES = ["networkx", "scipy", "reportlab"]
+ALLOWED_HEAVY = {
+    "views.network": ["networkx", "scipy"],
+    "views.scenarios": ["scipy"],
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit, pandas, views.common
+shell = time.perf_counter() - start
+before = {{name.split('.')[0] for name in sys.modules}}
+start = time.perf_counter()
+import {module}
+page = time.perf_counter() - start
+loaded = sorted(({{name.split('.')[0] for name in sys.modules}} - before) & set({heavy!r}))
+print(json.dumps({{'shell': shell, 'page': page, 'loaded': loaded}}))
+"""
+
+
+def measure(module):
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    failures = []
+    print(f"{'Page':<34}{'Shell (s)':>10}{'Page (s)':>10}{'Budget':>8}  Heavy imports")
+    for label, module in PAGES.items():
+        stats = measure(module)
+        budget = PAGE_BUDGETS.get(module, DEFAULT_PAGE_BUDGET)
+        unexpected = sorted(set(stats['loaded']) - set(ALLOWED_HEAVY.get(module, [])))
+        print(f"{module:<34}{stats['shell']:>10.2f}{stats['page']:>10.2f}{budget:>8.2f}  "
+              f"{', '.join(stats['loaded']) or '-'}")
+        if stats['shell'] > SHELL_BUDGET:
+            failures.append(f"{module}: app shell took {stats['shell']:.2f}s (budget {SHELL_BUDGET:.2f}s)")
+        if stats['page'] > budget:
+            failures.append(f"{module}: page import took {stats['page']:.2f}s (budget {budget:.2f}s)")
+        if unexpected:
+            failures.append(f"{module}: imports {', '.join(unexpected)} at load time")
+
+    if failures:
+        print("\nImport budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nAll pages within import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
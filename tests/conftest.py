@@ -0,0 +1,35 @@
+"""Shared fixtures: the sample register and synthetic registers of any size"""
+import random
+
+import pandas as pd
+import pytest
+
+from governance.sample_data import SAMPLE_DATA
+from governance.storage import BodyStore
+
+
+@pytest.fixture
+def sample_bodies():
+    """The sample register as loaded from a fresh in-memory store"""
+    store = BodyStore(':memory:')
+    store.seed(SAMPLE_DATA['governance_bodies'])
+    return store.load_bodies()
+
+
+@pytest.fixture
+def synthetic_register(sample_bodies):
+    """Build ``n`` bodies with random remits drawn from vocabularies of ``vocabulary`` items"""
+    def build(n, vocabulary=3000, seed=0):
+        rng = random.Random(seed)
+        activities = [f"Activity {i}" for i in range(vocabulary)]
+        stakeholders = [f"Stakeholder {i}" for i in range(vocabulary * 6 // 5)]
+        outcomes = [f"Outcome {i}" for i in range(vocabulary * 2 // 5)]
+        frame = pd.concat([sample_bodies] * (n // len(sample_bodies) + 1), ignore_index=True).iloc[:n].copy()
+        frame.index = pd.RangeIndex(1, n + 1)
+        frame['Name'] = [f"Body {i}" for i in range(n)]
+        frame['Value_Chain_Activities'] = [', '.join(rng.sample(activities, 5)) for _ in range(n)]
+        frame['Primary_Stakeholders'] = [', '.join(rng.sample(stakeholders, 4)) for _ in range(n)]
+        frame['Secondary_Stakeholders'] = [', '.join(rng.sample(stakeholders, 2)) for _ in range(n)]
+        frame['Outcome_Focus'] = [', '.join(rng.sample(outcomes, 2)) for _ in range(n)]
+        return frame
+    return build
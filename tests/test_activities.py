@@ -0,0 +1,52 @@
+"""Body <-> value-chain activity table and its per-body patches"""
+import pandas as pd
+
+from governance.activities import explode_activities, patch_activities
+
+
+def _sorted(table):
+    table = table.astype({'Level': object, 'RAG_Status': object, 'Efficiency': float, 'Value': float})
+    return table.sort_values(['Body_ID', 'Activity'], kind='stable').reset_index(drop=True)
+
+
+def test_one_row_per_listed_activity(sample_bodies):
+    table = explode_activities(sample_bodies)
+    listed = sample_bodies['Value_Chain_Activities'].str.split(',').map(
+        lambda items: [item.strip() for item in items if item.strip()]
+    )
+    assert len(table) == listed.map(len).sum()
+    first = sample_bodies.index[0]
+    assert table.loc[table['Body_ID'] == first, 'Activity'].tolist() == listed[first]
+
+
+def test_blank_and_missing_activities_are_skipped():
+    df = pd.DataFrame({
+        'Name': ['A', 'B', 'C'], 'Level': ['Strategic'] * 3, 'Efficiency_Score': [3] * 3,
+        'Value_Added': [3] * 3, 'RAG_Status': ['Green'] * 3,
+        'Value_Chain_Activities': ['Procurement, , Finance', None, ''],
+    }, index=[1, 2, 3])
+    table = explode_activities(df)
+    assert table['Body_ID'].tolist() == [1, 1]
+    assert table['Activity'].tolist() == ['Procurement', 'Finance']
+
+
+def test_patches_match_exploding_the_edited_register(sample_bodies):
+    table = explode_activities(sample_bodies)
+    edited = sample_bodies.copy()
+    first, second = sample_bodies.index[:2]
+
+    body = edited.loc[first].to_dict()
+    body.update({'Value_Chain_Activities': 'Finance, Scrutiny', 'RAG_Status': 'Red'})
+    edited.loc[first, ['Value_Chain_Activities', 'RAG_Status']] = ['Finance, Scrutiny', 'Red']
+    table = patch_activities(table, first, body)
+
+    edited = edited.drop(index=second)
+    table = patch_activities(table, second)
+
+    new_id = sample_bodies.index.max() + 1
+    added = dict(body, Name='New Board', Value_Chain_Activities='Procurement')
+    edited = pd.concat([edited, pd.DataFrame([added], index=[new_id])])
+    table = patch_activities(table, new_id, added)
+
+    pd.testing.assert_frame_equal(_sorted(table), _sorted(explode_activities(edited)))
+    assert isinstance(table['Level'].dtype, pd.CategoricalDtype)
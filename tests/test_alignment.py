@@ -0,0 +1,35 @@
+"""Fairer Westminster principle membership, counts and means"""
+import pandas as pd
+
+from governance.alignment import co_occurrence, principle_counts, principle_matrix, principle_means
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+
+
+def test_counts_match_a_substring_search_per_principle(sample_bodies):
+    counts = principle_counts(principle_matrix(sample_bodies))
+    for principle in FAIRER_WESTMINSTER_PRINCIPLES:
+        aligned = sample_bodies['Fairer_Westminster_Alignment'].str.contains(principle, na=False, regex=False)
+        assert counts[principle] == aligned.sum()
+
+
+def test_means_match_the_aligned_bodies(sample_bodies):
+    matrix = principle_matrix(sample_bodies)
+    means = principle_means(matrix, sample_bodies['Efficiency_Score'])
+    for principle in FAIRER_WESTMINSTER_PRINCIPLES:
+        aligned = sample_bodies['Fairer_Westminster_Alignment'].str.contains(principle, na=False, regex=False)
+        if aligned.any():
+            assert means[principle] == sample_bodies.loc[aligned, 'Efficiency_Score'].mean()
+        else:
+            assert pd.isna(means[principle])
+
+
+def test_principles_match_whole_names_only():
+    df = pd.DataFrame(
+        {'Fairer_Westminster_Alignment': ['Fairer Housing, Fairer Economy', 'Fairer Housing Plus', None, '']},
+        index=[10, 11, 12, 13],
+    )
+    matrix = principle_matrix(df, ['Fairer Housing', 'Fairer Economy'])
+    assert list(matrix.index) == [10, 11, 12, 13]
+    assert matrix['Fairer Housing'].tolist() == [True, False, False, False]
+    assert matrix['Fairer Economy'].tolist() == [True, False, False, False]
+    assert co_occurrence(matrix).loc['Fairer Housing', 'Fairer Economy'] == 1
@@ -0,0 +1,38 @@
+"""Sorting and paging of the governance bodies browser"""
+import pandas as pd
+import pytest
+
+from governance.browse import browse, page_count, sort_order
+
+
+@pytest.mark.parametrize('total, page_size, pages', [(0, 10, 1), (1, 10, 1), (10, 10, 1), (11, 10, 2), (23, 10, 3)])
+def test_page_count(total, page_size, pages):
+    assert page_count(total, page_size) == pages
+
+
+def test_pages_cover_the_sorted_register_once(synthetic_register):
+    df = synthetic_register(23, vocabulary=20)
+    pages = [browse(df, None, 'Name', page=page, page_size=10)[0] for page in range(1, 4)]
+    assert [len(page) for page in pages] == [10, 10, 3]
+    pd.testing.assert_frame_equal(pd.concat(pages), df.sort_values('Name', kind='stable'))
+    assert browse(df, None, 'Name', page=4, page_size=10)[0].empty
+
+
+def test_matches_are_counted_before_paging(sample_bodies):
+    mask = sample_bodies['RAG_Status'] != 'Green'
+    rows, total = browse(sample_bodies, mask, 'Efficiency_Score', ascending=False, page=1, page_size=2)
+    assert total == mask.sum()
+    assert len(rows) == min(2, total)
+    assert rows['Efficiency_Score'].is_monotonic_decreasing
+    assert (rows['RAG_Status'] != 'Green').all()
+
+
+def test_categories_sort_in_order_and_missing_values_go_last(sample_bodies):
+    df = sample_bodies.copy()
+    df['Level'] = df['Level'].cat.set_categories(['Operational', 'Tactical', 'Strategic', 'Community'], ordered=True)
+    df.loc[df.index[0], 'Level'] = None
+    for ascending in (True, False):
+        levels = df['Level'].iloc[sort_order(df, 'Level', ascending)]
+        assert levels.isna().tolist()[-1]
+        known = levels.dropna().cat.codes
+        assert (known.is_monotonic_increasing if ascending else known.is_monotonic_decreasing)
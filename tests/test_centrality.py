@@ -0,0 +1,60 @@
+"""Centrality measures against networkx, and the sampled betweenness error bound"""
+import networkx as nx
+import numpy as np
+import pytest
+
+from governance import centrality
+from governance.centrality import CENTRALITY_MEASURES, betweenness, betweenness_samples, centrality_table, eigenvector
+
+
+def _graph(nodes=60, probability=0.08, seed=1):
+    return nx.gnp_random_graph(nodes, probability, seed=seed)
+
+
+def test_exact_betweenness_matches_networkx():
+    G = _graph()
+    assert betweenness_samples(len(G), 0.1) == len(G)
+    expected = nx.betweenness_centrality(G)
+    result = betweenness(G, 0.1)
+    assert np.allclose([result[node] for node in G], [expected[node] for node in G])
+
+
+def test_registers_up_to_the_limit_are_exact_at_any_bound():
+    G = _graph(nodes=300, probability=0.02)
+    assert betweenness_samples(len(G), 0.2) == len(G)
+    assert betweenness(G, 0.2, seed=1) == betweenness(G, 0.2, seed=2)
+
+
+def test_sampled_betweenness_stays_within_error_bound(monkeypatch):
+    monkeypatch.setattr(centrality, 'EXACT_BETWEENNESS_MAX_NODES', 100)
+    G = _graph(nodes=600, probability=0.01)
+    error_bound = 0.2
+    assert betweenness_samples(len(G), error_bound) < len(G)
+    expected = nx.betweenness_centrality(G)
+    result = betweenness(G, error_bound)
+    assert max(abs(result[node] - expected[node]) for node in G) <= error_bound
+
+
+def test_eigenvector_handles_disconnected_groups():
+    G = nx.disjoint_union(nx.complete_graph(5), nx.path_graph(3))
+    G.add_node('isolated')
+    scores = eigenvector(G)
+    assert scores['isolated'] == 0
+    # The larger, denser group leads; the path scores less but not zero
+    assert max(scores[node] for node in range(5)) == pytest.approx(max(scores.values()))
+    assert 0 < scores[6] < scores[0]
+
+
+def test_connected_eigenvector_matches_networkx():
+    G = nx.les_miserables_graph()
+    expected = nx.eigenvector_centrality_numpy(G, weight='weight')
+    result = eigenvector(G)
+    values = np.array([result[node] for node in G])
+    assert np.allclose(values / np.linalg.norm(values), [expected[node] for node in G], atol=1e-6)
+
+
+def test_table_has_every_measure_sorted_by_degree():
+    table = centrality_table(_graph())
+    assert list(table.columns) == ['Body'] + list(CENTRALITY_MEASURES)
+    assert table['Degree'].is_monotonic_decreasing
+    assert centrality_table(nx.Graph()).empty
@@ -0,0 +1,47 @@
+"""Community detection on a network with a stakeholder shared by every body"""
+import networkx as nx
+import pytest
+
+from governance.communities import COMMUNITY_METHODS, Communities, community_summary, detect_communities
+
+
+def _two_groups_sharing_one_stakeholder():
+    # Two tight groups whose bodies all also share one weak, borough-wide stakeholder
+    G = nx.Graph()
+    groups = [['A1', 'A2', 'A3', 'A4'], ['B1', 'B2', 'B3', 'B4']]
+    for group in groups:
+        G.add_edges_from((a, b, {'weight': 4}) for i, a in enumerate(group) for b in group[i + 1:])
+    G.add_edges_from((a, b, {'weight': 1}) for a in groups[0] for b in groups[1])
+    return G, groups
+
+
+@pytest.mark.parametrize('method', list(COMMUNITY_METHODS.values()))
+def test_weighted_groups_are_separated(method):
+    G, groups = _two_groups_sharing_one_stakeholder()
+    assert nx.number_connected_components(G) == 1
+    assert sorted(map(sorted, detect_communities(G, method))) == groups
+
+
+def test_same_graph_gives_same_communities():
+    G, _ = _two_groups_sharing_one_stakeholder()
+    assert detect_communities(G) == detect_communities(G.copy())
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        detect_communities(nx.path_graph(3), 'spectral')
+
+
+def test_membership_and_summary(sample_bodies):
+    G = nx.Graph()
+    G.add_nodes_from(sample_bodies['Name'])
+    names = list(sample_bodies['Name'])
+    G.add_edge(names[0], names[1], weight=2)
+    communities = Communities(G, detect_communities(G))
+    assert communities.membership[names[0]] == communities.membership[names[1]]
+    assert len(communities) == len(sample_bodies) - 1
+
+    summary = community_summary(sample_bodies, communities.membership, costs=[1.0] * len(sample_bodies))
+    assert summary['Size'].sum() == len(sample_bodies)
+    assert summary['Total_Cost'].sum() == len(sample_bodies)
+    assert (summary[['Green', 'Amber', 'Red']].sum(axis=1) == summary['Size']).all()
@@ -0,0 +1,70 @@
+"""Governance cost model: per-body overhead and savings"""
+import pandas as pd
+import pytest
+
+from governance.costs import SAVING_CATEGORIES, default_cost_model, format_pounds, governance_costs, pair_savings, savings_summary
+
+
+def _body(**fields):
+    body = {
+        'Level': 'Strategic', 'Cost_Impact': 'Medium', 'Primary_Stakeholders': 'Residents, Partners',
+        'Process_Type': 'Tacit', 'RAG_Recommendation': 'Merge',
+    }
+    body.update(fields)
+    return pd.DataFrame([body], index=[1])
+
+
+def test_one_body_costed_by_hand():
+    costs = governance_costs(_body()).iloc[0]
+    # 2 stakeholder groups x 3 = 6 attendees; 12 two-hour meetings, each with an hour of preparation per hour
+    member_cost = 12 * 2.0 * 2 * 95000 * 1.3 / 1650
+    overhead = 6 * member_cost + 12 * 6 * 35
+    assert costs['Members'] == 6
+    assert costs['Annual_Cost'] == pytest.approx(overhead)
+    assert costs['Merge_Saving'] == pytest.approx(0.6 * overhead)
+    assert costs['Documentation_Saving'] == pytest.approx(0.15 * 0.4 * overhead)
+    assert costs['Reporting_Saving'] == pytest.approx(0.05 * 0.4 * overhead)
+    assert costs['Total_Saving'] == pytest.approx((0.6 + 0.4 * 0.2) * overhead)
+
+
+def test_small_bodies_have_the_minimum_membership():
+    assert governance_costs(_body(Primary_Stakeholders=None))['Members'].iloc[0] == 4
+
+
+def test_sample_savings_follow_the_recommendations(sample_bodies):
+    costs = governance_costs(sample_bodies)
+    recommendation = sample_bodies['RAG_Recommendation'].astype(object)
+    merged, closed = recommendation == 'Merge', recommendation == 'Close'
+
+    assert merged.any()
+    assert costs['Merge_Saving'][merged].tolist() == pytest.approx((0.6 * costs['Annual_Cost'][merged]).tolist())
+    assert (costs['Merge_Saving'][~merged] == 0).all()
+    assert costs['Close_Saving'][closed].tolist() == pytest.approx(costs['Annual_Cost'][closed].tolist())
+    assert (costs['Close_Saving'][~closed] == 0).all()
+    assert costs['Total_Saving'].tolist() == pytest.approx(costs[list(SAVING_CATEGORIES)].sum(axis=1).tolist())
+    assert (costs['Total_Saving'] <= costs['Annual_Cost']).all()
+
+    totals, total = savings_summary(costs)
+    assert totals[SAVING_CATEGORIES['Merge_Saving']] == pytest.approx(costs['Merge_Saving'].sum())
+    assert total == pytest.approx(costs['Total_Saving'].sum())
+
+
+def test_model_changes_flow_through(sample_bodies):
+    model = default_cost_model()
+    model['secretariat_rate'] *= 2
+    assert (governance_costs(sample_bodies, model)['Annual_Cost'] > governance_costs(sample_bodies)['Annual_Cost']).all()
+    assert default_cost_model()['secretariat_rate'] == 35
+
+
+def test_pair_saving_is_the_merge_share_of_the_cheaper_body(sample_bodies):
+    costs = governance_costs(sample_bodies)
+    first, second = sample_bodies.index[:2]
+    pairs = pd.DataFrame({'Body_A': [first], 'Body_B': [second]})
+    expected = 0.6 * min(costs.loc[first, 'Annual_Cost'], costs.loc[second, 'Annual_Cost'])
+    assert pair_savings(costs, pairs).iloc[0] == pytest.approx(expected)
+    assert pair_savings(costs, pairs.iloc[:0]).empty
+
+
+def test_format_pounds():
+    assert format_pounds(135000) == "£135,000"
+    assert format_pounds(85499, short=True) == "£85K"
@@ -0,0 +1,105 @@
+"""Per-session overlays over the shared base dataset"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from governance.dataset import SessionDataset
+from governance.metrics import dataset_hash
+from governance.search import SearchIndex
+
+
+@pytest.fixture
+def dataset(sample_bodies):
+    return SessionDataset(sample_bodies, dataset_hash(sample_bodies))
+
+
+def _new_body(sample_bodies, name):
+    return dict(sample_bodies.iloc[0].to_dict(), Name=name, Outcome_Focus="Riverside regeneration")
+
+
+def _values(series):
+    return series.array.codes if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+
+
+def _assert_matches_merge(dataset):
+    # The patched frame is what a full merge of the overlay onto the base would give
+    pd.testing.assert_frame_equal(dataset.frame, dataset._merge())
+
+
+def test_unedited_session_returns_the_base(dataset, sample_bodies):
+    assert dataset.frame is sample_bodies
+    assert not dataset.has_edits
+
+
+def test_update_delete_and_re_add(dataset, sample_bodies):
+    body_id = sample_bodies.index[1]
+    base_copy = sample_bodies.copy()
+
+    dataset.update(body_id, {'Name': "Renamed Board", 'RAG_Status': 'Red', 'Efficiency_Score': 1})
+    assert dataset.frame.loc[body_id, 'Name'] == "Renamed Board"
+    assert dataset.frame.loc[body_id, 'RAG_Status'] == 'Red'
+    assert dataset.frame['RAG_Status'].dtype == sample_bodies['RAG_Status'].dtype
+    _assert_matches_merge(dataset)
+
+    dataset.delete(body_id)
+    assert body_id not in dataset.frame.index
+    _assert_matches_merge(dataset)
+
+    dataset.add(body_id, _new_body(sample_bodies, "Re-added Board"))
+    assert dataset.frame.loc[body_id, 'Name'] == "Re-added Board"
+    assert list(dataset.frame.index) == list(sample_bodies.index)
+    _assert_matches_merge(dataset)
+
+    new_id = sample_bodies.index.max() + 1
+    dataset.add(new_id, _new_body(sample_bodies, "New Board"))
+    assert dataset.frame.index[-1] == new_id
+    _assert_matches_merge(dataset)
+
+    # The shared base is never modified
+    pd.testing.assert_frame_equal(sample_bodies, base_copy)
+
+
+def test_edit_shares_unchanged_columns_with_the_base(dataset, sample_bodies):
+    dataset.update(sample_bodies.index[0], {'Name': "Renamed Board"})
+    for column in ['Efficiency_Score', 'Level']:
+        assert np.shares_memory(_values(dataset.frame[column]), _values(sample_bodies[column]))
+    assert sample_bodies.loc[sample_bodies.index[0], 'Name'] != "Renamed Board"
+
+
+def test_unknown_category_falls_back_to_a_full_merge(dataset, sample_bodies):
+    dataset.update(sample_bodies.index[0], {'Level': 'Regional'})
+    assert dataset.frame.loc[sample_bodies.index[0], 'Level'] == 'Regional'
+    _assert_matches_merge(dataset)
+
+
+def test_version_hash_follows_edits(dataset, sample_bodies):
+    before = dataset.version_hash
+    dataset.update(sample_bodies.index[0], {'Name': "Renamed Board"})
+    assert dataset.version_hash != before
+    assert dataset.version_hash == dataset_hash(dataset._merge())
+
+
+def test_search_index_follows_the_overlay(dataset, sample_bodies):
+    first, second = sample_bodies.index[:2]
+    dataset.search("board")
+    shared = dataset.search_index.base
+
+    dataset.update(first, {'Name': "Zebra Crossing Panel"})
+    dataset.delete(second)
+    new_id = sample_bodies.index.max() + 1
+    dataset.add(new_id, _new_body(sample_bodies, "Zebra Habitat Forum"))
+
+    assert sorted(body_id for body_id, _ in dataset.search("zebra")) == sorted([first, new_id])
+    assert all(body_id != second for body_id, _ in dataset.search(sample_bodies.loc[second, 'Name']))
+    # Same results and scores as an index rebuilt over the session's bodies
+    rebuilt = SearchIndex.from_frame(dataset.frame)
+    for text in ["zebra", "board", "riverside", "procurement"]:
+        assert dataset.search(text) == pytest.approx(rebuilt.search(text))
+    # The shared index is untouched
+    assert shared.search("zebra") == []
+    assert second in shared.body_terms
+
+
+def test_search_index_built_after_edits_includes_them(dataset, sample_bodies):
+    dataset.update(sample_bodies.index[0], {'Name': "Zebra Crossing Panel"})
+    assert [body_id for body_id, _ in dataset.search("zebra")] == [sample_bodies.index[0]]
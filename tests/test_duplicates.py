@@ -0,0 +1,72 @@
+"""Near-duplicate detection: MinHash signatures, LSH candidates and recall"""
+import itertools
+import zlib
+
+import numpy as np
+
+from governance import duplicates
+from governance.duplicates import body_features, drop_common_features, find_duplicates, lsh_candidates, minhash_signatures
+
+
+def test_sample_register_duplicates(sample_bodies):
+    pairs = find_duplicates(sample_bodies)
+    names = {frozenset(pair) for pair in zip(pairs['Name_A'], pairs['Name_B'])}
+    assert frozenset({'Commercial Gateway Review Board', 'Procuring Board'}) in names
+    assert (pairs['Similarity'] >= duplicates.DEFAULT_THRESHOLD).all()
+
+
+def test_planted_duplicate_is_found(synthetic_register):
+    df = synthetic_register(500)
+    df.loc[df.index[1], ['Value_Chain_Activities', 'Primary_Stakeholders', 'Outcome_Focus']] = \
+        df.loc[df.index[0], ['Value_Chain_Activities', 'Primary_Stakeholders', 'Outcome_Focus']].to_numpy()
+    pairs = find_duplicates(df)
+    assert (df.index[0], df.index[1]) in set(zip(pairs['Body_A'], pairs['Body_B']))
+
+
+def test_lsh_candidates_stay_a_small_share_of_pairs(synthetic_register):
+    # A small vocabulary gives every pair some background similarity; too narrow
+    # bands used to make about a tenth of all pairs candidates
+    df = synthetic_register(2000, vocabulary=100)
+    signatures = minhash_signatures(drop_common_features(body_features(df)))
+    left, _ = lsh_candidates(signatures)
+    assert len(left) < 0.04 * len(df) * (len(df) - 1) / 2
+
+
+def test_high_similarity_pairs_are_all_found(synthetic_register):
+    df = synthetic_register(1000, vocabulary=100)
+    features = drop_common_features(body_features(df))
+    expected = {
+        (i, j) for i, j in itertools.combinations(range(len(df)), 2)
+        if features[i] and len(features[i] & features[j]) / len(features[i] | features[j]) >= 0.5
+    }
+    pairs = find_duplicates(df)
+    found = set(zip(df.index.get_indexer(pairs['Body_A']), df.index.get_indexer(pairs['Body_B'])))
+    assert expected <= found
+
+
+def test_chunking_does_not_change_results(synthetic_register, monkeypatch):
+    df = synthetic_register(600, vocabulary=100)
+    whole = find_duplicates(df)
+    monkeypatch.setattr(duplicates, 'SIGNATURE_CHUNK_SIZE', 7)
+    monkeypatch.setattr(duplicates, 'CANDIDATE_CHUNK_SIZE', 13)
+    chunked = find_duplicates(df)
+    assert whole[['Body_A', 'Body_B']].equals(chunked[['Body_A', 'Body_B']])
+    assert np.allclose(whole['Estimate'], chunked['Estimate'])
+
+
+def test_every_permutation_is_used_by_a_band():
+    assert duplicates.NUM_PERM == duplicates.BANDS * duplicates.ROWS_PER_BAND
+
+
+def test_signatures_match_exact_modular_hashing():
+    features = [{'activity:a', 'stakeholder:b'}, {'outcome:c'}, set()]
+    signatures = minhash_signatures(features, num_perm=16)
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, 2 ** 32 - 1, size=16, dtype=np.uint64).tolist()
+    b = rng.randint(1, 2 ** 32 - 1, size=16, dtype=np.uint64).tolist()
+    prime = int(duplicates._PRIME)
+    for row, feature_set in enumerate(features[:2]):
+        hashes = [zlib.crc32(feature.encode('utf-8')) for feature in feature_set]
+        expected = [min((x * a_k + b_k) % prime for x in hashes) for a_k, b_k in zip(a, b)]
+        assert signatures[row].tolist() == expected
+    assert (signatures[2] == duplicates._EMPTY).all()
@@ -0,0 +1,45 @@
+"""Chunked data exports, the ZIP bundle and network edge tables"""
+import io
+import json
+import zipfile
+
+import pandas as pd
+import pytest
+
+from governance.exporter import bundle_file, edge_frames, export_file
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'json', 'jsonl'])
+def test_chunked_exports_match_a_single_write(sample_bodies, fmt):
+    frame = sample_bodies.astype(str)
+    with export_file(frame, fmt, chunksize=3) as exported:
+        text = exported.read().decode('utf-8')
+    if fmt == 'csv':
+        assert text.count('Name,Type') == 1
+        assert pd.read_csv(io.StringIO(text))['Name'].tolist() == frame['Name'].tolist()
+    elif fmt == 'json':
+        assert [record['Name'] for record in json.loads(text)] == frame['Name'].tolist()
+    else:
+        assert [json.loads(line)['Name'] for line in text.splitlines()] == frame['Name'].tolist()
+
+
+def test_empty_json_export_is_an_empty_array(sample_bodies):
+    with export_file(sample_bodies.iloc[:0], 'json') as exported:
+        assert json.loads(exported.read()) == []
+
+
+def test_edge_frames_are_chunked_and_complete(sample_bodies):
+    whole = pd.concat(edge_frames(sample_bodies['Name'], sample_bodies['Primary_Stakeholders']))
+    chunked = list(edge_frames(sample_bodies['Name'], sample_bodies['Primary_Stakeholders'], chunksize=1))
+    assert len(chunked) == len(whole)
+    assert (whole['Shared_Stakeholders'] > 0).all()
+
+
+def test_bundle_contains_every_export(sample_bodies):
+    activities = pd.DataFrame({'Activity': ['Procurement'], 'Bodies': [2]})
+    with bundle_file(sample_bodies, {'Rivalry': 3}, activities, pdf=lambda: b'%PDF-test') as bundle:
+        names = zipfile.ZipFile(bundle).namelist()
+    assert names == [
+        'governance_bodies.csv', 'five_forces.json', 'value_chain_activities.csv',
+        'network_edges.csv', 'governance_report.pdf',
+    ]
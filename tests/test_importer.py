@@ -0,0 +1,56 @@
+"""Bulk import of bodies and the validation rules shared with the forms"""
+import io
+
+import pytest
+
+from governance.importer import import_bodies
+from governance.storage import BodyStore
+from governance.validation import validate_body, validate_frame
+
+
+@pytest.fixture
+def store():
+    return BodyStore(':memory:')
+
+
+def _csv(frame):
+    return io.StringIO(frame.to_csv(index=False))
+
+
+def test_valid_rows_are_imported(store, sample_bodies):
+    result = import_bodies(store, _csv(sample_bodies), 'bodies.csv')
+    assert result.errors == []
+    assert len(result.body_ids) == len(sample_bodies)
+
+
+def test_invalid_rows_are_reported_by_file_line(store, sample_bodies):
+    frame = sample_bodies.astype(object)
+    frame.loc[frame.index[1], 'Level'] = 'Galactic'
+    frame.loc[frame.index[2], 'Efficiency_Score'] = 9
+    result = import_bodies(store, _csv(frame), 'bodies.csv')
+    assert {line for line, _ in result.errors} == {3, 4}
+    assert len(result.body_ids) == len(frame) - 2
+
+
+@pytest.mark.parametrize('column', ['Level', 'RAG_Status', 'Efficiency_Score'])
+def test_missing_required_column_rejects_every_row(store, sample_bodies, column):
+    result = import_bodies(store, _csv(sample_bodies.drop(columns=[column])), 'bodies.csv')
+    assert result.body_ids == []
+    assert result.rows_rejected == len(sample_bodies)
+    assert all(message == f"{column.replace('_', ' ')} column is missing"
+               for _, message in result.errors if 'column is missing' in message)
+    assert len(store.load_bodies()) == 0
+
+
+def test_unknown_columns_are_listed(store, sample_bodies):
+    result = import_bodies(store, _csv(sample_bodies.assign(Notes='x')), 'bodies.csv')
+    assert result.unknown_columns == ['Notes']
+
+
+def test_validate_body_matches_frame_rules(sample_bodies):
+    body = sample_bodies.iloc[0].to_dict()
+    assert validate_body(body) == []
+    assert validate_body({**body, 'Name': ' '}) == ["Body Name is required"]
+    del body['Cost_Impact']
+    assert validate_body(body) == ["Cost Impact column is missing"]
+    assert validate_frame(sample_bodies) == []
@@ -0,0 +1,26 @@
+"""Layout caching and the position hash used to key network figures"""
+import networkx as nx
+import numpy as np
+
+from governance.layout import LayoutCache, graph_key, positions_key
+
+
+def test_positions_key_follows_positions_not_order():
+    pos = {'a': np.array([0.0, 1.0]), 'b': np.array([0.5, -0.5])}
+    assert positions_key(pos) == positions_key(dict(reversed(list(pos.items()))))
+    moved = dict(pos, b=np.array([0.5, -0.25]))
+    assert positions_key(moved) != positions_key(pos)
+
+
+def test_warm_started_sessions_get_different_keys_for_the_same_graph():
+    graph = nx.path_graph(6)
+    other_session = LayoutCache()
+    # This session laid out a different graph first, so its warm start differs
+    session = LayoutCache()
+    session.get_layout(nx.star_graph(5))
+
+    pos = session.get_layout(graph)
+    other = other_session.get_layout(graph)
+    assert graph_key(graph) == graph_key(graph.copy())
+    assert positions_key(pos) != positions_key(other)
+    assert positions_key(session.get_layout(graph)) == positions_key(pos)
@@ -0,0 +1,40 @@
+"""Derived encodings and the per-kind derived cache"""
+from governance.browse import sort_order
+from governance.metrics import COST_SCALE, DerivedCache, compute_derived, dataset_hash, get_derived
+from governance.scenarios import get_scenario_engine
+
+
+def test_derived_columns_follow_the_scales(sample_bodies):
+    derived = compute_derived(sample_bodies)
+    assert list(derived.index) == list(sample_bodies.index)
+    assert (derived['Cost_Numeric'] == sample_bodies['Cost_Impact'].astype(object).map(COST_SCALE)).all()
+    expected = sample_bodies['Fairer_Westminster_Alignment'].astype(object).str.split(', ').str.len()
+    assert (derived['Principle_Count'] == expected).all()
+
+
+def test_version_hash_follows_content(sample_bodies):
+    assert dataset_hash(sample_bodies) == dataset_hash(sample_bodies.copy())
+    changed = sample_bodies.copy()
+    changed.loc[changed.index[0], 'Name'] = "Renamed"
+    assert dataset_hash(changed) != dataset_hash(sample_bodies)
+    assert get_derived(sample_bodies, 'v1') is get_derived(sample_bodies, 'v1')
+
+
+def test_each_kind_has_its_own_bound():
+    cache = DerivedCache(sizes={'small': 2}, default_size=1)
+    for number in range(3):
+        cache.get(('small', number), lambda: number)
+    cache.get(('other', 'a'), lambda: 'a')
+    assert ('small', 0) not in cache
+    assert ('small', 1) in cache and ('small', 2) in cache
+    assert ('other', 'a') in cache
+
+
+def test_sorting_does_not_evict_the_scenario_engine(sample_bodies):
+    engine = get_scenario_engine(sample_bodies, 'sorting-test')
+    # Sort by every column in both directions, on several dataset versions
+    for version in range(3):
+        for column in sample_bodies.columns:
+            for ascending in (True, False):
+                sort_order(sample_bodies, column, ascending, version=f"sorting-test-{version}")
+    assert get_scenario_engine(sample_bodies, 'sorting-test') is engine
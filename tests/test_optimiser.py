@@ -0,0 +1,114 @@
+"""Minimal governance set: coverage is kept, optimum on small registers, solver status handling"""
+import itertools
+
+import numpy as np
+import pytest
+from scipy import optimize
+
+from governance import optimiser
+from governance.costs import governance_costs
+from governance.optimiser import EXACT, GREEDY, TIME_LIMITED, coverage_matrix, exact_cover, greedy_cover, minimal_set
+
+
+def _covers_everything(matrix, rows):
+    return ((np.asarray(matrix[rows].sum(axis=0)).ravel() > 0) == (np.asarray(matrix.sum(axis=0)).ravel() > 0)).all()
+
+
+def test_sample_register_matches_brute_force(sample_bodies):
+    result = minimal_set(sample_bodies)
+    matrix, _ = coverage_matrix(sample_bodies)
+    costs = governance_costs(sample_bodies)['Annual_Cost'].to_numpy()
+    best = min(
+        costs[list(rows)].sum()
+        for size in range(1, len(sample_bodies) + 1)
+        for rows in itertools.combinations(range(len(sample_bodies)), size)
+        if _covers_everything(matrix, list(rows))
+    )
+    assert result.method == EXACT
+    assert costs[result.keep].sum() == pytest.approx(best)
+
+
+def test_greedy_keeps_coverage_and_required_rows(synthetic_register):
+    frame = synthetic_register(400, vocabulary=150)
+    matrix, _ = coverage_matrix(frame)
+    costs = governance_costs(frame)['Annual_Cost'].to_numpy()
+    chosen = greedy_cover(matrix, costs, required=np.array([5]))
+    assert _covers_everything(matrix, chosen)
+    assert 5 in chosen
+
+
+def test_always_keep_is_kept(sample_bodies):
+    body = sample_bodies.index[0]
+    assert body in minimal_set(sample_bodies, keep=[body]).kept_ids
+
+
+def test_unknown_keep_is_rejected(sample_bodies):
+    with pytest.raises(ValueError):
+        minimal_set(sample_bodies, keep=[999])
+
+
+def _fake_milp(status, mip_gap, pick_all=True):
+    def milp(c, **kwargs):
+        x = np.ones(len(c)) if pick_all else None
+        return optimize.OptimizeResult(x=x, status=status, mip_gap=mip_gap, success=status == 0)
+    return milp
+
+
+def test_time_limited_solution_is_not_labelled_exact(sample_bodies, monkeypatch):
+    # Status 1: the time limit was reached with a feasible, unproven solution
+    monkeypatch.setattr(optimize, 'milp', _fake_milp(1, 0.4))
+    matrix, _ = coverage_matrix(sample_bodies)
+    rows, optimal = exact_cover(matrix, np.ones(len(sample_bodies)))
+    assert not optimal
+    # Keeping every body is no cheaper than the heuristic, so its set is used
+    assert minimal_set(sample_bodies).method == GREEDY
+
+
+def test_cheaper_time_limited_solution_is_marked(synthetic_register, monkeypatch):
+    frame = synthetic_register(60, vocabulary=40)
+    costs = governance_costs(frame)['Annual_Cost'].to_numpy()
+    optimum = minimal_set(frame).keep
+
+    def milp(c, **kwargs):
+        x = np.zeros(len(c))
+        x[optimum] = 1
+        return optimize.OptimizeResult(x=x, status=1, mip_gap=0.2, success=False)
+
+    monkeypatch.setattr(optimize, 'milp', milp)
+    monkeypatch.setattr(optimiser, 'greedy_cover', lambda matrix, costs, required=None: np.arange(len(costs)))
+    result = minimal_set(frame)
+    assert result.method == TIME_LIMITED
+    assert costs[result.keep].sum() < costs.sum()
+
+
+def test_large_gap_is_not_optimal(sample_bodies, monkeypatch):
+    monkeypatch.setattr(optimize, 'milp', _fake_milp(0, 0.05))
+    matrix, _ = coverage_matrix(sample_bodies)
+    assert exact_cover(matrix, np.ones(len(sample_bodies))) == (pytest.approx(np.arange(len(sample_bodies))), False)
+
+
+def test_unsolved_programme_falls_back_to_greedy(sample_bodies, monkeypatch):
+    monkeypatch.setattr(optimize, 'milp', _fake_milp(1, None, pick_all=False))
+    assert minimal_set(sample_bodies).method == GREEDY
+
+
+def test_large_registers_skip_the_solver(synthetic_register, monkeypatch):
+    def milp(*args, **kwargs):
+        raise AssertionError("solver should not run")
+
+    monkeypatch.setattr(optimize, 'milp', milp)
+    frame = synthetic_register(optimiser.EXACT_MAX_BODIES + 1, vocabulary=150)
+    assert minimal_set(frame).method == GREEDY
+
+
+def test_empty_register_keeps_nothing(sample_bodies):
+    result = minimal_set(sample_bodies.iloc[:0])
+    assert (result.kept_ids, result.removed_ids, result.saving) == ([], [], 0)
+    assert result.removed().empty
+
+
+def test_nothing_to_cover_keeps_only_the_bodies_asked_for(sample_bodies):
+    frame = sample_bodies.iloc[:3].assign(Value_Chain_Activities='', Primary_Stakeholders='')
+    result = minimal_set(frame, keep=[frame.index[1]], kinds=['Activity', 'Stakeholder'])
+    assert result.kept_ids == [frame.index[1]]
+    assert len(result.removed()) == 2
@@ -0,0 +1,36 @@
+"""Stakeholder-overlap edges match the original pairwise set intersections"""
+import itertools
+import random
+
+import pytest
+
+from governance.overlap import incidence_matrix, overlap_edges, tokenize
+
+
+def _pairwise_edges(names, values):
+    # The Network View's original nested loop over every pair of bodies
+    edges = []
+    for (i, name_a), (j, name_b) in itertools.combinations(enumerate(names), 2):
+        shared = tokenize(values[i]) & tokenize(values[j])
+        if shared:
+            edges.append((name_a, name_b, {'weight': len(shared)}))
+    return edges
+
+
+@pytest.mark.parametrize('bodies, groups', [(8, 6), (120, 40)])
+def test_edges_match_pairwise_loop(bodies, groups):
+    rng = random.Random(bodies)
+    stakeholders = [f"Group {i}" for i in range(groups)]
+    names = [f"Body {i}" for i in range(bodies)]
+    values = [', '.join(rng.sample(stakeholders, rng.randint(1, 4))) for _ in range(bodies)]
+    assert overlap_edges(names, values) == _pairwise_edges(names, values)
+
+
+def test_missing_values_have_no_tokens():
+    matrix, vocabulary = incidence_matrix(["Residents, Businesses", None, "Residents"])
+    assert sorted(vocabulary) == ['Businesses', 'Residents']
+    assert matrix.shape == (3, 2)
+    assert matrix[1].nnz == 0
+    assert overlap_edges(['A', 'B', 'C'], ["Residents, Businesses", None, "Residents"]) == [
+        ('A', 'C', {'weight': 1}),
+    ]
@@ -0,0 +1,46 @@
+"""Query language and indexed filters agree with plain pandas masks"""
+import numpy as np
+import pytest
+
+from governance.query import TEXT_COLUMNS, BodyIndex, QueryError
+
+
+@pytest.fixture
+def index(synthetic_register):
+    return BodyIndex(synthetic_register(200))
+
+
+def _any_text(df, text):
+    return np.logical_or.reduce([df[column].astype(str).str.contains(text, regex=False) for column in TEXT_COLUMNS])
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Efficiency_Score < 3", lambda df: df['Efficiency_Score'] < 3),
+    ("Duplication_Risk >= 4 AND RAG_Status = Red", lambda df: (df['Duplication_Risk'] >= 4) & (df['RAG_Status'] == 'Red')),
+    ("Cost_Impact in (High, Very High)", lambda df: df['Cost_Impact'].isin(['High', 'Very High'])),
+    ("Cost_Impact >= High", lambda df: df['Cost_Impact'].isin(['High', 'Very High'])),
+    ("NOT Level = Community", lambda df: df['Level'] != 'Community'),
+    ("RAG_Status = Red OR (Value_Added <= 2 AND NOT level = strategic)",
+     lambda df: (df['RAG_Status'] == 'Red') | ((df['Value_Added'] <= 2) & (df['Level'] != 'Strategic'))),
+    ("Name ~ 'body 1'", lambda df: df['Name'].str.lower().str.contains('body 1', regex=False)),
+    # Words after a condition's value are free-text terms, not part of the value
+    ("RAG_Status = Red 17", lambda df: (df['RAG_Status'] == 'Red') & _any_text(df, '17')),
+    ("Cost_Impact = Very High 17", lambda df: (df['Cost_Impact'] == 'Very High') & _any_text(df, '17')),
+    ("Name ~ body 17", lambda df: df['Name'].str.lower().str.contains('body', regex=False) & _any_text(df, '17')),
+    ("", lambda df: df['Name'].notna()),
+])
+def test_query_matches_pandas(index, text, expected):
+    assert np.array_equal(index.query(text), expected(index.df).to_numpy(dtype=bool))
+
+
+def test_filter_intersects_selections(index):
+    df = index.df
+    result = index.filter(RAG_Status=['Red', 'Amber'], Level=['Strategic'])
+    assert np.array_equal(result, (df['RAG_Status'].isin(['Red', 'Amber']) & (df['Level'] == 'Strategic')).to_numpy())
+    assert index.filter(RAG_Status=list(df['RAG_Status'].cat.categories)).all()
+
+
+@pytest.mark.parametrize('text', ["Colour = Red", "Efficiency_Score <", "(RAG_Status = Red", "Level in (Strategic"])
+def test_bad_queries_raise_query_error(index, text):
+    with pytest.raises(QueryError):
+        index.query(text)
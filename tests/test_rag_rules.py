@@ -0,0 +1,52 @@
+"""Automated RAG scoring, its rules and their explanations"""
+import pytest
+
+from governance.query import QueryError
+from governance.rag_rules import default_rag_config, score_rag
+
+
+def test_default_rules_score_every_body(sample_bodies):
+    result = score_rag(sample_bodies)
+    assert len(result.frame) == len(sample_bodies)
+    assert set(result.status) <= {'Green', 'Amber', 'Red'}
+    assert ((result.score >= 0) & (result.score <= 1)).all()
+
+
+def test_cap_and_recommend_rules_apply(sample_bodies):
+    config = default_rag_config()
+    config['rules'] = [
+        {'name': "Cap everything", 'when': "Efficiency_Score >= 1", 'cap': 'Red'},
+        {'name': "Merge everything", 'when': "Efficiency_Score >= 1", 'recommend': 'Merge'},
+    ]
+    result = score_rag(sample_bodies, config)
+    assert set(result.status) == {'Red'}
+    assert set(result.recommendation) == {'Merge'}
+    assert set(result.recommended_by) == {"Merge everything"}
+
+
+def test_explain_lists_fired_rules(sample_bodies):
+    config = default_rag_config()
+    config['rules'] = [{'name': "Everything", 'when': "Efficiency_Score >= 1", 'cap': 'Amber'}]
+    lines = score_rag(sample_bodies, config).explain(sample_bodies.index[0])
+    assert any("Rule 'Everything'" in line for line in lines)
+    assert lines[-1].startswith("Result:")
+
+
+@pytest.mark.parametrize('rules, message', [
+    ([{'name': "Same", 'when': "Value_Added <= 2"}, {'name': "Same", 'when': "Duplication_Risk >= 4"}], "more than once"),
+    ([{'name': "", 'when': "Value_Added <= 2"}], "needs a name"),
+    ([{'when': "Value_Added <= 2"}], "needs a name"),
+    ([{'name': "No condition"}], "needs a condition"),
+])
+def test_invalid_rules_are_rejected(sample_bodies, rules, message):
+    config = default_rag_config()
+    config['rules'] = rules
+    with pytest.raises(ValueError, match=message):
+        score_rag(sample_bodies, config)
+
+
+def test_unparseable_condition_raises_query_error(sample_bodies):
+    config = default_rag_config()
+    config['rules'] = [{'name': "Broken", 'when': "Value_Added <="}]
+    with pytest.raises(QueryError):
+        score_rag(sample_bodies, config)
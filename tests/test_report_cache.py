@@ -0,0 +1,25 @@
+"""PDF report cache keys and the on-disk tier"""
+from governance import report_cache
+from governance.report_cache import ReportCache, content_hash
+
+
+def test_key_follows_content_and_options(sample_bodies):
+    key = content_hash(sample_bodies, {'Rivalry': 3}, {'report_date': '1 May 2025'})
+    assert key == content_hash(sample_bodies.copy(), {'Rivalry': 3}, {'report_date': '1 May 2025'})
+    assert key != content_hash(sample_bodies, {'Rivalry': 4}, {'report_date': '1 May 2025'})
+    assert key != content_hash(sample_bodies.iloc[:-1], {'Rivalry': 3}, {'report_date': '1 May 2025'})
+
+
+def test_new_report_format_does_not_reuse_cached_reports(sample_bodies, tmp_path, monkeypatch):
+    ReportCache(cache_dir=str(tmp_path)).put(content_hash(sample_bodies, {}), b"%PDF old layout")
+
+    monkeypatch.setattr(report_cache, 'REPORT_FORMAT_VERSION', report_cache.REPORT_FORMAT_VERSION + 1)
+    # A restarted app with the new format finds nothing for the same data
+    restarted = ReportCache(cache_dir=str(tmp_path))
+    assert restarted.get(content_hash(sample_bodies, {})) is None
+    assert restarted.get_or_build(content_hash(sample_bodies, {}), lambda: b"%PDF new layout") == b"%PDF new layout"
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    ReportCache(cache_dir=str(tmp_path)).put('abc', b"%PDF")
+    assert ReportCache(cache_dir=str(tmp_path)).get('abc') == b"%PDF"
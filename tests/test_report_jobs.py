@@ -0,0 +1,61 @@
+"""Background report builds: sharing, progress, caching and failures"""
+import threading
+import time
+
+from governance.report_cache import ReportCache
+from governance.report_jobs import DONE, FAILED, ReportJobQueue
+
+
+def _wait(job):
+    for _ in range(500):
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("report job did not finish")
+
+
+def test_repeated_requests_share_one_build(tmp_path):
+    queue = ReportJobQueue(ReportCache(cache_dir=str(tmp_path)))
+    release, calls = threading.Event(), []
+
+    def build(progress):
+        calls.append(1)
+        progress("Charts", 0.5)
+        release.wait(5)
+        return b"%PDF"
+
+    job = queue.submit('abc', build)
+    assert queue.submit('abc', build) is job
+    release.set()
+    assert _wait(job).status == DONE and job.result == b"%PDF"
+    assert (job.section, job.progress) == ("Complete", 1.0)
+    assert len(calls) == 1
+
+
+def test_cached_report_is_done_without_a_build(tmp_path):
+    cache = ReportCache(cache_dir=str(tmp_path))
+    cache.put('abc', b"%PDF")
+    job = ReportJobQueue(cache).submit('abc', lambda progress: b"%PDF rebuilt")
+    assert job.status == DONE and job.result == b"%PDF"
+
+
+def test_finished_report_is_served_from_the_cache(tmp_path):
+    queue = ReportJobQueue(ReportCache(cache_dir=str(tmp_path)))
+    first = _wait(queue.submit('abc', lambda progress: b"%PDF"))
+    second = queue.submit('abc', lambda progress: b"%PDF rebuilt")
+    assert second is not first and second.result == b"%PDF"
+
+
+def test_failed_build_reports_the_error_and_can_be_retried(tmp_path):
+    queue = ReportJobQueue(ReportCache(cache_dir=str(tmp_path)))
+
+    def broken(progress):
+        progress("Tables", 2.0)
+        raise RuntimeError("no fonts")
+
+    failed = _wait(queue.submit('abc', broken))
+    assert failed.status == FAILED and failed.error == "no fonts"
+    assert failed.progress == 1.0
+
+    retried = _wait(queue.submit('abc', lambda progress: b"%PDF"))
+    assert retried is not failed and retried.status == DONE
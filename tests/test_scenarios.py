@@ -0,0 +1,116 @@
+"""Scenario evaluation: merge/close effects, validation, candidates and the worker pool"""
+import multiprocessing
+import pickle
+
+import pytest
+
+from governance import scenarios as scenarios_module
+from governance.scenarios import Scenario, ScenarioEngine, ScenarioPool, candidate_scenarios, evaluate_scenarios
+
+
+@pytest.fixture
+def engine(sample_bodies):
+    return ScenarioEngine(sample_bodies)
+
+
+def test_baseline_is_the_current_register(engine, sample_bodies):
+    assert engine.baseline['Bodies'] == len(sample_bodies)
+    assert engine.baseline['Saving'] == 0
+
+
+def test_close_and_merge_reduce_bodies_and_cost(engine, sample_bodies):
+    first, second, third = sample_bodies.index[:3]
+    outcome = engine.evaluate(Scenario(merges=[[first, second]], closes=[third]))
+    assert outcome['Bodies'] == len(sample_bodies) - 2
+    assert (outcome['Merged'], outcome['Closed']) == (2, 1)
+    assert outcome['Saving'] > 0
+    assert outcome['Principles_Covered'] <= engine.baseline['Principles_Covered']
+
+
+def test_body_in_two_operations_is_rejected(engine, sample_bodies):
+    first, second = sample_bodies.index[:2]
+    with pytest.raises(ValueError):
+        engine.evaluate(Scenario(merges=[[first, second]], closes=[second]))
+    with pytest.raises(ValueError):
+        engine.evaluate(Scenario(closes=[999]))
+
+
+def test_candidates_use_distinct_bodies(sample_bodies):
+    candidates = candidate_scenarios(sample_bodies, limit=50)
+    assert 0 < len(candidates) <= 50
+    for scenario in candidates:
+        bodies = [body_id for group in scenario.merges for body_id in group] + scenario.closes
+        assert len(bodies) == len(set(bodies))
+
+
+def _batch(bodies, count=100):
+    """``count`` single-closure and pair-merge scenarios, enough to use a pool"""
+    ids = list(bodies.index)
+    single = [Scenario(closes=[body_id]) for body_id in ids]
+    pairs = [Scenario(merges=[[a, b]]) for a in ids for b in ids if a != b]
+    return (single + pairs) * (count // (len(single) + len(pairs)) + 1)
+
+
+class _RecordingPool:
+    """Runs tasks in-process through the worker entry points and records what each task carried"""
+
+    def __init__(self):
+        self.engine = None
+        self.payloads = []
+
+    def submit(self, engine, specs):
+        from concurrent.futures import Future
+
+        if self.engine is not engine:
+            scenarios_module._init_worker(engine)
+            self.engine = engine
+        self.payloads.append(pickle.dumps(specs))
+        future = Future()
+        future.set_result(scenarios_module._evaluate_specs(specs))
+        return future
+
+
+def test_pool_tasks_carry_only_scenarios(engine, sample_bodies):
+    candidates = _batch(sample_bodies)
+    pool = _RecordingPool()
+    pooled = evaluate_scenarios(engine, candidates, pool, chunksize=25)
+    serial = evaluate_scenarios(engine, candidates)
+
+    assert pooled.equals(serial)
+    assert len(pool.payloads) == -(-len(candidates) // 25)
+    assert max(len(payload) for payload in pool.payloads) < len(pickle.dumps(engine)) / 10
+
+
+def test_process_pool_matches_serial_and_follows_the_engine(engine, sample_bodies):
+    candidates = _batch(sample_bodies)
+    pool = ScenarioPool(1, multiprocessing.get_context('spawn'))
+    try:
+        assert evaluate_scenarios(engine, candidates, pool).equals(evaluate_scenarios(engine, candidates))
+
+        # A new dataset version gets workers started with its own engine
+        smaller = ScenarioEngine(sample_bodies.iloc[:4])
+        fewer = _batch(smaller.df)
+        assert evaluate_scenarios(smaller, fewer, pool).equals(evaluate_scenarios(smaller, fewer))
+        assert pool.versions == [engine.version, smaller.version]
+    finally:
+        pool.shutdown()
+
+
+def test_pool_keeps_workers_for_recent_versions(engine, sample_bodies):
+    pool = ScenarioPool(1, multiprocessing.get_context('spawn'), max_engines=2)
+    smaller = ScenarioEngine(sample_bodies.iloc[:4])
+    smallest = ScenarioEngine(sample_bodies.iloc[:3])
+    try:
+        pool.submit(engine, []).result()
+        workers = pool._executors[engine.version]
+        pool.submit(smaller, []).result()
+
+        # Switching back to an earlier version reuses its workers
+        pool.submit(engine, []).result()
+        assert pool._executors[engine.version] is workers
+
+        # A third version shuts down the least recently used one
+        pool.submit(smallest, []).result()
+        assert pool.versions == [engine.version, smallest.version]
+    finally:
+        pool.shutdown()
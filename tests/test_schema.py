@@ -0,0 +1,44 @@
+"""Compact column schema: categoricals, score dtypes and ordinal lookups"""
+import pandas as pd
+
+from governance.metrics import COST_SCALE
+from governance.schema import CATEGORIES, SCORE_COLUMNS, SCORE_DTYPE, apply_schema, categorical, ordinal
+
+
+def test_sample_register_is_stored_compactly(sample_bodies):
+    for column, known in CATEGORIES.items():
+        dtype = sample_bodies[column].dtype
+        assert isinstance(dtype, pd.CategoricalDtype) and dtype.ordered
+        assert list(dtype.categories[:len(known)]) == known
+    for column in SCORE_COLUMNS:
+        assert sample_bodies[column].dtype == SCORE_DTYPE
+
+    as_objects = sample_bodies.astype({column: object for column in CATEGORIES})
+    assert sample_bodies.memory_usage(deep=True).sum() < as_objects.memory_usage(deep=True).sum()
+
+
+def test_unknown_categories_are_kept_after_the_known_ones():
+    values = categorical(pd.Series(['Tactical', 'Regional', None, 'Strategic']), 'Level')
+    assert list(values.categories) == CATEGORIES['Level'] + ['Regional']
+    assert list(values[[0, 1, 3]]) == ['Tactical', 'Regional', 'Strategic']
+    assert values.isna()[2]
+    assert values.ordered and values.min() == 'Strategic'
+
+
+def test_missing_scores_use_the_nullable_dtype():
+    typed = apply_schema(pd.DataFrame({'Efficiency_Score': ['4', None], 'Value_Added': [3, 5]}))
+    assert typed['Efficiency_Score'].dtype == 'Int8'
+    assert typed['Efficiency_Score'].isna().tolist() == [False, True]
+    assert typed['Value_Added'].dtype == SCORE_DTYPE
+
+
+def test_applying_the_schema_twice_changes_nothing(sample_bodies):
+    again = apply_schema(sample_bodies)
+    pd.testing.assert_frame_equal(again, sample_bodies)
+    assert again['Level'].array is sample_bodies['Level'].array
+
+
+def test_ordinal_matches_mapping_every_row(sample_bodies):
+    by_code = ordinal(sample_bodies['Cost_Impact'], COST_SCALE)
+    by_row = sample_bodies['Cost_Impact'].astype(object).map(COST_SCALE).astype(float)
+    pd.testing.assert_series_equal(by_code, by_row)
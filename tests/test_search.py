@@ -0,0 +1,61 @@
+"""Full-text search: exact, prefix and fuzzy matches, ranking and incremental updates"""
+from governance.search import SearchIndex
+
+
+BODIES = {
+    1: {'Name': "Housing Board", 'Outcome_Focus': "Affordable homes", 'Primary_Stakeholders': "Residents"},
+    2: {'Name': "Climate Group", 'Outcome_Focus': "Net zero housing retrofit", 'Primary_Stakeholders': "Residents"},
+    3: {'Name': "Procurement Board", 'Outcome_Focus': "Value for money", 'Primary_Stakeholders': "Suppliers"},
+}
+
+
+def _index():
+    index = SearchIndex()
+    for body_id, body in BODIES.items():
+        index.add(body_id, body)
+    return index
+
+
+def _ids(results):
+    return [body_id for body_id, _ in results]
+
+
+def test_name_matches_rank_above_other_fields():
+    assert _ids(_index().search("housing")) == [1, 2]
+
+
+def test_every_word_must_match():
+    assert _ids(_index().search("housing residents")) == [1, 2]
+    assert _ids(_index().search("housing suppliers")) == []
+
+
+def test_prefix_and_one_edit_matches():
+    index = _index()
+    assert _ids(index.search("procure")) == [3]
+    assert _ids(index.search("climat")) == [2]
+    assert _ids(index.search("bord")) == [1, 3]
+
+
+def test_replace_and_remove_update_postings():
+    index = _index()
+    index.add(1, dict(BODIES[1], Name="Homes Board"))
+    assert _ids(index.search("housing")) == [2]
+    index.remove(2)
+    assert index.search("housing") == []
+    assert 'retrofit' not in index.postings
+    assert 'retrofit' not in index.vocabulary
+
+
+def test_copy_is_independent():
+    index = _index()
+    copy = index.copy()
+    copy.remove(3)
+    assert _ids(index.search("procurement")) == [3]
+    assert copy.search("procurement") == []
+
+
+def test_frame_index_finds_sample_bodies(sample_bodies):
+    index = SearchIndex.from_frame(sample_bodies)
+    assert len(index) == len(sample_bodies)
+    name = sample_bodies['Name'].iloc[0]
+    assert sample_bodies.index[0] in _ids(index.search(name))
@@ -0,0 +1,85 @@
+"""Snapshot round trips and reuse of the Arrow file kept next to a store"""
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from governance.sample_data import SAMPLE_DATA
+from governance.snapshot import Snapshot, open_store_snapshot, read_snapshot, snapshot_bytes, store_snapshot_path
+from governance.storage import BodyStore
+
+
+def _seeded_store(path):
+    store = BodyStore(path)
+    store.seed(SAMPLE_DATA['governance_bodies'])
+    return store
+
+
+@pytest.mark.parametrize('fmt', ['arrow', 'parquet'])
+def test_round_trip_keeps_bodies_and_indexes(sample_bodies, fmt):
+    five_forces = {'Rivalry': 3}
+    snapshot = Snapshot.from_bodies(sample_bodies, five_forces, revision=4, store_id='abc')
+    restored = read_snapshot(snapshot_bytes(snapshot, fmt))
+
+    pd.testing.assert_frame_equal(restored.bodies, sample_bodies)
+    pd.testing.assert_frame_equal(restored.principles, snapshot.principles)
+    assert restored.five_forces == five_forces
+    assert (restored.revision, restored.version_hash, restored.store_id) == (4, snapshot.version_hash, 'abc')
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        read_snapshot(b"Name,Level\n")
+
+
+def test_store_snapshot_is_reused_for_the_same_store(tmp_path):
+    store = _seeded_store(str(tmp_path / 'governance.db'))
+    first = open_store_snapshot(store, store.revision)
+    modified = os.path.getmtime(store_snapshot_path(store))
+
+    again = open_store_snapshot(store, store.revision)
+    assert os.path.getmtime(store_snapshot_path(store)) == modified
+    assert again.store_id == store.store_id
+    pd.testing.assert_frame_equal(again.bodies, first.bodies)
+
+
+def test_recreated_store_at_same_revision_does_not_load_old_snapshot(tmp_path):
+    path = str(tmp_path / 'governance.db')
+    old_store = _seeded_store(path)
+    old_revision, old_id = old_store.revision, old_store.store_id
+    open_store_snapshot(old_store, old_revision)
+    old_store.conn.close()
+
+    # Delete and recreate the database; its revision counter starts over at the same number
+    os.remove(path)
+    new_store = BodyStore(path)
+    new_store.seed(SAMPLE_DATA['governance_bodies'][:3])
+    assert new_store.revision == old_revision
+    assert new_store.store_id != old_id
+
+    snapshot = open_store_snapshot(new_store, new_store.revision)
+    assert len(snapshot.bodies) == 3
+    assert snapshot.store_id == new_store.store_id
+
+
+def test_valid_snapshot_has_no_errors(sample_bodies):
+    restored = read_snapshot(snapshot_bytes(Snapshot.from_bodies(sample_bodies)))
+    assert restored.missing_columns == []
+    assert restored.errors() == []
+
+
+def test_missing_required_column_is_reported(sample_bodies):
+    restored = read_snapshot(snapshot_bytes(Snapshot(sample_bodies.drop(columns=['Level']))))
+    assert restored.missing_columns == ['Level']
+    assert {message for _, message in restored.errors()} == {"Level column is missing"}
+
+
+def test_duplicate_ids_and_invalid_rows_are_reported(sample_bodies):
+    bodies = sample_bodies.astype(object)
+    bodies.index = [1, 1] + list(bodies.index[2:])
+    bodies.iloc[3, bodies.columns.get_loc('Efficiency_Score')] = 9
+    errors = read_snapshot(snapshot_bytes(Snapshot(bodies))).errors()
+    assert (1, "Body id is used more than once") in errors
+    assert (bodies.index[3], "Efficiency Score must be a whole number from 1 to 5") in errors
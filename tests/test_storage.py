@@ -0,0 +1,115 @@
+"""SQLite body store: ids, revisions, store identity and concurrent writers"""
+import sqlite3
+import threading
+
+import pandas as pd
+import pytest
+
+from governance.sample_data import SAMPLE_DATA
+from governance.storage import BODY_COLUMNS, BodyStore, MissingBodyError
+
+BODIES = SAMPLE_DATA['governance_bodies']
+
+
+@pytest.fixture
+def store():
+    store = BodyStore(':memory:')
+    store.seed(BODIES)
+    return store
+
+
+def test_every_write_bumps_the_revision(store):
+    assert store.revision == 0 and store.is_sample_data
+    body_id = store.insert_body(BODIES[0])
+    store.insert_bodies([[BODIES[1].get(name) for name in BODY_COLUMNS]])
+    store.update_body(body_id, {'RAG_Status': 'Red'})
+    store.update_bodies({body_id: {'RAG_Status': 'Amber'}})
+    store.delete_body(body_id)
+    store.replace_bodies(store.load_bodies())
+    assert store.revision == 6
+    assert not store.is_sample_data
+
+
+def test_store_id_persists_and_differs_between_databases(tmp_path):
+    first = BodyStore(str(tmp_path / 'a.db'))
+    second = BodyStore(str(tmp_path / 'b.db'))
+    assert first.store_id and first.store_id != second.store_id
+    assert BodyStore(str(tmp_path / 'a.db')).store_id == first.store_id
+
+
+def test_ids_of_deleted_bodies_are_never_reused(store):
+    last = store.load_bodies().index.max()
+    store.delete_body(last)
+    assert store.insert_body(BODIES[0]) == last + 1
+
+    store.delete_body(last + 1)
+    ids = store.insert_bodies([[body.get(name) for name in BODY_COLUMNS] for body in BODIES[:3]])
+    assert ids == [last + 2, last + 3, last + 4]
+    assert list(store.load_bodies().index[-3:]) == ids
+
+
+def test_update_of_a_deleted_body_raises_and_writes_nothing(store):
+    store.delete_body(1)
+    revision = store.revision
+    with pytest.raises(MissingBodyError) as raised:
+        store.update_body(1, {'RAG_Status': 'Red'})
+    assert raised.value.body_ids == [1]
+
+    with pytest.raises(MissingBodyError):
+        store.update_bodies({2: {'RAG_Status': 'Red'}, 1: {'RAG_Status': 'Red'}})
+    assert store.load_bodies().loc[2, 'RAG_Status'] == BODIES[1]['RAG_Status']
+    assert store.revision == revision
+
+
+def test_deleting_a_body_twice_records_one_write(store):
+    assert store.delete_body(1)
+    revision = store.revision
+    assert not store.delete_body(1)
+    assert store.revision == revision
+
+
+def test_replace_bodies_keeps_the_index_as_ids(store):
+    bodies = store.load_bodies().iloc[:3]
+    bodies.index = [10, 20, 30]
+    store.replace_bodies(bodies)
+    pd.testing.assert_frame_equal(store.load_bodies(), bodies, check_index_type=False)
+    assert store.insert_body(BODIES[0]) == 31
+
+
+def test_store_created_without_autoincrement_is_migrated(tmp_path):
+    path = str(tmp_path / 'old.db')
+    columns = ", ".join(f'"{name}" {sql_type}' for name, sql_type in BODY_COLUMNS.items())
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"CREATE TABLE governance_bodies (id INTEGER PRIMARY KEY, {columns})")
+        conn.execute("INSERT INTO governance_bodies (id, Name) VALUES (1, 'Kept'), (2, 'Deleted')")
+
+    store = BodyStore(path)
+    assert list(store.load_bodies()['Name']) == ['Kept', 'Deleted']
+    store.delete_body(2)
+    assert store.insert_body({'Name': 'New'}) == 3
+
+
+def test_concurrent_writers_get_distinct_ids(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    BodyStore(path).seed(BODIES)
+    stores = [BodyStore(path) for _ in range(4)]
+    ids, errors = [], []
+
+    def write(store):
+        try:
+            for _ in range(10):
+                ids.append(store.insert_body(BODIES[0]))
+            ids.extend(store.insert_bodies([[BODIES[1].get(name) for name in BODY_COLUMNS]] * 5))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(set(ids)) == len(ids) == 60
+    assert BodyStore(path).count() == len(BODIES) + 60
+    assert BodyStore(path).revision == 4 * 11
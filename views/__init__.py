@@ -0,0 +1,27 @@
+"""Sidebar pages, each loaded only when it is first opened
+
+Keeping heavy libraries (Plotly, NetworkX, SciPy, ReportLab) inside the page
+modules that use them means the Home page and every cold start only pay for
+what they render.
+"""
+import importlib
+
+# Sidebar label -> page module
+PAGES = {
+    "🏠 Home": "views.home",
+    "➕ Manage Bodies": "views.manage_bodies",
+    "🏛️ Governance Bodies": "views.governance_bodies",
+    "📊 Efficiency Analysis": "views.efficiency",
+    "👥 Stakeholder Analysis": "views.stakeholders",
+    "⛓️ Value Chain Mapping": "views.value_chain",
+    "⚡ Five Forces Analysis": "views.five_forces",
+    "🌐 Network View": "views.network",
+    "🎯 Fairer Westminster Dashboard": "views.fairer_westminster",
+    "🧪 Scenario Planner": "views.scenarios",
+    "📥 Export": "views.export",
+}
+
+
+def render_page(label):
+    """Import the page module for ``label`` (cached after the first time) and render it"""
+    importlib.import_module(PAGES[label]).render()
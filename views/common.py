@@ -0,0 +1,108 @@
+"""Session state and helpers shared by every page"""
+import os
+
+import streamlit as st
+
+from governance.alignment import get_principle_matrix as _get_principle_matrix
+from governance.costs import get_costs
+from governance.dataset import SessionDataset
+from governance.duplicates import get_duplicates
+from governance.figure_cache import FigureCache
+from governance.metrics import get_derived
+from governance.sample_data import SAMPLE_DATA
+from governance.snapshot import open_store_snapshot
+from governance.storage import BODY_STORE_PATH_ENV, DEFAULT_BODY_STORE_PATH, BodyStore
+
+
+@st.cache_resource
+def get_body_store():
+    """Process-wide SQLite store, seeded with the Westminster sample data when empty"""
+    store = BodyStore(os.environ.get(BODY_STORE_PATH_ENV, DEFAULT_BODY_STORE_PATH))
+    store.seed(SAMPLE_DATA['governance_bodies'])
+    return store
+
+
+@st.cache_resource(max_entries=2)
+def load_base_dataset(revision):
+    """Immutable bodies snapshot shared by every session opened at this store revision"""
+    snapshot = open_store_snapshot(get_body_store(), revision)
+    snapshot.seed_caches()
+    return snapshot
+
+
+def new_session_dataset():
+    """A fresh session view of the store's latest revision"""
+    snapshot = load_base_dataset(get_body_store().revision)
+    return SessionDataset(snapshot.bodies, snapshot.version_hash)
+
+
+def init_session_state():
+    """Initialise from the persistent store (falls back to sample data on first run)"""
+    if 'initialised' not in st.session_state:
+        store = get_body_store()
+        st.session_state.dataset = new_session_dataset()
+        st.session_state.five_forces = SAMPLE_DATA['five_forces']
+        st.session_state.initialised = True
+        st.session_state.example_mode = store.is_sample_data
+        st.session_state.edit_mode = False
+
+
+def reload_dataset():
+    """Start this session again from the store's latest revision, e.g. after a bulk import"""
+    st.session_state.dataset = new_session_dataset()
+
+
+def get_bodies_df():
+    """This session's governance bodies: the shared base plus the session's own edits"""
+    return st.session_state.dataset.frame
+
+
+def get_derived_metrics():
+    """Numeric encodings and counts for this session's bodies, computed once per dataset version"""
+    dataset = st.session_state.dataset
+    return get_derived(dataset.frame, dataset.version_hash)
+
+
+def get_principle_matrix():
+    """Boolean body x Fairer Westminster principle matrix for this session's bodies"""
+    dataset = st.session_state.dataset
+    return _get_principle_matrix(dataset.frame, dataset.version_hash)
+
+
+def get_governance_costs():
+    """Per-body annual overhead and savings estimates for this session's bodies"""
+    dataset = st.session_state.dataset
+    return get_costs(dataset.frame, dataset.version_hash)
+
+
+def get_duplicate_pairs():
+    """Likely duplicate body pairs (MinHash/LSH) for this session's bodies"""
+    dataset = st.session_state.dataset
+    return get_duplicates(dataset.frame, dataset.version_hash)
+
+
+def get_activity_table():
+    """Long body <-> value-chain activity table for this session's bodies"""
+    return st.session_state.dataset.activities
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide cache of built Plotly figures"""
+    return FigureCache()
+
+
+def cached_figure(chart_id, build, filters=None):
+    """Return ``build()``'s figure for this dataset version and filter state, reusing a cached one"""
+    return get_figure_cache().get_or_build(chart_id, st.session_state.dataset.version_hash, build, filters)
+
+
+def get_rag_color(status):
+    """Return HTML colour for RAG status"""
+    if status == "Green":
+        return "🟢"
+    elif status == "Amber":
+        return "🟡"
+    elif status == "Red":
+        return "🔴"
+    return "⚪"
@@ -0,0 +1,228 @@
+"""Efficiency Analysis page: RAG priorities and cost-value analysis"""
+import plotly.express as px
+import streamlit as st
+
+from governance.costs import DEFAULT_COST_MODEL, format_pounds, pair_savings, savings_summary
+from governance.duplicates import suggested_risk
+from governance.metrics import SPEED_ORDER
+from views.common import cached_figure, get_bodies_df, get_derived_metrics, get_duplicate_pairs, get_governance_costs
+
+
+
+def render():
+    st.title("📊 Efficiency Analysis")
+    
+    df = get_bodies_df()
+    derived = get_derived_metrics()
+    duplicates = get_duplicate_pairs()
+    costs = get_governance_costs()
+    
+    # Priority reform opportunities
+    st.subheader("🎯 Priority Reform Opportunities (RAG-Based)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🔴 Red Status - Urgent Action Required")
+        red_bodies = df[df['RAG_Status'] == 'Red']
+        if len(red_bodies) > 0:
+            for _, row in red_bodies.iterrows():
+                st.error(f"**{row['Name']}** - {row['RAG_Recommendation']} - Duplication: {row['Duplication_Risk']}/5")
+        else:
+            st.success("✅ No red status bodies")
+        
+        st.markdown("### 🟡 Amber Status - Review Needed")
+        amber_bodies = df[df['RAG_Status'] == 'Amber']
+        if len(amber_bodies) > 0:
+            for _, row in amber_bodies.iterrows():
+                st.warning(f"**{row['Name']}** - {row['RAG_Recommendation']} - Efficiency: {row['Efficiency_Score']}/5")
+        else:
+            st.success("✅ No amber status bodies")
+    
+    with col2:
+        st.markdown("### Merge Recommendations")
+        merge_rec = df[df['RAG_Recommendation'] == 'Merge']
+        if len(merge_rec) > 0:
+            for idx, row in merge_rec.iterrows():
+                st.warning(
+                    f"**{row['Name']}** - Duplication: {row['Duplication_Risk']}/5 - "
+                    f"saving {format_pounds(costs.at[idx, 'Merge_Saving'], short=True)}"
+                )
+            st.success(f"**Estimated saving: {format_pounds(costs['Merge_Saving'].sum(), short=True)} annually**")
+        else:
+            st.success("✅ No merge recommendations")
+        
+        if len(duplicates) > 0:
+            st.markdown("**💡 Consolidation Opportunities:**")
+            top_pairs = duplicates.head(3)
+            for (_, pair), saving in zip(top_pairs.iterrows(), pair_savings(costs, top_pairs)):
+                st.markdown(
+                    f"- {pair['Name_A']} + {pair['Name_B']} - {pair['Similarity']:.0%} shared remit "
+                    f"({', '.join(pair['Shared'])}) - merging saves about {format_pounds(saving, short=True)} a year"
+                )
+        
+        st.markdown("### Slow Decision-Making")
+        slow = df[df['Decision_Speed'] == 'Slow']
+        if len(slow) > 0:
+            for _, row in slow.iterrows():
+                st.info(f"**{row['Name']}** - {row['Cost_Impact']} cost, {row['Efficiency_Score']}/5 efficiency")
+        else:
+            st.success("✅ No slow decision bodies")
+    
+    st.markdown("---")
+    
+    # Duplicate detection
+    st.subheader("🔁 Duplicate Detection")
+    st.caption(
+        "Pairs of bodies sharing a large part of their value chain activities, stakeholders and outcome focus "
+        "(Jaccard similarity, candidates found with MinHash/LSH)"
+    )
+    
+    if len(duplicates) > 0:
+        st.dataframe(
+            duplicates.assign(
+                Similarity=duplicates['Similarity'].map('{:.0%}'.format),
+                Shared=duplicates['Shared'].str.join(', '),
+            )[['Name_A', 'Name_B', 'Similarity', 'Shared']],
+            hide_index=True,
+            use_container_width=True,
+        )
+    else:
+        st.success("✅ No likely duplicates found")
+    
+    # Sanity-check the entered Duplication Risk against the detected overlap
+    suggested = suggested_risk(df, duplicates)
+    # Bodies imported without a rating have nothing to compare
+    entered = df['Duplication_Risk'].astype('Int8')
+    mismatched = (suggested['Suggested_Risk'] - entered).abs().ge(2).fillna(False).astype(bool)
+    if mismatched.any():
+        st.markdown("**Duplication Risk to review** (entered rating differs from the detected overlap by 2 or more):")
+        st.dataframe(
+            df.loc[mismatched, ['Name', 'Duplication_Risk']].join(suggested),
+            hide_index=True,
+            use_container_width=True,
+        )
+    
+    st.markdown("---")
+    
+    # Governance overhead and savings from the cost model
+    st.subheader("💷 Governance Costs & Savings")
+    
+    savings, total_saving = savings_summary(costs)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Annual Governance Overhead", format_pounds(costs['Annual_Cost'].sum()))
+    with col2:
+        st.metric("Estimated Annual Savings", format_pounds(total_saving))
+    with col3:
+        st.metric("Savings Share", f"{total_saving / max(costs['Annual_Cost'].sum(), 1):.0%}")
+    
+    for label, saving in savings.items():
+        st.markdown(f"- {label}: {format_pounds(saving)}")
+    
+    cost_table = df[['Name', 'RAG_Recommendation']].join(
+        costs[['Members', 'Meetings_Per_Year', 'Meeting_Hours', 'Annual_Cost', 'Total_Saving']]
+    ).sort_values('Annual_Cost', ascending=False)
+    st.dataframe(
+        cost_table,
+        column_config={
+            'Annual_Cost': st.column_config.NumberColumn("Annual Cost", format="£%.0f"),
+            'Total_Saving': st.column_config.NumberColumn("Saving", format="£%.0f"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    
+    with st.expander("ℹ️ Cost model assumptions"):
+        st.markdown(f"""
+        Each body's annual overhead is attendee time (meetings plus {DEFAULT_COST_MODEL['preparation']:.0f} hour of
+        preparation per meeting hour, at the salary band for its level plus {DEFAULT_COST_MODEL['on_cost']:.0%} on-costs)
+        and {DEFAULT_COST_MODEL['secretariat_hours']} hours of secretariat support per meeting.
+        - Attendees: {DEFAULT_COST_MODEL['members_per_stakeholder']} per primary stakeholder group (at least {DEFAULT_COST_MODEL['min_members']})
+        - Meetings a year by level: {', '.join(f"{level} {count}" for level, count in DEFAULT_COST_MODEL['meetings_per_year'].items())}
+        - Meeting length by cost impact: {', '.join(f"{cost} {hours:g}h" for cost, hours in DEFAULT_COST_MODEL['meeting_hours'].items())}
+        - Salary bands: {', '.join(f"{level} {format_pounds(salary, short=True)}" for level, salary in DEFAULT_COST_MODEL['salary_bands'].items())}
+        - Merging saves {DEFAULT_COST_MODEL['recommendation_savings']['Merge']:.0%} of a body's overhead and closing it all;
+          continuing bodies save through process documentation (by process type) and {DEFAULT_COST_MODEL['reporting_saving']:.0%} through streamlined reporting
+        """)
+    
+    st.markdown("---")
+    
+    # Enhanced cost-value matrix
+    st.subheader("📊 Multi-Dimensional Analysis")
+    
+    tab1, tab2, tab3 = st.tabs(["Cost-Value Matrix", "Efficiency Distribution", "Decision Speed Impact"])
+    
+    with tab1:
+        def build_cost_value_matrix():
+            fig = px.scatter(
+                df, 
+                x=derived['Cost_Numeric'], 
+                y='Value_Added',
+                # Unrated bodies get the smallest bubble
+                size=df['Duplication_Risk'].fillna(1),
+                color='RAG_Status',
+                hover_name='Name',
+                hover_data=['Efficiency_Score', 'Decision_Speed', 'RAG_Recommendation'],
+                labels={'Cost_Numeric': 'Cost Impact', 'Value_Added': 'Value Added'},
+                title='Cost vs Value Analysis (coloured by RAG status)',
+                size_max=30,
+                color_discrete_map={'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+            )
+            fig.add_hline(y=3, line_dash="dash", line_color="gray", annotation_text="Value threshold")
+            fig.add_vline(x=2.5, line_dash="dash", line_color="gray", annotation_text="Cost threshold")
+            fig.update_layout(height=500)
+            return fig
+        
+        st.plotly_chart(cached_figure('efficiency.cost_value_matrix', build_cost_value_matrix), use_container_width=True)
+        
+        st.markdown("""
+        **Quadrant Analysis:**
+        - **High Value, Low Cost** (Top-Left): Optimal - maintain ✅
+        - **High Value, High Cost** (Top-Right): Valuable but expensive - optimise ⚠️
+        - **Low Value, Low Cost** (Bottom-Left): Marginal - review 🤔
+        - **Low Value, High Cost** (Bottom-Right): Critical issue - eliminate or redesign ❌
+        """)
+    
+    with tab2:
+        # Efficiency distribution by level
+        def build_efficiency_distribution():
+            fig = px.box(
+                df,
+                x='Level',
+                y='Efficiency_Score',
+                color='Innovation_Posture',
+                title='Efficiency Score Distribution by Level and Posture',
+                points='all'
+            )
+            fig.update_layout(height=400)
+            return fig
+        
+        st.plotly_chart(cached_figure('efficiency.efficiency_distribution', build_efficiency_distribution), use_container_width=True)
+        
+        st.markdown("**Insight:** Shows efficiency variation across organisational levels and innovation postures")
+    
+    with tab3:
+        # Decision speed vs efficiency
+        speed_order = SPEED_ORDER
+        by_speed = derived['Speed_Rank'].sort_values(kind='stable').index
+        
+        def build_decision_speed_impact():
+            fig = px.bar(
+                df.loc[by_speed, ['Name', 'Efficiency_Score', 'Decision_Speed']],
+                x='Name',
+                y='Efficiency_Score',
+                color='Decision_Speed',
+                title='Decision Speed Impact on Efficiency',
+                color_discrete_map={'Fast': '#90EE90', 'Medium': '#FFD700', 'Slow': '#DC143C'}
+            )
+            fig.update_layout(height=400, xaxis_tickangle=-45)
+            return fig
+        
+        st.plotly_chart(cached_figure('efficiency.decision_speed_impact', build_decision_speed_impact), use_container_width=True)
+        
+        avg_by_speed = df.groupby('Decision_Speed', observed=True)['Efficiency_Score'].mean()
+        st.markdown("**Average Efficiency by Decision Speed:**")
+        for speed in speed_order:
+            if speed in avg_by_speed.index:
+                st.markdown(f"- {speed}: {avg_by_speed[speed]:.1f}/5")
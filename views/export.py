@@ -0,0 +1,339 @@
+"""Export page: data downloads, PDF report and executive summary"""
+import importlib.util
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from governance.alignment import principle_counts
+from governance.costs import format_pounds, savings_summary
+from governance.exporter import EXPORT_FORMATS, bundle_file, export_file
+from governance.report_cache import REPORT_CACHE_DIR_ENV, ReportCache, content_hash
+from governance.report_jobs import DONE, FAILED, ReportJobQueue
+from governance.snapshot import SNAPSHOT_FORMATS, Snapshot, read_snapshot, snapshot_bytes
+from views.common import get_activity_table, get_bodies_df, get_body_store, get_derived_metrics, get_governance_costs, get_principle_matrix, reload_dataset
+
+
+@st.cache_resource
+def get_report_cache():
+    """Process-wide PDF report cache (set GOVERNANCE_REPORT_CACHE_DIR to keep reports on disk)"""
+    return ReportCache(cache_dir=os.environ.get(REPORT_CACHE_DIR_ENV))
+
+
+@st.cache_resource
+def get_report_queue():
+    """Process-wide background worker pool for PDF reports"""
+    return ReportJobQueue(get_report_cache())
+
+
+def _build_pdf(df, report_date, progress):
+    # ReportLab is only imported once a report is actually built
+    from governance.pdf_report import create_pdf_report
+    return create_pdf_report(df, report_date, progress).getvalue()
+
+
+def _export_bytes(df, fmt):
+    # Written chunk by chunk to a spooled temporary file, not built as one string
+    with export_file(df, fmt) as exported:
+        return exported.read()
+
+
+def report_key(df, five_forces):
+    """Cache key and options of today's PDF report for this content"""
+    options = {'report_date': datetime.now().strftime('%d %B %Y')}
+    return content_hash(df, five_forces, options), options
+
+
+def submit_pdf_report(df, five_forces):
+    """Queue a PDF report build, or return the cached/in-flight job for the same content"""
+    key, options = report_key(df, five_forces)
+    return get_report_queue().submit(
+        key, lambda progress: _build_pdf(df, options['report_date'], progress)
+    )
+
+
+def render():
+    st.title("📥 Export Analysis & Findings")
+    
+    df = get_bodies_df()
+    dataset = st.session_state.dataset
+    
+    # Download options
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📄 Data Export")
+        
+        export_format = st.selectbox(
+            "Format", list(EXPORT_FORMATS),
+            format_func=lambda fmt: EXPORT_FORMATS[fmt][0]
+        )
+        label, mime = EXPORT_FORMATS[export_format]
+        if export_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+            st.info("💡 Install `pyarrow` to export Parquet.")
+        else:
+            # Exported only when the button is clicked, not on every rerun
+            st.download_button(
+                f"Download Governance Bodies ({label})",
+                data=lambda: _export_bytes(df, export_format),
+                file_name=f"governance_bodies_{datetime.now().strftime('%Y%m%d')}.{export_format}",
+                mime=mime,
+                on_click="ignore"
+            )
+    
+    with col2:
+        st.subheader("📊 Analysis Export")
+        
+        five_forces_json = json.dumps(st.session_state.five_forces, indent=2)
+        st.download_button(
+            "Download Five Forces Analysis (JSON)",
+            data=five_forces_json,
+            file_name=f"five_forces_{datetime.now().strftime('%Y%m%d')}.json",
+            mime="application/json"
+        )
+    
+    st.markdown("---")
+    
+    # ZIP bundle of every export
+    st.subheader("🗜️ Export Bundle (ZIP)")
+    st.markdown("One archive with the governance bodies, Five Forces, value chain activities and network edges (CSV/JSON), plus the PDF report.")
+    
+    include_pdf = st.checkbox("Include PDF report (generated on download if not already built)", value=True)
+    five_forces = st.session_state.five_forces
+    activities = get_activity_table()
+    report_cache = get_report_cache()
+    
+    def build_bundle():
+        # Runs when the download is clicked; the archive is not kept afterwards
+        pdf = None
+        if include_pdf:
+            key, options = report_key(df, five_forces)
+            pdf = lambda: report_cache.get_or_build(key, lambda: _build_pdf(df, options['report_date'], None))
+        with bundle_file(df, five_forces, activities, pdf) as bundle:
+            return bundle.read()
+    
+    st.download_button(
+        "📥 Download Export Bundle (ZIP)",
+        data=build_bundle,
+        file_name=f"governance_export_{datetime.now().strftime('%Y%m%d')}.zip",
+        mime="application/zip",
+        on_click="ignore"
+    )
+    
+    st.markdown("---")
+    
+    # Columnar snapshots
+    st.subheader("💾 Snapshots (Arrow / Parquet)")
+    st.markdown("Save the whole governance map - bodies, Five Forces and derived indexes - in a binary columnar file that reopens without re-parsing.")
+    
+    snapshot = Snapshot(
+        df, st.session_state.five_forces, get_derived_metrics(), get_principle_matrix(),
+        version_hash=dataset.version_hash
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if importlib.util.find_spec('pyarrow') is None:
+            st.info("💡 Install `pyarrow` to save snapshots.")
+        else:
+            # Serialised only when a button is clicked, not on every rerun
+            for fmt, label in [('arrow', "Arrow IPC"), ('parquet', "Parquet")]:
+                st.download_button(
+                    f"Download Snapshot ({label})",
+                    data=lambda fmt=fmt: snapshot_bytes(snapshot, fmt),
+                    file_name=f"governance_map_{datetime.now().strftime('%Y%m%d')}.{fmt}",
+                    mime=SNAPSHOT_FORMATS[fmt],
+                    on_click="ignore"
+                )
+    
+    with col2:
+        uploaded = st.file_uploader("Open a saved snapshot", type=list(SNAPSHOT_FORMATS))
+        if uploaded is not None:
+            try:
+                restored = read_snapshot(uploaded.getvalue())
+            except ImportError:
+                st.error("❌ Opening snapshots needs the `pyarrow` package.")
+            except ValueError as e:
+                st.error(f"❌ Could not open {uploaded.name}: {e}")
+            else:
+                st.markdown(f"**{len(restored.bodies)} bodies** in {uploaded.name}")
+                errors = restored.errors()
+                if errors:
+                    st.error(f"❌ {uploaded.name} cannot be opened: {len({body_id for body_id, _ in errors})} bodies have problems")
+                    st.dataframe(pd.DataFrame(errors, columns=['Body', 'Error']).head(500), hide_index=True, use_container_width=True)
+                else:
+                    confirm = st.checkbox("Replace all current governance bodies with this snapshot")
+                    if st.button("📂 Open Snapshot", disabled=not confirm):
+                        try:
+                            get_body_store().replace_bodies(restored.bodies)
+                        except sqlite3.IntegrityError as e:
+                            st.error(f"❌ Could not open {uploaded.name}: {e}")
+                        else:
+                            if restored.five_forces:
+                                st.session_state.five_forces = restored.five_forces
+                            reload_dataset()
+                            st.session_state.example_mode = False
+                            st.success(f"✅ Opened {uploaded.name}! All visualisations have been updated.")
+    
+    st.markdown("---")
+    
+    # PDF Export
+    st.subheader("📑 PDF Report Generation")
+    
+    st.markdown("""
+    Generate a comprehensive PDF report including:
+    - Executive summary with key metrics
+    - Fairer Westminster alignment analysis
+    - Detailed assessment of all governance bodies
+    - Strategic recommendations based on RAG status
+    - Financial impact estimates
+    """)
+    
+    if st.button("🔄 Generate PDF Report", type="primary"):
+        st.session_state.report_job = submit_pdf_report(df, st.session_state.five_forces)
+    
+    report_job = st.session_state.get('report_job')
+    if report_job is not None:
+        if report_job.status == DONE:
+            st.success("✅ PDF Report Generated Successfully!")
+            
+            st.download_button(
+                label="📥 Download PDF Report",
+                data=report_job.result,
+                file_name=f"Westminster_Governance_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
+                mime="application/pdf"
+            )
+        elif report_job.status == FAILED:
+            st.error(f"❌ PDF generation failed: {report_job.error}")
+        else:
+            st.progress(report_job.progress, text=f"Generating report: {report_job.section}...")
+            st.info("💡 The report is being generated in the background - you can keep using other pages and collect it here when it's ready.")
+            st.button("🔄 Refresh Status")
+    
+    st.markdown("---")
+    
+    # Executive summary (keeping all original content)
+    st.subheader("📋 Executive Summary of Findings")
+    
+    st.markdown(f"""
+    ## Westminster City Council Governance Analysis
+    ### Multi-Framework Assessment Aligned with Fairer Westminster Principles
+    
+    **Report Date:** {datetime.now().strftime('%d %B %Y')}
+    
+    ---
+    
+    ### Framework Applicability to Public Sector
+    
+    **✅ Highly Applicable:**
+    - **Rogers (2003)**: Diffusion of Innovations - Excellent for public sector change management
+    - **Schilling (2022)**: Stakeholder Analysis - Widely used in local government
+    - **Smith (2024)**: Knowledge Management - Critical for council organisational learning
+    
+    **⚠️ Requires Adaptation:**
+    - **Porter**: Value Chain - Originally for profit-seeking firms, adapted for service delivery
+    - **Porter**: Five Forces - Originally for market competition, reinterpreted for governance pressures
+    
+    ---
+    
+    ### 1. Efficiency Analysis (Rogers, Schilling, Smith)
+    
+    **Overall Performance:**
+    - Total Governance Bodies: {len(df)}
+    - 🟢 Green RAG Status: {len(df[df['RAG_Status'] == 'Green'])}
+    - 🟡 Amber RAG Status: {len(df[df['RAG_Status'] == 'Amber'])}
+    - 🔴 Red RAG Status: {len(df[df['RAG_Status'] == 'Red'])}
+    - Average Efficiency Score: {df['Efficiency_Score'].mean():.1f}/5
+    - Average Value Added: {df['Value_Added'].mean():.1f}/5
+    - High Duplication Risk Bodies: {len(df[df['Duplication_Risk'] >= 4])}
+    - Bodies Recommended for Merge: {len(df[df['RAG_Recommendation'] == 'Merge'])}
+    
+    **Key Findings:**
+    """)
+    
+    costs = get_governance_costs()
+    merge_bodies = df[df['RAG_Recommendation'] == 'Merge']
+    if len(merge_bodies) > 0:
+        st.markdown("**Merge Recommendations:**")
+        for _, row in merge_bodies.iterrows():
+            st.markdown(f"- **{row['Name']}** - Duplication Risk: {row['Duplication_Risk']}/5")
+        st.markdown(f"""
+        **Recommendation:** Consolidate into single Strategic Procurement Board
+        - Estimated annual saving: {format_pounds(costs['Merge_Saving'].sum())}
+        - Improved decision speed
+        - Clearer accountability
+        """)
+    
+    st.markdown("""
+    ---
+    
+    ### 2. Fairer Westminster Alignment
+    
+    **Bodies aligned with each principle:**
+    """)
+    
+    for principle, count in principle_counts(get_principle_matrix()).items():
+        st.markdown(f"- **{principle}**: {count} bodies")
+    
+    savings, total_saving = savings_summary(costs)
+    savings_breakdown = "\n".join(
+        f"    - {label}: {format_pounds(saving)}" for label, saving in savings.items() if saving > 0
+    )
+    
+    st.markdown(f"""
+    ---
+    
+    ### Summary Recommendations
+    
+    #### Immediate Actions (0-3 months)
+    1. **Consolidate procurement governance** - Merge duplicative procurement boards
+       - Saving: {format_pounds(costs['Merge_Saving'].sum(), short=True)} annually
+       - Quick win with clear efficiency gain
+    
+    2. **Document tacit processes** - Procurement Gate Reports, Community Engagement protocols
+       - Saving: {format_pounds(costs['Documentation_Saving'].sum(), short=True)} annually
+       - Reduces dependency on key individuals
+    
+    #### Medium-term (3-12 months)
+    3. **Strengthen place-based governance** - Formalise Church Street and Lisson Grove models
+       - More authentic community voice (Strong Voice principle)
+       - Clearer decision rights
+       - Scalable to other areas
+    
+    4. **Streamline reporting** - Digital dashboards reduce manual burden
+       - Responds to accountability pressure
+       - Maintains transparency with less overhead
+    
+    #### Strategic (12+ months)
+    5. **Review decision speeds** - Address slow decision-making bodies
+       - Clarify approval thresholds
+       - Delegate more operational decisions
+       - Cabinet focuses on strategic priorities
+    
+    ---
+    
+    ### Financial Impact Summary
+    
+    **Total Estimated Annual Savings: {format_pounds(total_saving)}**
+    
+    Breakdown (cost model of attendee time, preparation and secretariat per body):
+{savings_breakdown}
+    
+    **Plus Non-Financial Benefits:**
+    - Faster decision-making aligned with Opportunity principle
+    - Clearer accountability supporting Strong Voice
+    - Reduced confusion about remits
+    - Better stakeholder engagement (Safe & Inclusive)
+    - Preserved institutional knowledge (Quality of Life)
+    - Enhanced climate action (Greener City)
+    
+    ---
+    
+    *This analysis demonstrates the application of multiple frameworks to local government governance, 
+    with appropriate adaptation where frameworks originated in private sector contexts, and full alignment 
+    with Westminster's commitment to building a fairer city.*
+    """)
@@ -0,0 +1,129 @@
+"""Fairer Westminster Dashboard page: alignment with the five pillars"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from governance.alignment import co_occurrence, principle_counts, principle_means
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+from views.common import cached_figure, get_bodies_df, get_derived_metrics, get_principle_matrix, get_rag_color
+
+
+def render():
+    st.title("🎯 Fairer Westminster Alignment Dashboard")
+    
+    st.markdown("""
+    This dashboard shows how governance bodies align with Westminster's five key principles for building a fairer city.
+    """)
+    
+    df = get_bodies_df()
+    
+    # Principle alignment overview
+    st.subheader("📊 Alignment with Fairer Westminster Principles")
+    
+    # Count bodies aligned with each principle (column sums of the membership matrix)
+    membership = get_principle_matrix()
+    counts = principle_counts(membership)
+    
+    def build_principle_alignment_bar():
+        principle_df = pd.DataFrame({'Principle': counts.index, 'Bodies Aligned': counts.values})
+    
+        fig = px.bar(
+            principle_df,
+            x='Bodies Aligned',
+            y='Principle',
+            orientation='h',
+            title='Number of Governance Bodies Aligned with Each Fairer Westminster Principle',
+            color='Bodies Aligned',
+            color_continuous_scale='Blues'
+        )
+        fig.update_layout(height=400)
+        return fig
+    
+    st.plotly_chart(cached_figure('fairer_westminster.principle_alignment_bar', build_principle_alignment_bar), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Detailed principle analysis
+    st.subheader("🔍 Detailed Principle Analysis")
+    
+    avg_efficiency = principle_means(membership, df['Efficiency_Score'])
+    avg_value = principle_means(membership, df['Value_Added'])
+    green_counts = membership.T.astype(int).dot(df['RAG_Status'].eq('Green').astype(int))
+    
+    for principle, description in FAIRER_WESTMINSTER_PRINCIPLES.items():
+        with st.expander(f"**{principle}** - {description}"):
+            aligned_bodies = df[membership[principle]]
+            
+            if len(aligned_bodies) > 0:
+                st.markdown(f"**{len(aligned_bodies)} governance bodies aligned with this principle:**")
+                
+                for _, row in aligned_bodies.iterrows():
+                    col1, col2, col3 = st.columns([3, 1, 1])
+                    
+                    with col1:
+                        st.markdown(f"{get_rag_color(row['RAG_Status'])} **{row['Name']}**")
+                    with col2:
+                        st.markdown(f"Efficiency: {row['Efficiency_Score']}/5")
+                    with col3:
+                        st.markdown(f"Value: {row['Value_Added']}/5")
+                
+                # Average metrics for this principle
+                avg_eff = avg_efficiency[principle]
+                avg_val = avg_value[principle]
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Average Efficiency", f"{avg_eff:.1f}/5")
+                with col2:
+                    st.metric("Average Value", f"{avg_val:.1f}/5")
+                with col3:
+                    st.metric("Green RAG Status", f"{green_counts[principle]}/{len(aligned_bodies)}")
+            else:
+                st.info(f"No governance bodies currently aligned with {principle}")
+    
+    st.markdown("---")
+    
+    # Principle co-occurrence
+    st.subheader("🔗 Principle Co-occurrence")
+    
+    def build_principle_co_occurrence():
+        fig = px.imshow(
+            co_occurrence(membership),
+            text_auto=True,
+            color_continuous_scale='Blues',
+            title='Bodies Aligned with Both Principles (diagonal = bodies aligned with each principle)',
+            labels={'color': 'Bodies'}
+        )
+        fig.update_layout(height=500)
+        return fig
+    
+    st.plotly_chart(cached_figure('fairer_westminster.principle_co_occurrence', build_principle_co_occurrence), use_container_width=True)
+    
+    st.markdown("**Insight:** Strong off-diagonal pairs show principles that are usually pursued by the same bodies.")
+    
+    st.markdown("---")
+    
+    # Multi-principle alignment
+    st.subheader("🌐 Multi-Principle Alignment Analysis")
+    
+    derived = get_derived_metrics()
+    
+    def build_multi_principle_scatter():
+        fig = px.scatter(
+            df,
+            x='Efficiency_Score',
+            y='Value_Added',
+            size=derived['Principle_Count'],
+            color='RAG_Status',
+            hover_name='Name',
+            hover_data=['Fairer_Westminster_Alignment'],
+            title='Bodies by Efficiency & Value (size = number of Fairer Westminster principles aligned)',
+            labels={'Efficiency_Score': 'Efficiency', 'Value_Added': 'Value Added'},
+            color_discrete_map={'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+        )
+        fig.update_layout(height=500)
+        return fig
+    
+    st.plotly_chart(cached_figure('fairer_westminster.multi_principle_scatter', build_multi_principle_scatter), use_container_width=True)
+    
+    st.markdown("**Insight:** Larger bubbles indicate bodies aligned with multiple Fairer Westminster principles, suggesting broader strategic value.")
@@ -0,0 +1,181 @@
+"""Five Forces Analysis page: Porter five forces reinterpreted as governance pressures"""
+import plotly.graph_objects as go
+import streamlit as st
+
+from views.common import cached_figure
+
+
+
+def render():
+    st.title("⚡ Five Forces Analysis (Porter Framework)")
+    st.markdown("*Private sector framework reinterpreted for public sector*")
+    
+    st.warning("""
+    **⚠️ Public Sector Adaptation Note:**
+    
+    Porter's Five Forces was designed to analyse competitive market dynamics for profit-seeking firms. 
+    For Westminster City Council, we **reinterpret** it to analyse **governance pressures**:
+    
+    **Original Private Sector Focus:**
+    - Market competition, profit maximisation, barriers to entry, supplier/buyer bargaining
+    
+    **Adapted Public Sector Focus:**
+    - Stakeholder demands, accountability pressures, alternative service models, resource constraints
+    
+    This framework is **less naturally suited** to public sector than Schilling's stakeholder analysis, 
+    but can provide useful insights when properly adapted.
+    """)
+    
+    five_forces = st.session_state.five_forces
+    
+    # Radar chart
+    st.subheader("📊 Five Forces Radar Analysis")
+    
+    def build_radar():
+        forces_list = list(five_forces.keys())
+        values = list(five_forces.values())
+    
+        fig = go.Figure()
+    
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=forces_list,
+            fill='toself',
+            name='Current State',
+            line_color='rgb(99, 110, 250)'
+        ))
+    
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 5]
+                )
+            ),
+            showlegend=True,
+            title="Five Forces Intensity (1=Low, 5=High)",
+            height=500
+        )
+        return fig
+    
+    st.plotly_chart(cached_figure('five_forces.radar', build_radar, filters=five_forces), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Force-by-force analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🔍 Force Analysis")
+        
+        st.markdown("### 1️⃣ Threat of New Entrants")
+        st.progress(five_forces['Threat of New Entrants'] / 5)
+        st.markdown(f"**Intensity:** {five_forces['Threat of New Entrants']}/5 (Medium)")
+        st.markdown("""
+        **Definition (Adapted):** Risk of new governance bodies being created, fragmenting decision-making.
+        
+        **Westminster Context:**
+        - Political pressure creates new boards/forums
+        - Regulatory requirements mandate new bodies
+        - Crisis responses spawn temporary structures that persist
+        
+        **Impact:** Medium - Some proliferation but Cabinet control constrains
+        """)
+        
+        st.markdown("### 2️⃣ Bargaining Power of Stakeholders")
+        st.progress(five_forces['Bargaining Power of Stakeholders'] / 5)
+        st.markdown(f"**Intensity:** {five_forces['Bargaining Power of Stakeholders']}/5 (High)")
+        st.markdown("""
+        **Definition (Adapted):** Influence of key stakeholders (residents, partners, government) over governance.
+        
+        **Westminster Context:**
+        - Strong community voice (Church Street, Lisson Grove)
+        - NHS partnership power (Joint Health Board)
+        - Central government mandates and inspections
+        
+        **Impact:** High - Stakeholders significantly shape governance structure
+        
+        **Note:** This overlaps with Schilling's stakeholder analysis, which is more sophisticated for public sector use.
+        """)
+        
+        st.markdown("### 3️⃣ Threat of Alternative Models")
+        st.progress(five_forces['Threat of Alternative Models'] / 5)
+        st.markdown(f"**Intensity:** {five_forces['Threat of Alternative Models']}/5 (Low)")
+        st.markdown("""
+        **Definition (Adapted):** Risk that alternative governance approaches (self-regulation, informal networks) replace formal bodies.
+        
+        **Westminster Context:**
+        - Digital platforms enable direct democracy
+        - Community organising bypasses formal structures  
+        - Agile/flat structures in private sector offer contrast
+        
+        **Impact:** Low - Statutory requirements maintain formal governance
+        """)
+    
+    with col2:
+        st.markdown("### 4️⃣ Pressure for Accountability")
+        st.progress(five_forces['Pressure for Accountability'] / 5)
+        st.markdown(f"**Intensity:** {five_forces['Pressure for Accountability']}/5 (Very High)")
+        st.markdown("""
+        **Definition (Adapted):** Demand from citizens, media, regulators for transparent, effective governance.
+        
+        **Westminster Context:**
+        - Intense media scrutiny in capital city
+        - High resident expectations
+        - Government inspections and audits
+        - Fairer Westminster outcome commitments
+        
+        **Impact:** Very High - Drives formalisation and overhead
+        """)
+        
+        st.markdown("### 5️⃣ Resource Competition")
+        st.progress(five_forces['Resource Competition'] / 5)
+        st.markdown(f"**Intensity:** {five_forces['Resource Competition']}/5 (High)")
+        st.markdown("""
+        **Definition (Adapted):** Competition between governance bodies for budget, senior time, and influence.
+        
+        **Westminster Context:**
+        - Cost-cutting pressures intensify competition
+        - Senior officer time scarce resource
+        - Political capital limited
+        - Commercial vs Digital vs Climate boards compete
+        
+        **Impact:** High - Creates incentive for duplication and empire-building
+        """)
+    
+    st.markdown("---")
+    
+    # Strategic implications
+    st.subheader("💡 Strategic Implications")
+    
+    st.markdown("""
+    ### Overall Assessment
+    
+    **Strongest Forces:**
+    1. **Pressure for Accountability** (5/5) - Drives formalisation, creates overhead
+    2. **Bargaining Power of Stakeholders** (4/5) - Shapes structure, resists change
+    3. **Resource Competition** (4/5) - Incentivises duplication
+    
+    **Weaker Forces:**
+    - **Threat of Alternative Models** (2/5) - Statutory requirements protect formal governance
+    - **Threat of New Entrants** (3/5) - Cabinet control limits proliferation
+    
+    ### Strategic Responses
+    
+    **To Counter High Accountability Pressure:**
+    - Streamline reporting without reducing transparency
+    - Digital dashboards reduce manual reporting burden
+    - Focus on outcome metrics vs process compliance
+    
+    **To Manage Stakeholder Power:**
+    - Early engagement prevents later resistance
+    - Co-design governance changes with key stakeholders
+    - Use Rogers categories to sequence engagement
+    
+    **To Reduce Resource Competition:**
+    - **Consolidate duplicative bodies** (Commercial Gateway + Procuring)
+    - Clear mandate boundaries reduce turf battles
+    - Shared services reduce overhead
+    
+    **Estimated Impact:** £120K+ annual savings through strategic responses
+    """)
@@ -0,0 +1,134 @@
+"""Governance Bodies page: filterable list of all bodies"""
+import streamlit as st
+
+from governance.browse import PAGE_SIZES, browse, page_count
+from governance.query import QueryError, get_body_index
+from views.common import get_bodies_df, get_rag_color
+
+TABLE_COLUMNS = [
+    'Name', 'Type', 'Level', 'RAG_Status', 'RAG_Recommendation',
+    'Efficiency_Score', 'Value_Added', 'Duplication_Risk', 'Cost_Impact',
+]
+SORT_COLUMNS = TABLE_COLUMNS + ['Decision_Speed', 'Stakeholder_Power', 'Stakeholder_Interest']
+
+
+
+def render():
+    st.title("🏛️ Governance Bodies Overview")
+    st.markdown("*View and filter all governance bodies. Use **➕ Manage Bodies** page to add or edit entries.*")
+    
+    df = get_bodies_df()
+    
+    # Filter options
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        level_options = list(df['Level'].unique())
+        level_filter = st.multiselect("Filter by Level", level_options, default=level_options)
+    with col2:
+        rag_options = list(df['RAG_Status'].unique())
+        rag_filter = st.multiselect("Filter by RAG Status", rag_options, default=rag_options)
+    with col3:
+        rec_options = list(df['RAG_Recommendation'].unique())
+        rec_filter = st.multiselect("Filter by Recommendation", rec_options, default=rec_options)
+    with col4:
+        show_dup_only = st.checkbox("Show only high duplication risk (≥3)")
+    
+    query = st.text_input(
+        "Query",
+        placeholder="e.g. Efficiency_Score<3 AND Cost_Impact in (High, Very High)",
+        help="Combine conditions with AND, OR, NOT and brackets. Use =, !=, <, <=, >, >= on scores and "
+             "categories, `Field in (A, B)`, `Field ~ text`, or plain words to search names, focus and stakeholders."
+    )
+    
+    # Filters resolve by intersecting precomputed per-value bitmaps
+    version = st.session_state.dataset.version_hash
+    index = get_body_index(df, version)
+    mask = index.filter(Level=level_filter, RAG_Status=rag_filter, RAG_Recommendation=rec_filter)
+    
+    if show_dup_only:
+        mask &= index.compare('Duplication_Risk', '>=', 3)
+    
+    try:
+        mask &= index.query(query)
+    except QueryError as e:
+        st.error(f"❌ Invalid query: {e}")
+    
+    # Sorting and paging
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sort_by = st.selectbox("Sort by", SORT_COLUMNS, format_func=lambda column: column.replace('_', ' '))
+    with col2:
+        descending = st.checkbox("Descending", value=False)
+    with col3:
+        page_size = st.selectbox("Bodies per page", PAGE_SIZES, index=1)
+    with col4:
+        view_mode = st.radio("View", ["Table", "Cards"], horizontal=True)
+    
+    # Only the visible page is sliced out of the sorted, filtered frame
+    total = int(mask.sum())
+    pages = page_count(total, page_size)
+    if st.session_state.get('bodies_page', 1) > pages:
+        st.session_state.bodies_page = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key='bodies_page')
+    
+    page_df, _ = browse(df, mask, sort_by, ascending=not descending, page=page, page_size=page_size, version=version)
+    
+    first = (page - 1) * page_size
+    st.markdown(f"**Showing {first + min(len(page_df), 1)}-{first + len(page_df)} of {total} matching bodies ({len(df)} in total)**")
+    
+    if view_mode == "Table":
+        st.dataframe(page_df[TABLE_COLUMNS], hide_index=True, use_container_width=True)
+        
+        # Details are rendered for one selected body only
+        if len(page_df) > 0:
+            detail_idx = st.selectbox(
+                "Show details for",
+                [None] + list(page_df.index),
+                format_func=lambda idx: "Select a body..." if idx is None else page_df.loc[idx, 'Name']
+            )
+            if detail_idx is not None:
+                row = page_df.loc[detail_idx]
+                st.markdown(f"### {get_rag_color(row['RAG_Status'])} {row['Name']}")
+                render_details(detail_idx, row)
+    else:
+        # Bodies as cards
+        for idx, row in page_df.iterrows():
+            rag_emoji = get_rag_color(row['RAG_Status'])
+            
+            with st.expander(f"{rag_emoji} **{row['Name']}** ({row['Type']}) - {row['RAG_Recommendation']}"):
+                render_details(idx, row)
+
+
+def render_details(idx, row):
+    """Profile, metrics and stakeholder detail panel for one body"""
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**Profile**")
+        st.markdown(f"Level: {row['Level']}")
+        st.markdown(f"Outcome Focus: {row['Outcome_Focus']}")
+        st.markdown(f"Process Type: {row['Process_Type']}")
+        st.markdown(f"Decision Speed: {row['Decision_Speed']}")
+    
+    with col2:
+        st.markdown("**Performance Metrics**")
+        st.metric("Efficiency", f"{row['Efficiency_Score']}/5")
+        st.metric("Value Added", f"{row['Value_Added']}/5")
+        st.metric("Duplication Risk", f"{row['Duplication_Risk']}/5")
+        st.markdown(f"**RAG Status:** {get_rag_color(row['RAG_Status'])} {row['RAG_Status']}")
+        st.markdown(f"**Recommendation:** {row['RAG_Recommendation']}")
+    
+    with col3:
+        st.markdown("**Stakeholders**")
+        st.markdown(f"**Primary:** {row['Primary_Stakeholders']}")
+        st.markdown(f"**Secondary:** {row['Secondary_Stakeholders']}")
+        st.markdown(f"**Power:** {row['Stakeholder_Power']}")
+        st.markdown(f"**Interest:** {row['Stakeholder_Interest']}")
+    
+    st.markdown(f"**Fairer Westminster Alignment:** {row['Fairer_Westminster_Alignment']}")
+    st.markdown(f"**Value Chain Activities:** {row['Value_Chain_Activities']}")
+    
+    # Add edit button
+    if st.button(f"✏️ Edit {row['Name']}", key=f"edit_btn_{idx}", use_container_width=True):
+        st.info("💡 Navigate to **➕ Manage Bodies** page to edit this entry.")
+    
@@ -0,0 +1,156 @@
+"""Home page: Fairer Westminster principles, framework overview and headline metrics"""
+import plotly.express as px
+import streamlit as st
+
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+from views.common import cached_figure, get_bodies_df
+
+
+
+def render():
+    st.title("🗺️ Governance Mapping & Analysis Tool")
+    st.markdown("*Westminster City Council - Aligned with Fairer Westminster Principles*")
+    
+    if st.session_state.get('example_mode'):
+        st.info("📚 **Westminster Example Data Loaded** - Demonstrating frameworks adapted for local government")
+    
+    # Fairer Westminster principles display
+    st.markdown("### 🎯 Fairer Westminster Principles")
+    
+    cols = st.columns(5)
+    principles_list = list(FAIRER_WESTMINSTER_PRINCIPLES.items())
+    
+    for idx, col in enumerate(cols):
+        if idx < len(principles_list):
+            principle, description = principles_list[idx]
+            with col:
+                st.markdown(f"**{principle}**")
+                st.caption(description)
+    
+    st.markdown("---")
+    
+    st.markdown("""
+    ### Multi-Framework Governance Analysis for Public Sector
+    
+    This tool integrates **five complementary frameworks** adapted for public sector governance:
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        #### Innovation & Change Frameworks
+        
+        **1. Rogers (2003)** - Diffusion of Innovations ✅
+        - **Public sector fit:** Excellent - widely used in public services
+        - Phase reforms by adopter categories
+        - Sequence governance changes strategically
+        - Manage resistance to organisational change
+        
+        **2. Schilling (2022)** - Innovation Management ✅
+        - **Public sector fit:** Good - requires adaptation
+        - Stakeholder analysis (highly applicable)
+        - Lifecycle mapping (useful for project governance)
+        - Structural design choices
+        
+        **3. Smith (2024)** - Knowledge Management ✅
+        - **Public sector fit:** Excellent - critical for councils
+        - Tacit→Explicit conversion
+        - Efficiency through process documentation
+        - Preserve institutional knowledge during turnover
+        """)
+    
+    with col2:
+        st.markdown("""
+        #### Strategic Analysis Frameworks
+        
+        **4. Porter's Value Chain** ⚠️
+        - **Public sector fit:** Limited - requires significant adaptation
+        - **Private sector origin:** Designed for profit-seeking firms
+        - **Public sector use:** Map governance activities to outcomes
+        - Focus on service delivery value, not profit margins
+        - Useful for identifying overhead vs value-adding governance
+        
+        **5. Porter's Five Forces** ⚠️
+        - **Public sector fit:** Limited - requires reinterpretation
+        - **Private sector origin:** Designed for competitive markets
+        - **Public sector use:** Analyse pressures on governance:
+          - Stakeholder power (residents, partners, government)
+          - Accountability demands (media, regulators, voters)
+          - Alternative service models (digital, community-led)
+          - Resource competition (budget, senior time)
+        - Not about profit/competition but governance effectiveness
+        """)
+    
+    st.markdown("---")
+    
+    # Enhanced dashboard metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    df = get_bodies_df()
+    
+    with col1:
+        st.metric("Bodies Mapped", len(df))
+        green_count = len(df[df['RAG_Status'] == 'Green'])
+        st.metric("🟢 Green Status", green_count)
+    
+    with col2:
+        amber_count = len(df[df['RAG_Status'] == 'Amber'])
+        st.metric("🟡 Amber Status", amber_count)
+        red_count = len(df[df['RAG_Status'] == 'Red'])
+        st.metric("🔴 Red Status", red_count)
+    
+    with col3:
+        avg_eff = df['Efficiency_Score'].mean()
+        st.metric("Avg Efficiency", f"{avg_eff:.1f}/5")
+        merge_count = len(df[df['RAG_Recommendation'] == 'Merge'])
+        st.metric("Merge Recommended", merge_count)
+    
+    with col4:
+        high_stake = len(df[df['Stakeholder_Interest'] == 'Very High'])
+        st.metric("High Stakeholder Interest", high_stake)
+        place_based = len(df[df['Type'] == 'Place-Based Board'])
+        st.metric("Place-Based Boards", place_based)
+    
+    st.markdown("---")
+    
+    # RAG Status overview
+    st.subheader("📊 RAG Status Overview")
+    
+    def build_rag_status_pie():
+        rag_counts = df['RAG_Status'].value_counts().loc[lambda counts: counts > 0].reset_index()
+        rag_counts.columns = ['Status', 'Count']
+    
+        fig = px.pie(
+            rag_counts,
+            values='Count',
+            names='Status',
+            title='Governance Bodies by RAG Status',
+            color='Status',
+            color_discrete_map={'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+        )
+        fig.update_layout(height=400)
+        return fig
+    
+    st.plotly_chart(cached_figure('home.rag_status_pie', build_rag_status_pie), use_container_width=True)
+    
+    # Quick visualisation
+    st.subheader("Quick Overview: Efficiency vs Value by Cost")
+    
+    def build_efficiency_value_scatter():
+        fig = px.scatter(
+            df, 
+            x='Efficiency_Score', 
+            y='Value_Added',
+            # Unrated bodies get the smallest bubble
+            size=df['Duplication_Risk'].fillna(1),
+            color='RAG_Status',
+            hover_name='Name',
+            title='Governance Bodies: Efficiency vs Value (bubble size = duplication risk)',
+            labels={'Efficiency_Score': 'Efficiency Score', 'Value_Added': 'Value Added'},
+            color_discrete_map={'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+        )
+        fig.update_layout(height=400)
+        return fig
+    
+    st.plotly_chart(cached_figure('home.efficiency_value_scatter', build_efficiency_value_scatter), use_container_width=True)
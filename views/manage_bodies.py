@@ -0,0 +1,508 @@
+"""Manage Bodies page: add, edit and delete governance bodies"""
+import pandas as pd
+import streamlit as st
+
+from governance.importer import IMPORT_EXTENSIONS, import_bodies
+from governance.query import QueryError
+from governance.rag_rules import RAG_FACTORS, RAG_LEVELS, default_rag_config, score_rag
+from governance.sample_data import FAIRER_WESTMINSTER_PRINCIPLES
+from governance.schema import CATEGORIES
+from governance.storage import MissingBodyError
+from governance.validation import validate_body
+from views.common import get_bodies_df, get_body_store, get_rag_color, reload_dataset
+
+
+
+def _option_index(column, value):
+    """Position of ``value`` among the column's categories, or the first for a missing or unknown value"""
+    return CATEGORIES[column].index(value) if value in CATEGORIES[column] else 0
+
+
+def _score_value(value, default=3):
+    """Whole 1-5 score for a slider, or ``default`` when the stored score is missing"""
+    return int(value) if pd.notna(value) and int(value) in range(1, 6) else default
+
+
+def render():
+    st.title("➕ Manage Governance Bodies")
+    st.markdown("*Add new bodies or edit existing entries - all changes update visualisations instantly*")
+    
+    df = get_bodies_df()
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["➕ Add New Body", "✏️ Edit Existing Body", "📂 Bulk Import", "🤖 Automated RAG"])
+    
+    # ADD NEW BODY TAB
+    with tab1:
+        st.subheader("Add New Governance Body")
+        st.markdown("Fill in the form below to add a new governance body. All fields marked with * are required.")
+        
+        with st.form("add_new_body", clear_on_submit=True):
+            st.markdown("### Basic Information")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                new_name = st.text_input("Body Name*", help="Official name of the governance body")
+                new_type = st.selectbox("Type*", CATEGORIES['Type'],
+                                       help="Classification of the body")
+            
+            with col2:
+                new_level = st.selectbox("Organisational Level*", CATEGORIES['Level'],
+                                        help="Where this body sits in the governance hierarchy")
+                new_outcome = st.text_input("Outcome Focus*", help="Primary outcomes this body targets")
+            
+            with col3:
+                fw_options = list(FAIRER_WESTMINSTER_PRINCIPLES.keys())
+                new_fw = st.multiselect("Fairer Westminster Pillars*", fw_options,
+                                       help="Select all relevant pillars")
+                new_process = st.selectbox("Process Type*", CATEGORIES['Process_Type'],
+                                          help="How well-documented are the processes?")
+            
+            st.markdown("---")
+            st.markdown("### Performance Metrics")
+            col4, col5, col6, col7 = st.columns(4)
+            
+            with col4:
+                new_efficiency = st.select_slider("Efficiency Score*", options=[1, 2, 3, 4, 5], value=3,
+                                                 help="1=Very Low, 5=Very High")
+            
+            with col5:
+                new_value = st.select_slider("Value Added*", options=[1, 2, 3, 4, 5], value=3,
+                                            help="1=Very Low, 5=Very High")
+            
+            with col6:
+                new_dup = st.select_slider("Duplication Risk*", options=[1, 2, 3, 4, 5], value=1,
+                                          help="1=No Risk, 5=High Risk")
+            
+            with col7:
+                new_cost = st.selectbox("Cost Impact*", CATEGORIES['Cost_Impact'],
+                                       help="Resource intensity of this body")
+            
+            st.markdown("---")
+            st.markdown("### RAG Assessment")
+            col8, col9 = st.columns(2)
+            
+            with col8:
+                new_rag = st.radio("RAG Status*", CATEGORIES['RAG_Status'], horizontal=True,
+                                  help="🟢 Green = Keep | 🟡 Amber = Review | 🔴 Red = Urgent Action")
+            
+            with col9:
+                new_rag_rec = st.radio("Recommendation*", CATEGORIES['RAG_Recommendation'], horizontal=True,
+                                      help="Strategic recommendation for this body")
+            
+            st.markdown("---")
+            st.markdown("### Stakeholder Information")
+            col10, col11 = st.columns(2)
+            
+            with col10:
+                new_primary = st.text_area("Primary Stakeholders*", 
+                                          help="Key participants (comma-separated)",
+                                          placeholder="e.g., Council Members, Chief Executive, Directors")
+                new_power = st.select_slider("Stakeholder Power*", options=CATEGORIES['Stakeholder_Power'], value="Medium",
+                                            help="Overall power of stakeholders")
+            
+            with col11:
+                new_secondary = st.text_area("Secondary Stakeholders", 
+                                            help="Other affected parties (comma-separated)",
+                                            placeholder="e.g., Residents, Media, Government")
+                new_interest = st.select_slider("Stakeholder Interest*", options=CATEGORIES['Stakeholder_Interest'], value="Medium",
+                                               help="Level of stakeholder interest")
+            
+            st.markdown("---")
+            st.markdown("### Operational Details")
+            col12, col13 = st.columns(2)
+            
+            with col12:
+                new_activities = st.text_area("Value Chain Activities*", 
+                                             help="Key activities (comma-separated)",
+                                             placeholder="e.g., Strategic Decision-Making, Resource Allocation, Policy Setting")
+                new_speed = st.select_slider("Decision Speed*", options=CATEGORIES['Decision_Speed'], value="Medium",
+                                            help="How quickly can this body make decisions?")
+            
+            with col13:
+                new_posture = st.selectbox("Innovation Posture*", CATEGORIES['Innovation_Posture'],
+                                          help="Exploit = Optimise existing | Explore = Try new | Ambidextrous = Both")
+            
+            st.markdown("---")
+            
+            col_submit, col_reset = st.columns([1, 4])
+            
+            with col_submit:
+                submitted = st.form_submit_button("✅ Add Body", type="primary", use_container_width=True)
+            
+            if submitted:
+                # Create new body
+                new_body = {
+                    "Name": new_name,
+                    "Type": new_type,
+                    "Level": new_level,
+                    "Outcome_Focus": new_outcome,
+                    "Fairer_Westminster_Alignment": ", ".join(new_fw),
+                    "Process_Type": new_process,
+                    "Efficiency_Score": new_efficiency,
+                    "Cost_Impact": new_cost,
+                    "Value_Added": new_value,
+                    "Duplication_Risk": new_dup,
+                    "RAG_Status": new_rag,
+                    "RAG_Recommendation": new_rag_rec,
+                    "Primary_Stakeholders": new_primary,
+                    "Secondary_Stakeholders": new_secondary,
+                    "Stakeholder_Power": new_power,
+                    "Stakeholder_Interest": new_interest,
+                    "Value_Chain_Activities": new_activities,
+                    "Decision_Speed": new_speed,
+                    "Innovation_Posture": new_posture
+                }
+                
+                # Validation (the same rules are applied to bulk imports)
+                errors = validate_body(new_body)
+                if errors:
+                    st.error(f"❌ {errors[0]}!")
+                else:
+                    # Write through to the store, then add to dataframe under the new id
+                    body_id = get_body_store().insert_body(new_body)
+                    st.session_state.dataset.add(body_id, new_body)
+                    st.session_state.example_mode = False
+                    st.success(f"✅ Successfully added **{new_name}**! All visualisations have been updated.")
+                    st.balloons()
+                    st.info("💡 Navigate to other pages to see how your new entry affects the analyses.")
+    
+    # EDIT EXISTING BODY TAB
+    with tab2:
+        st.subheader("Edit Existing Governance Body")
+        st.markdown("Select a body to edit, make your changes, and save. You can also delete bodies from here.")
+        
+        if len(df) == 0:
+            st.info("No governance bodies to edit. Add one in the 'Add New Body' tab first!")
+        else:
+            # Narrow the list with the full-text index, best matches first
+            search_text = st.text_input(
+                "🔍 Search bodies",
+                placeholder="Name, outcome focus, stakeholder or activity (partial words and typos are fine)"
+            )
+            if search_text.strip():
+                body_ids = [body_id for body_id, _ in st.session_state.dataset.search(search_text, limit=50)]
+                if not body_ids:
+                    st.info(f"No bodies match '{search_text}'")
+            else:
+                body_ids = list(df.index)
+            
+            # Select body to edit
+            body_idx = st.selectbox("Select Body to Edit", body_ids, format_func=lambda body_id: df.loc[body_id, 'Name'])
+            
+            if body_idx is not None:
+                # Get the row for this body
+                row = df.loc[body_idx]
+                
+                # Display current RAG status prominently
+                rag_emoji = get_rag_color(row['RAG_Status'])
+                col_rag1, col_rag2, col_rag3 = st.columns(3)
+                with col_rag1:
+                    st.metric("Current RAG Status", f"{rag_emoji} {row['RAG_Status']}")
+                with col_rag2:
+                    st.metric("Current Recommendation", row['RAG_Recommendation'])
+                with col_rag3:
+                    st.metric("Efficiency Score", f"{row['Efficiency_Score']}/5")
+                
+                st.markdown("---")
+                
+                with st.form(f"edit_body_form_{body_idx}"):
+                    st.markdown("### Basic Information")
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        edit_name = st.text_input("Body Name*", value=row['Name'])
+                        edit_type = st.selectbox("Type*", CATEGORIES['Type'],
+                                               index=_option_index('Type', row['Type']))
+                    
+                    with col2:
+                        edit_level = st.selectbox("Organisational Level*", CATEGORIES['Level'],
+                                                index=_option_index('Level', row['Level']))
+                        edit_outcome = st.text_input("Outcome Focus*", value=row['Outcome_Focus'])
+                    
+                    with col3:
+                        fw_options = list(FAIRER_WESTMINSTER_PRINCIPLES.keys())
+                        fw_stored = row['Fairer_Westminster_Alignment'] if isinstance(row['Fairer_Westminster_Alignment'], str) else ''
+                        fw_current = [p.strip() for p in fw_stored.split(",") if p.strip() in fw_options]
+                        edit_fw = st.multiselect("Fairer Westminster Pillars*", fw_options, default=fw_current)
+                        edit_process = st.selectbox("Process Type*", CATEGORIES['Process_Type'],
+                                                  index=_option_index('Process_Type', row['Process_Type']))
+                    
+                    st.markdown("---")
+                    st.markdown("### Performance Metrics")
+                    col4, col5, col6, col7 = st.columns(4)
+                    
+                    with col4:
+                        edit_efficiency = st.select_slider("Efficiency Score*", options=[1, 2, 3, 4, 5], value=_score_value(row['Efficiency_Score']))
+                    
+                    with col5:
+                        edit_value = st.select_slider("Value Added*", options=[1, 2, 3, 4, 5], value=_score_value(row['Value_Added']))
+                    
+                    with col6:
+                        edit_dup = st.select_slider("Duplication Risk*", options=[1, 2, 3, 4, 5], value=_score_value(row['Duplication_Risk']))
+                    
+                    with col7:
+                        edit_cost = st.selectbox("Cost Impact*", CATEGORIES['Cost_Impact'],
+                                               index=_option_index('Cost_Impact', row['Cost_Impact']))
+                    
+                    st.markdown("---")
+                    st.markdown("### RAG Assessment")
+                    col8, col9 = st.columns(2)
+                    
+                    with col8:
+                        edit_rag = st.radio("RAG Status*", CATEGORIES['RAG_Status'], 
+                                          index=_option_index('RAG_Status', row['RAG_Status']),
+                                          horizontal=True)
+                    
+                    with col9:
+                        edit_rag_rec = st.radio("Recommendation*", CATEGORIES['RAG_Recommendation'],
+                                              index=_option_index('RAG_Recommendation', row['RAG_Recommendation']),
+                                              horizontal=True)
+                    
+                    st.markdown("---")
+                    st.markdown("### Stakeholder Information")
+                    col10, col11 = st.columns(2)
+                    
+                    with col10:
+                        edit_primary = st.text_area("Primary Stakeholders*", value=row['Primary_Stakeholders'])
+                        edit_power = st.select_slider("Stakeholder Power*", options=CATEGORIES['Stakeholder_Power'], 
+                                                    value=CATEGORIES['Stakeholder_Power'][_option_index('Stakeholder_Power', row['Stakeholder_Power'])])
+                    
+                    with col11:
+                        edit_secondary = st.text_area("Secondary Stakeholders", value=row['Secondary_Stakeholders'])
+                        edit_interest = st.select_slider("Stakeholder Interest*", options=CATEGORIES['Stakeholder_Interest'],
+                                                       value=CATEGORIES['Stakeholder_Interest'][_option_index('Stakeholder_Interest', row['Stakeholder_Interest'])])
+                    
+                    st.markdown("---")
+                    st.markdown("### Operational Details")
+                    col12, col13 = st.columns(2)
+                    
+                    with col12:
+                        edit_activities = st.text_area("Value Chain Activities*", value=row['Value_Chain_Activities'])
+                        edit_speed = st.select_slider("Decision Speed*", options=CATEGORIES['Decision_Speed'],
+                                                    value=CATEGORIES['Decision_Speed'][_option_index('Decision_Speed', row['Decision_Speed'])])
+                    
+                    with col13:
+                        edit_posture = st.selectbox("Innovation Posture*", CATEGORIES['Innovation_Posture'],
+                                                  index=_option_index('Innovation_Posture', row['Innovation_Posture']))
+                    
+                    st.markdown("---")
+                    
+                    col_save, col_delete = st.columns([3, 1])
+                    
+                    with col_save:
+                        save_button = st.form_submit_button("💾 Save Changes", type="primary", use_container_width=True)
+                    
+                    with col_delete:
+                        delete_button = st.form_submit_button("🗑️ Delete Body", type="secondary", use_container_width=True)
+                    
+                    if save_button:
+                        changes = {
+                            'Name': edit_name,
+                            'Type': edit_type,
+                            'Level': edit_level,
+                            'Outcome_Focus': edit_outcome,
+                            'Fairer_Westminster_Alignment': ", ".join(edit_fw),
+                            'Process_Type': edit_process,
+                            'Efficiency_Score': edit_efficiency,
+                            'Cost_Impact': edit_cost,
+                            'Value_Added': edit_value,
+                            'Duplication_Risk': edit_dup,
+                            'RAG_Status': edit_rag,
+                            'RAG_Recommendation': edit_rag_rec,
+                            'Primary_Stakeholders': edit_primary,
+                            'Secondary_Stakeholders': edit_secondary,
+                            'Stakeholder_Power': edit_power,
+                            'Stakeholder_Interest': edit_interest,
+                            'Value_Chain_Activities': edit_activities,
+                            'Decision_Speed': edit_speed,
+                            'Innovation_Posture': edit_posture
+                        }
+                        
+                        errors = validate_body(changes)
+                        if errors:
+                            st.error(f"❌ {errors[0]}!")
+                        else:
+                            # Write through to the store, then update the dataframe
+                            try:
+                                get_body_store().update_body(body_idx, changes)
+                            except MissingBodyError:
+                                st.session_state.dataset.delete(body_idx)
+                                st.error(f"❌ **{row['Name']}** has been deleted in another session, so it could not be updated.")
+                            else:
+                                st.session_state.dataset.update(body_idx, changes)
+                                st.session_state.example_mode = False
+                                
+                                st.success(f"✅ Successfully updated **{edit_name}**! All visualisations have been updated.")
+                                st.info("💡 Navigate to other pages to see how your changes affect the analyses.")
+                    
+                    if delete_button:
+                        get_body_store().delete_body(body_idx)
+                        st.session_state.dataset.delete(body_idx)
+                        st.session_state.example_mode = False
+                        st.success(f"🗑️ Successfully deleted **{row['Name']}**! All visualisations have been updated.")
+                        st.rerun()
+    
+    # BULK IMPORT TAB
+    with tab3:
+        st.subheader("Import Governance Bodies from CSV or Excel")
+        st.markdown(
+            "Upload a file with one body per row and a header row using the field names "
+            "(e.g. `Name`, `Level`, `Efficiency_Score` or `Efficiency Score`). Every row is checked "
+            "against the same rules as the Add form; valid rows are added and invalid rows are listed below."
+        )
+        
+        uploaded = st.file_uploader("Bodies file", type=IMPORT_EXTENSIONS)
+        
+        if uploaded is not None and st.button("📥 Validate & Import", type="primary"):
+            try:
+                with st.spinner("Validating and importing..."):
+                    result = import_bodies(get_body_store(), uploaded, uploaded.name)
+            except ImportError:
+                st.error("❌ Excel import needs the `openpyxl` package (`pip install openpyxl`).")
+            except (ValueError, pd.errors.ParserError) as e:
+                st.error(f"❌ Could not read {uploaded.name}: {e}")
+            else:
+                st.session_state.import_result = result
+                if result.body_ids:
+                    reload_dataset()
+                    st.session_state.example_mode = False
+                    st.rerun()
+        
+        result = st.session_state.get('import_result')
+        if result is not None:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Rows Read", result.rows_read)
+            with col2:
+                st.metric("Bodies Added", len(result.body_ids))
+            with col3:
+                st.metric("Rows Rejected", result.rows_rejected)
+            
+            if result.unknown_columns:
+                st.warning(f"⚠️ Ignored unrecognised columns: {', '.join(map(str, result.unknown_columns))}")
+            
+            if result.errors:
+                errors_df = result.errors_frame()
+                st.dataframe(errors_df.head(500), hide_index=True, use_container_width=True)
+                st.download_button(
+                    label="📥 Download All Errors (CSV)",
+                    data=errors_df.to_csv(index=False),
+                    file_name="import_errors.csv",
+                    mime="text/csv"
+                )
+            elif result.body_ids:
+                st.success(f"✅ Imported all {len(result.body_ids)} bodies! All visualisations have been updated.")
+    
+    # AUTOMATED RAG TAB
+    with tab4:
+        st.subheader("Automated RAG Scoring")
+        st.markdown(
+            "Bodies are scored from 0 (worst) to 1 (best) on a weighted mix of five factors; the thresholds turn "
+            "the score into a RAG status, then the rules below can cap the status or set the recommendation. "
+            "Rule conditions use the same query syntax as the Governance Bodies page."
+        )
+        
+        defaults = default_rag_config()
+        config = {'weights': {}, 'recommendations': {}}
+        
+        st.markdown("### Factor Weights")
+        weight_cols = st.columns(len(RAG_FACTORS))
+        for col, (column, (label, _)) in zip(weight_cols, RAG_FACTORS.items()):
+            with col:
+                config['weights'][column] = st.slider(
+                    label, 0.0, 1.0, defaults['weights'][column], 0.05, key=f"rag_weight_{column}"
+                )
+        
+        st.markdown("### Thresholds & Recommendations")
+        col1, col2 = st.columns(2)
+        with col1:
+            amber, green = st.slider(
+                "Amber from / Green from (weighted score)", 0.0, 1.0,
+                (defaults['thresholds']['Amber'], defaults['thresholds']['Green']), 0.01, key="rag_thresholds"
+            )
+            config['thresholds'] = {'Green': green, 'Amber': amber}
+        with col2:
+            rec_cols = st.columns(len(RAG_LEVELS))
+            for rec_col, level in zip(rec_cols, RAG_LEVELS):
+                with rec_col:
+                    options = CATEGORIES['RAG_Recommendation']
+                    config['recommendations'][level] = st.selectbox(
+                        f"{get_rag_color(level)} {level} →", options,
+                        index=options.index(defaults['recommendations'][level]), key=f"rag_recommend_{level}"
+                    )
+        
+        st.markdown("### Rules")
+        # The editor keeps its own edits on top of this fixed starting table
+        rules_df = st.data_editor(
+            pd.DataFrame(defaults['rules'], columns=['name', 'when', 'cap', 'recommend']),
+            num_rows="dynamic",
+            use_container_width=True,
+            hide_index=True,
+            key="rag_rules",
+            column_config={
+                'name': st.column_config.TextColumn("Rule", required=True),
+                'when': st.column_config.TextColumn("When (query)", required=True),
+                'cap': st.column_config.SelectboxColumn("Status no better than", options=RAG_LEVELS),
+                'recommend': st.column_config.SelectboxColumn("Recommend", options=CATEGORIES['RAG_Recommendation']),
+            },
+        )
+        # Rows left entirely blank are ignored; half-filled ones are reported by score_rag
+        config['rules'] = [
+            {key: value for key, value in rule.items() if isinstance(value, str) and value}
+            for rule in rules_df.to_dict('records')
+            if any(isinstance(rule.get(key), str) and rule[key].strip() for key in ('name', 'when'))
+        ]
+        
+        try:
+            result = score_rag(df, config, st.session_state.dataset.version_hash)
+        except (QueryError, ValueError) as e:
+            st.error(f"❌ {e}")
+        else:
+            changes = result.changes()
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            computed = pd.Series(result.status)
+            with col1:
+                st.metric("🟢 Green", int((computed == 'Green').sum()))
+            with col2:
+                st.metric("🟡 Amber", int((computed == 'Amber').sum()))
+            with col3:
+                st.metric("🔴 Red", int((computed == 'Red').sum()))
+            
+            if len(changes) > 0:
+                st.markdown(f"**{len(changes)} of {len(df)} bodies would change:**")
+                preview = pd.DataFrame({
+                    'Name': df.loc[changes.index, 'Name'],
+                    'Current Status': df.loc[changes.index, 'RAG_Status'].astype(str),
+                    'New Status': changes['RAG_Status'],
+                    'Current Recommendation': df.loc[changes.index, 'RAG_Recommendation'].astype(str),
+                    'New Recommendation': changes['RAG_Recommendation'],
+                    'Score': changes['RAG_Score'].round(2),
+                })
+                st.dataframe(preview.head(500), hide_index=True, use_container_width=True)
+                
+                if st.button(f"✅ Apply to {len(changes)} Bodies", type="primary"):
+                    try:
+                        get_body_store().update_bodies(
+                            changes[['RAG_Status', 'RAG_Recommendation']].to_dict('index')
+                        )
+                    except MissingBodyError as error:
+                        reload_dataset()
+                        st.error(
+                            f"❌ {len(error.body_ids)} of these bodies have been deleted in another session, so nothing "
+                            "was changed. The register has been reloaded; apply the rules again to update the rest."
+                        )
+                    else:
+                        reload_dataset()
+                        st.session_state.example_mode = False
+                        st.rerun()
+            else:
+                st.success("✅ Every body's stored RAG status and recommendation already match these rules.")
+            
+            st.markdown("### Explanation")
+            explain_id = st.selectbox(
+                "Explain the result for", list(df.index),
+                format_func=lambda body_id: df.loc[body_id, 'Name'], key='rag_explain'
+            )
+            if explain_id is not None:
+                st.markdown("\n".join(f"- {line}" if not line.startswith("•") else f"    - {line[2:]}" for line in result.explain(explain_id)))
@@ -0,0 +1,240 @@
+"""Network View page: stakeholder-overlap network and centrality"""
+from datetime import datetime
+
+import networkx as nx
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from governance.centrality import CENTRALITY_MEASURES, DEFAULT_ERROR_BOUND, betweenness_samples, get_centrality
+from governance.communities import COMMUNITY_METHODS, community_summary, get_communities
+from governance.layout import LAYOUT_MODES, LayoutCache, positions_key
+from governance.overlap import overlap_edges
+from views.common import cached_figure, get_bodies_df, get_governance_costs
+
+COMMUNITY_COLOURS = px.colors.qualitative.Plotly + px.colors.qualitative.Alphabet
+
+
+
+def render():
+    st.title("🌐 Governance Network Visualisation")
+    
+    st.markdown("""
+    Network analysis reveals relationships, clustering, and information flow between governance bodies.
+    This approach is **well-suited to public sector** where multiple bodies interact through shared stakeholders and overlapping remits.
+    """)
+    
+    df = get_bodies_df()
+    
+    # Create network graph
+    st.subheader("📊 Governance Network Map")
+    
+    # Build network data
+    G = nx.Graph()
+    
+    # Add nodes
+    G.add_nodes_from(
+        (name, {'level': level, 'efficiency': efficiency, 'value': value, 'type': body_type, 'rag': rag})
+        for name, level, efficiency, value, body_type, rag in zip(
+            df['Name'], df['Level'], df['Efficiency_Score'], df['Value_Added'], df['Type'], df['RAG_Status']
+        )
+    )
+    
+    # Add edges based on stakeholder overlap (one sparse product over all pairs)
+    G.add_edges_from(overlap_edges(df['Name'], df['Primary_Stakeholders']))
+    
+    # Calculate layout (cached per graph structure, warm-started after edits)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        layout_choice = st.radio("Layout", list(LAYOUT_MODES.keys()), horizontal=True,
+                                 help="Fast mode suits registers with hundreds of bodies")
+    with col2:
+        colour_by = st.radio("Colour by", ["RAG status", "Community"], horizontal=True)
+    with col3:
+        method_choice = st.selectbox("Community detection", list(COMMUNITY_METHODS.keys()),
+                                     help="Groups of bodies sharing more stakeholders with each other than with the rest, weighted by overlap")
+    resolution = 1.0
+    if COMMUNITY_METHODS[method_choice] == 'louvain':
+        resolution = st.slider("Community resolution", 0.2, 3.0, 1.0, 0.1,
+                               help="Higher values find more, smaller communities")
+    
+    # Communities are cached per graph version (the dataset version the graph is built from)
+    communities = get_communities(G, COMMUNITY_METHODS[method_choice], resolution,
+                                  key=st.session_state.dataset.version_hash)
+    if 'layout_cache' not in st.session_state:
+        st.session_state.layout_cache = LayoutCache()
+    pos = st.session_state.layout_cache.get_layout(G, mode=LAYOUT_MODES[layout_choice])
+    
+    def build_network_map():
+        # Create edge trace
+        edge_x = []
+        edge_y = []
+        edge_weights = []
+    
+        for edge in G.edges(data=True):
+            x0, y0 = pos[edge[0]]
+            x1, y1 = pos[edge[1]]
+            edge_x.extend([x0, x1, None])
+            edge_y.extend([y0, y1, None])
+            edge_weights.append(edge[2].get('weight', 1))
+    
+        edge_trace = go.Scatter(
+            x=edge_x, y=edge_y,
+            line=dict(width=0.5, color='#888'),
+            hoverinfo='none',
+            mode='lines'
+        )
+    
+        # Create node trace with RAG colouring
+        node_x = []
+        node_y = []
+        node_text = []
+        node_size = []
+        node_color = []
+    
+        rag_color_map = {'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+    
+        for node in G.nodes():
+            x, y = pos[node]
+            node_x.append(x)
+            node_y.append(y)
+        
+            node_data = G.nodes[node]
+            community = communities.membership.get(node)
+            node_text.append(f"{node}<br>RAG: {node_data['rag']}<br>Efficiency: {node_data['efficiency']}/5<br>Value: {node_data['value']}/5<br>Community: {community}")
+            # Unrated bodies get the smallest node
+            node_size.append((1 if node_data['value'] is pd.NA else node_data['value']) * 10)
+            if colour_by == "Community":
+                node_color.append(COMMUNITY_COLOURS[(community - 1) % len(COMMUNITY_COLOURS)])
+            else:
+                node_color.append(rag_color_map.get(node_data['rag'], '#888'))
+    
+        node_trace = go.Scatter(
+            x=node_x, y=node_y,
+            mode='markers+text',
+            hoverinfo='text',
+            text=[G.nodes[node]['type'][:10] for node in G.nodes()],
+            textposition='top center',
+            hovertext=node_text,
+            marker=dict(
+                size=node_size,
+                color=node_color,
+                line=dict(width=2, color='white')
+            )
+        )
+    
+        # Create figure
+        fig = go.Figure(data=[edge_trace, node_trace],
+                        layout=go.Layout(
+                            title=f"Governance Network (connections = shared stakeholders, size = value, colour = {'community' if colour_by == 'Community' else 'RAG status'})",
+                            showlegend=False,
+                            hovermode='closest',
+                            margin=dict(b=0, l=0, r=0, t=40),
+                            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                            height=600
+                        ))
+        return fig
+    
+    # The figure cache is shared by every session, but warm-started positions are this session's own
+    map_filters = {'layout': layout_choice, 'colour': colour_by, 'method': method_choice, 'resolution': resolution,
+                   'positions': positions_key(pos)}
+    st.plotly_chart(cached_figure('network.network_map', build_network_map, filters=map_filters), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Network metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Network Density", f"{nx.density(G):.2f}")
+        st.caption("Proportion of possible connections that exist (0-1)")
+    
+    with col2:
+        st.metric("Average Connections", f"{sum(dict(G.degree()).values()) / len(G.nodes()):.1f}")
+        st.caption("Average number of stakeholder overlaps per body")
+    
+    with col3:
+        components = list(nx.connected_components(G))
+        st.metric("Connected Groups", len(components))
+        st.caption("Number of separate governance clusters")
+    
+    with col4:
+        st.metric("Communities", len(communities))
+        st.caption(f"Stakeholder communities (modularity {communities.modularity:.2f})")
+    
+    # Community summaries
+    st.subheader("🧩 Stakeholder Communities")
+    
+    summary = community_summary(df, communities.membership, get_governance_costs()['Annual_Cost'])
+    st.dataframe(
+        summary,
+        column_config={
+            'Mean_Efficiency': st.column_config.NumberColumn("Mean Efficiency", format="%.1f"),
+            'Mean_Value_Added': st.column_config.NumberColumn("Mean Value Added", format="%.1f"),
+            'Total_Cost': st.column_config.NumberColumn("Total Cost", format="£%.0f"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    st.markdown("""
+    **Interpretation:**
+    - Bodies in the same community share more stakeholders with each other than with the rest of the network
+    - Communities of several bodies are the natural candidates for consolidation
+    - Unlike connected groups, a stakeholder shared by almost every body does not merge everything into one community
+    """)
+    
+    # Centrality analysis
+    st.subheader("🎯 Centrality Analysis")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        measure = st.selectbox("Rank by", list(CENTRALITY_MEASURES.keys()), help="\n\n".join(
+            f"**{name}**: {description}" for name, description in CENTRALITY_MEASURES.items()
+        ))
+    with col2:
+        error_bound = st.select_slider("Betweenness error bound", [0.02, 0.05, 0.1, 0.2], value=DEFAULT_ERROR_BOUND,
+                                       help="Smaller bounds sample more bodies; large registers take longer")
+    
+    centrality_df = get_centrality(G, error_bound, key=st.session_state.dataset.version_hash)
+    samples = betweenness_samples(len(G), error_bound)
+    if samples < len(G):
+        st.caption(f"Betweenness estimated from {samples:,} of {len(G):,} bodies (within ±{error_bound} with 90% confidence)")
+    
+    def build_centrality_bar():
+        fig = px.bar(
+            centrality_df.sort_values(measure, ascending=False, kind='stable').head(5),
+            x=measure,
+            y='Body',
+            orientation='h',
+            title=f'Most Central Governance Bodies ({measure.lower()} centrality, by stakeholder overlap)',
+            labels={measure: 'Centrality Score', 'Body': 'Governance Body'}
+        )
+        return fig
+    
+    st.plotly_chart(cached_figure('network.centrality_bar', build_centrality_bar,
+                                  filters={'measure': measure, 'error_bound': error_bound}), use_container_width=True)
+    
+    with st.expander("📋 All Centrality Scores"):
+        st.dataframe(
+            centrality_df.sort_values(measure, ascending=False, kind='stable'),
+            column_config={name: st.column_config.NumberColumn(name, format="%.3f") for name in CENTRALITY_MEASURES},
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.download_button(
+            "📥 Download Centrality Scores (CSV)",
+            data=centrality_df.to_csv(index=False),
+            file_name=f"network_centrality_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
+    
+    st.markdown("""
+    **Interpretation:**
+    - **High centrality** bodies are critical coordination points
+    - **Degree**: these bodies have most stakeholder overlap with others
+    - **Betweenness**: information flows through these bodies between otherwise separate groups
+    - **Eigenvector / PageRank**: these bodies overlap heavily with other well-connected bodies
+    - Changes to high-centrality bodies have network-wide effects
+    """)
@@ -0,0 +1,179 @@
+"""Scenario Planner page: what-if merges and closures, without changing the register"""
+import multiprocessing
+import os
+
+import streamlit as st
+
+from governance.costs import format_pounds
+from governance.optimiser import COVERAGE_KINDS, EXACT, GREEDY, TIME_LIMITED, get_minimal_set
+from governance.scenarios import Scenario, ScenarioPool, candidate_scenarios, evaluate_scenarios, get_scenario_engine
+from views.common import get_bodies_df, get_duplicate_pairs
+
+MERGE_GROUPS = 3
+# Metric -> (label, format) for the side-by-side comparison
+COMPARISON = {
+    'Bodies': ("Bodies", '{:.0f}'),
+    'Avg_Efficiency': ("Average efficiency", '{:.2f}'),
+    'Avg_Value_Added': ("Average value added", '{:.2f}'),
+    'High_Duplication': ("High duplication risk bodies", '{:.0f}'),
+    'Network_Density': ("Network density", '{:.3f}'),
+    'Components': ("Network components", '{:.0f}'),
+    'Principles_Covered': ("Principles covered", '{:.0f}'),
+    'Annual_Cost': ("Annual governance cost", '£{:,.0f}'),
+}
+METHOD_LABELS = {EXACT: "Exact", TIME_LIMITED: "Best found", GREEDY: "Greedy"}
+
+
+@st.cache_resource
+def get_scenario_pool():
+    """Process-wide worker pool for scenario batches (None on a single CPU)"""
+    workers = min(4, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    # Spawned workers are safe alongside Streamlit's threads, unlike forked ones
+    return ScenarioPool(workers, multiprocessing.get_context('spawn'))
+
+
+def render():
+    st.title("🧪 Scenario Planner")
+    
+    st.markdown("""
+    Test merge and close decisions before making them. Scenarios are evaluated against the current register
+    without changing it; in each merge group the **first** body selected continues and takes on the others' stakeholders and principles.
+    """)
+    
+    df = get_bodies_df()
+    dataset = st.session_state.dataset
+    engine = get_scenario_engine(df, dataset.version_hash)
+    names = dict(zip(df.index, df['Name']))
+    
+    # Build a scenario
+    st.subheader("🛠️ Build a Scenario")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        merges = [
+            st.multiselect(f"Merge group {number}", list(df.index), format_func=names.get, key=f"scenario_merge_{number}")
+            for number in range(1, MERGE_GROUPS + 1)
+        ]
+    with col2:
+        closes = st.multiselect("Close", list(df.index), format_func=names.get, key="scenario_close")
+    
+    scenario = Scenario(merges=merges, closes=closes)
+    if not scenario.merges and not scenario.closes:
+        st.info("💡 Choose at least two bodies to merge, or a body to close")
+    else:
+        try:
+            result = engine.evaluate(scenario)
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+        else:
+            baseline = engine.baseline
+            st.markdown(f"**Scenario:** {result['Scenario']}")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Bodies", result['Bodies'], result['Bodies'] - baseline['Bodies'])
+            with col2:
+                st.metric("Annual Saving", format_pounds(result['Saving']))
+            with col3:
+                st.metric("Network Components", result['Components'], result['Components'] - baseline['Components'],
+                          delta_color="off")
+            with col4:
+                st.metric("Principles Covered", result['Principles_Covered'],
+                          result['Principles_Covered'] - baseline['Principles_Covered'])
+            
+            if result['Principles_Lost']:
+                st.warning(f"⚠️ No remaining body would cover: {result['Principles_Lost']}")
+            
+            st.table({
+                "Metric": [label for label, _ in COMPARISON.values()],
+                "Current": [fmt.format(baseline[key]) for key, (_, fmt) in COMPARISON.items()],
+                "Scenario": [fmt.format(result[key]) for key, (_, fmt) in COMPARISON.items()],
+            })
+    
+    st.markdown("---")
+    
+    # Minimal governance set
+    st.subheader("🎯 Minimal Governance Set")
+    st.markdown(
+        "The cheapest set of bodies that still covers everything the register covers today. "
+        "Bodies that are the only ones covering something are always kept."
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        kinds = st.multiselect("Coverage to keep", COVERAGE_KINDS, default=COVERAGE_KINDS, key="minimal_kinds",
+                               format_func=lambda kind: {'Principle': "Fairer Westminster principles",
+                                                         'Activity': "Value chain activities",
+                                                         'Stakeholder': "Primary stakeholder groups"}[kind])
+    with col2:
+        always_keep = st.multiselect("Always keep", list(df.index), format_func=names.get, key="minimal_keep")
+    
+    if not kinds:
+        st.info("💡 Choose at least one kind of coverage to keep")
+    else:
+        minimal = get_minimal_set(df, dataset.version_hash, always_keep, kinds)
+        removed = minimal.removed()
+        outcome = engine.evaluate(Scenario(closes=minimal.removed_ids))
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Bodies Kept", len(minimal.kept_ids), -len(minimal.removed_ids) or None)
+        with col2:
+            st.metric("Annual Saving", format_pounds(minimal.saving))
+        with col3:
+            st.metric("Network Components", outcome['Components'], outcome['Components'] - engine.baseline['Components'],
+                      delta_color="off")
+        with col4:
+            st.metric("Method", METHOD_LABELS[minimal.method],
+                      help="Best found is the solver's answer when it ran out of time before proving it optimal")
+        
+        if len(removed) == 0:
+            st.success("✅ Every body is needed to keep this coverage")
+        else:
+            st.markdown("**Bodies that could go, and the coverage each gave up:**")
+            st.dataframe(
+                removed.drop(columns=['Body']),
+                column_config={'Annual_Cost': st.column_config.NumberColumn("Annual Cost", format="£%.0f")},
+                hide_index=True,
+                use_container_width=True,
+            )
+    
+    st.markdown("---")
+    
+    # Rank candidate scenarios
+    st.subheader("📊 Compare Candidate Scenarios")
+    st.markdown(
+        "Candidates combine up to two operations suggested by the register: merging likely duplicates or bodies "
+        "recommended for merger, and closing bodies recommended for closure, rated Red or adding little value."
+    )
+    
+    if st.button("🔍 Evaluate Candidate Scenarios"):
+        candidates = candidate_scenarios(df, get_duplicate_pairs())
+        with st.spinner(f"Evaluating {len(candidates)} scenarios..."):
+            results = evaluate_scenarios(engine, candidates, get_scenario_pool())
+        st.session_state.scenario_results = (dataset.version_hash, results)
+    
+    stored = st.session_state.get('scenario_results')
+    if stored and stored[0] == dataset.version_hash:
+        results = stored[1]
+        if len(results) == 0:
+            st.info("No candidate scenarios - the register has no merge or close signals")
+        else:
+            rank_by = st.selectbox("Rank by", ["Saving", "Principles_Covered", "Avg_Value_Added", "Avg_Efficiency"],
+                                   format_func=lambda key: key.replace('_', ' '))
+            ranked = results.sort_values(list(dict.fromkeys([rank_by, 'Saving'])), ascending=False, kind='stable')
+            st.dataframe(
+                ranked,
+                column_config={
+                    'Annual_Cost': st.column_config.NumberColumn("Annual Cost", format="£%.0f"),
+                    'Saving': st.column_config.NumberColumn("Saving", format="£%.0f"),
+                    'Avg_Efficiency': st.column_config.NumberColumn("Avg Efficiency", format="%.2f"),
+                    'Avg_Value_Added': st.column_config.NumberColumn("Avg Value Added", format="%.2f"),
+                    'Network_Density': st.column_config.NumberColumn("Network Density", format="%.3f"),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+            st.caption(f"{len(results)} scenarios evaluated against the current register")
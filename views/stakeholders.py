@@ -0,0 +1,115 @@
+"""Stakeholder Analysis page: Schilling power-interest mapping"""
+import plotly.express as px
+import streamlit as st
+
+from views.common import cached_figure, get_bodies_df, get_derived_metrics, get_rag_color
+
+
+
+def render():
+    st.title("👥 Stakeholder Analysis (Schilling Framework)")
+    st.markdown("*Highly applicable to public sector - widely used in local government*")
+    
+    st.markdown("""
+    **Schilling's Stakeholder Analysis** maps stakeholder power and interest to inform governance engagement strategies.
+    
+    This framework is **particularly well-suited to public sector** contexts where multiple stakeholders (residents, partners, 
+    government, media) have different levels of power and interest in governance decisions.
+    
+    ### Four Engagement Strategies:
+    
+    - **High Power, High Interest**: Key players - engage closely and satisfy
+    - **High Power, Low Interest**: Keep satisfied - maintain their support
+    - **Low Power, High Interest**: Keep informed - leverage their enthusiasm
+    - **Low Power, Low Interest**: Monitor - minimal effort required
+    """)
+    
+    df = get_bodies_df()
+    
+    # Power-Interest Matrix
+    st.subheader("📊 Stakeholder Power-Interest Matrix")
+    
+    # Power and interest as numeric scales
+    derived = get_derived_metrics()
+    power = derived['Power_Numeric']
+    interest = derived['Interest_Numeric']
+    
+    def build_power_interest_matrix():
+        fig = px.scatter(
+            df,
+            x=power,
+            y=interest,
+            # Unrated bodies get the smallest bubble
+            size=df['Value_Added'].fillna(1),
+            color='RAG_Status',
+            hover_name='Name',
+            hover_data=['Primary_Stakeholders', 'Secondary_Stakeholders', 'Fairer_Westminster_Alignment'],
+            labels={'Power_Numeric': 'Stakeholder Power', 'Interest_Numeric': 'Stakeholder Interest'},
+            title='Stakeholder Power-Interest Matrix by Governance Body',
+            color_discrete_map={'Green': '#90EE90', 'Amber': '#FFD700', 'Red': '#DC143C'}
+        )
+    
+        # Add quadrant lines
+        fig.add_hline(y=2.5, line_dash="dash", line_color="gray")
+        fig.add_vline(x=2, line_dash="dash", line_color="gray")
+    
+        # Add quadrant labels
+        fig.add_annotation(x=1.5, y=3.5, text="Keep Informed<br>(Low Power, High Interest)", showarrow=False, bgcolor="lightyellow", opacity=0.7)
+        fig.add_annotation(x=2.75, y=3.5, text="Key Players<br>(High Power, High Interest)", showarrow=False, bgcolor="lightgreen", opacity=0.7)
+        fig.add_annotation(x=1.5, y=1.5, text="Monitor<br>(Low Power, Low Interest)", showarrow=False, bgcolor="lightgray", opacity=0.7)
+        fig.add_annotation(x=2.75, y=1.5, text="Keep Satisfied<br>(High Power, Low Interest)", showarrow=False, bgcolor="lightcoral", opacity=0.7)
+    
+        fig.update_layout(height=600)
+        return fig
+    
+    st.plotly_chart(cached_figure('stakeholders.power_interest_matrix', build_power_interest_matrix), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Detailed stakeholder breakdown
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎯 Key Players (Manage Closely)")
+        key_players = df[(power >= 2) & (interest >= 3)]
+        if len(key_players) > 0:
+            for _, row in key_players.iterrows():
+                with st.expander(f"**{row['Name']}** {get_rag_color(row['RAG_Status'])}"):
+                    st.markdown(f"**Primary Stakeholders:** {row['Primary_Stakeholders']}")
+                    st.markdown(f"**Secondary Stakeholders:** {row['Secondary_Stakeholders']}")
+                    st.markdown(f"**Fairer Westminster:** {row['Fairer_Westminster_Alignment']}")
+                    st.markdown(f"**Strategy:** Engage closely, involve in decisions, satisfy needs")
+        else:
+            st.info("No bodies in this quadrant")
+    
+    with col2:
+        st.subheader("📢 Keep Informed")
+        keep_informed = df[(power < 2) & (interest >= 3)]
+        if len(keep_informed) > 0:
+            for _, row in keep_informed.iterrows():
+                with st.expander(f"**{row['Name']}** {get_rag_color(row['RAG_Status'])}"):
+                    st.markdown(f"**Primary Stakeholders:** {row['Primary_Stakeholders']}")
+                    st.markdown(f"**Fairer Westminster:** {row['Fairer_Westminster_Alignment']}")
+                    st.markdown(f"**Strategy:** Regular communication, leverage enthusiasm, but don't overload")
+        else:
+            st.info("No bodies in this quadrant")
+    
+    st.markdown("---")
+    
+    # Stakeholder engagement effort
+    st.subheader("📈 Stakeholder Engagement Effort Distribution")
+    
+    # Plotly's hierarchy aggregation needs plain labels rather than Categoricals
+    def build_engagement_sunburst():
+        fig = px.sunburst(
+            df,
+            path=[df['Level'].astype(str), 'Name'],
+            values='Value_Added',
+            color=df['Stakeholder_Interest'].astype(str),
+            title='Governance Structure by Level (sized by value, coloured by stakeholder interest)',
+            color_discrete_map={'Low': '#90EE90', 'Medium': '#FFD700', 'High': '#FF8C00', 'Very High': '#DC143C'}
+        )
+        fig.update_layout(height=500)
+        return fig
+    
+    st.plotly_chart(cached_figure('stakeholders.engagement_sunburst', build_engagement_sunburst), use_container_width=True)
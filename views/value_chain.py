@@ -0,0 +1,117 @@
+"""Value Chain Mapping page: Porter value chain adapted for public sector"""
+import plotly.express as px
+import streamlit as st
+
+from views.common import cached_figure, get_activity_table
+
+
+def render():
+    st.title("⛓️ Value Chain Mapping (Porter Framework)")
+    st.markdown("*Private sector framework adapted for public sector use*")
+    
+    st.warning("""
+    **⚠️ Public Sector Adaptation Note:**
+    
+    Porter's Value Chain was designed for profit-seeking firms to analyse competitive advantage. 
+    For Westminster City Council, we adapt it to analyse **service delivery effectiveness**:
+    
+    - **Not about:** Profit margins, competitive advantage, market share
+    - **Focus on:** Service outcomes, resident value, efficiency, statutory duties
+    - **"Primary Activities"** = Core governance functions (decision-making, monitoring, approvals)
+    - **"Support Activities"** = Enabling functions (admin, legal, data/analysis, communications)
+    
+    This helps identify governance that creates **public value** vs **overhead**.
+    """)
+    
+    # Value chain visualisation
+    st.subheader("📊 Governance Value Chain Activities")
+    
+    # One row per (body, activity), maintained as bodies are added, edited or deleted
+    df_activities = get_activity_table()
+    
+    # Activity frequency
+    def build_activity_frequency():
+        activity_counts = df_activities['Activity'].value_counts().reset_index()
+        activity_counts.columns = ['Activity', 'Count']
+    
+        fig = px.bar(
+            activity_counts.head(10),
+            x='Count',
+            y='Activity',
+            orientation='h',
+            title='Most Common Governance Activities Across Bodies',
+            labels={'Count': 'Number of Bodies', 'Activity': 'Value Chain Activity'}
+        )
+        fig.update_layout(height=400)
+        return fig
+    
+    st.plotly_chart(cached_figure('value_chain.activity_frequency', build_activity_frequency), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Activity efficiency analysis
+    st.subheader("⚡ Activity Efficiency Analysis")
+    
+    activity_efficiency = df_activities.groupby('Activity').agg({
+        'Efficiency': 'mean',
+        'Value': 'mean',
+        'Body': 'count'
+    }).reset_index()
+    activity_efficiency.columns = ['Activity', 'Avg_Efficiency', 'Avg_Value', 'Body_Count']
+    
+    def build_activity_efficiency():
+        fig = px.scatter(
+            activity_efficiency,
+            x='Avg_Efficiency',
+            y='Avg_Value',
+            size='Body_Count',
+            hover_name='Activity',
+            title='Activity Efficiency vs Value Created',
+            labels={'Avg_Efficiency': 'Average Efficiency', 'Avg_Value': 'Average Value Added'}
+        )
+        fig.add_hline(y=3.5, line_dash="dash", line_color="green", annotation_text="High value threshold")
+        fig.add_vline(x=3, line_dash="dash", line_color="green", annotation_text="High efficiency threshold")
+        fig.update_layout(height=500)
+        return fig
+    
+    st.plotly_chart(cached_figure('value_chain.activity_efficiency', build_activity_efficiency), use_container_width=True)
+    
+    # Insights
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🟢 High Value-Adding Activities")
+        high_value = activity_efficiency[activity_efficiency['Avg_Value'] >= 4].sort_values('Avg_Value', ascending=False)
+        if len(high_value) > 0:
+            for _, row in high_value.iterrows():
+                st.success(f"**{row['Activity']}** - {row['Body_Count']} bodies, {row['Avg_Value']:.1f} avg value")
+        else:
+            st.info("No activities scored >4 on average value")
+    
+    with col2:
+        st.markdown("### 🔴 Low Efficiency Activities")
+        low_eff = activity_efficiency[activity_efficiency['Avg_Efficiency'] < 3].sort_values('Avg_Efficiency')
+        if len(low_eff) > 0:
+            for _, row in low_eff.iterrows():
+                st.warning(f"**{row['Activity']}** - {row['Body_Count']} bodies, {row['Avg_Efficiency']:.1f} avg efficiency")
+            st.markdown("**💡 Recommendation:** Standardise and document these processes to improve efficiency")
+        else:
+            st.success("All activities have adequate efficiency")
+    
+    st.markdown("---")
+    
+    # Value chain by level
+    st.subheader("🏢 Value Chain Activities by Organisational Level")
+    
+    def build_activity_treemap():
+        fig = px.treemap(
+            df_activities,
+            path=[df_activities['Level'].astype(str), 'Body', 'Activity'],
+            title='Governance Activities Hierarchy',
+            color='Efficiency',
+            color_continuous_scale='RdYlGn'
+        )
+        fig.update_layout(height=600)
+        return fig
+    
+    st.plotly_chart(cached_figure('value_chain.activity_treemap', build_activity_treemap), use_container_width=True)